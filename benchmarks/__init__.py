@@ -0,0 +1,4 @@
+"""
+Benchmarks, run from the repo root: python -m benchmarks.<name>
+They run headless (SDL dummy drivers) unless the env says otherwise.
+"""
@@ -0,0 +1,118 @@
+import os
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma.audio import SoundManager, make_tone, CATEGORIES, SHOTS, EXPLOSIONS, MUSIC
+
+"""
+Sound cost of a bullet storm (many shots per frame, a few samples, explosions now and then, music looping): plain
+Sound.play (new shots are lost once every channel is busy), Channel stealing across every channel (find_channel force,
+the music can be cut) vs SoundManager (same sample once per frame, steals only inside its category).
+Frames run back to back, so voices never finish: the saturated case.
+python -m benchmarks.audio --shots 40 --frames 600
+"""
+
+SHOT_NAMES = ("shot_a", "shot_b", "shot_c")
+EXPLOSION_EVERY = 10  # frames
+EXPLOSIONS_PER_BURST = 3
+
+
+def storm(args, seed: int = 1):
+    """
+    Per frame list of (name, category, volume).
+    """
+    rng = random.Random(seed)
+    frames = []
+    for frame in range(args.frames):
+        sounds = [(rng.choice(SHOT_NAMES), SHOTS, rng.uniform(0.5, 1.0)) for _ in range(args.shots)]
+        if frame % EXPLOSION_EVERY == 0:
+            sounds += [("explosion", EXPLOSIONS, rng.uniform(0.2, 1.0)) for _ in range(EXPLOSIONS_PER_BURST)]
+        frames.append(sounds)
+    return frames
+
+
+def make_samples():
+    samples = {name: make_tone(440.0 + index * 110.0, 0.3) for index, name in enumerate(SHOT_NAMES)}
+    samples["explosion"] = make_tone(90.0, 0.8)
+    samples["music"] = make_tone(220.0, 2.0, 0.2)
+    return samples
+
+
+def run_plain(frames, samples, is_forced: bool):
+    """
+    Every sound goes to the mixer. Returns (s, mixer plays, sounds lost, music still playing).
+    """
+    pg.mixer.stop()
+    pg.mixer.set_reserved(0)
+    pg.mixer.set_num_channels(sum(count for count, _ in CATEGORIES.values()))
+    music = samples["music"]
+    music_channel = music.play(loops=-1)
+    plays = lost = 0
+    start = time.perf_counter()
+    for sounds in frames:
+        for name, _, volume in sounds:
+            if is_forced:
+                channel = pg.mixer.find_channel(True)
+                channel.play(samples[name])
+            else:
+                channel = samples[name].play()
+            if channel is None:
+                lost += 1
+                continue
+            channel.set_volume(volume)
+            plays += 1
+    seconds = time.perf_counter() - start
+    return seconds, plays, lost, music_channel.get_sound() is music
+
+
+def run_manager(frames, samples):
+    pg.mixer.stop()
+    audio = SoundManager()
+    for name, sound in samples.items():
+        audio.add(name, sound)
+    audio.play("music", MUSIC, loops=-1)
+    music_channel = audio.groups[MUSIC].voices[0].channel
+    start = time.perf_counter()
+    for sounds in frames:
+        for name, category, volume in sounds:
+            audio.play(name, category, volume)
+        audio.end_frame()
+    seconds = time.perf_counter() - start
+    return seconds, audio.stats(), music_channel.get_sound() is samples["music"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sound manager rate limiting + voice stealing benchmark.")
+    parser.add_argument("--shots", type=int, default=40, help="shots per frame")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    pg.mixer.init()
+    samples = make_samples()
+    frames = storm(args)
+    total = sum(len(sounds) for sounds in frames)
+    print(f"{total} sounds over {args.frames} frames ({args.shots} shots / frame), mixer {pg.mixer.get_init()}")
+
+    for label, is_forced in (("Sound.play", False), ("steal any", True)):
+        seconds, plays, lost, is_music_on = run_plain(frames, samples, is_forced)
+        print(
+            f"  {label:<13} {seconds / args.frames * 1000.0:6.3f} ms / frame | mixer plays {plays} | "
+            f"lost {lost} | music {'on' if is_music_on else 'CUT'}"
+        )
+
+    seconds, stats, is_music_on = run_manager(frames, samples)
+    plays = sum(group["played"] for group in stats.values())
+    print(
+        f"  {'SoundManager':<13} {seconds / args.frames * 1000.0:6.3f} ms / frame | mixer plays {plays} | "
+        f"limited {sum(group['limited'] for group in stats.values())} | "
+        f"stolen {sum(group['stolen'] for group in stats.values())} | music {'on' if is_music_on else 'CUT'}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import os
+import time
+import argparse
+
+# headless by default, set SDL_VIDEODRIVER to bench a real window / gpu renderer
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma.backends import SurfaceBackend, TextureBackend
+from sky_dogma.constants import FPS
+from sky_dogma.farm import random_bot
+from sky_dogma.game import Game
+from sky_dogma.scenes import Test, TitleScreen
+
+"""
+Surface vs Texture render backend, uncapped, step + present per frame.
+python -m benchmarks.backends --frames 2000
+python -m benchmarks.backends --hardware  (texture backend on the gpu renderer, needs a real video driver)
+"""
+
+
+def bench(backend, scene, frames: int):
+    """
+    Step + present given scene uncapped with the random bot. Returns frames/s.
+    """
+    held_keys = [[getattr(pg, name) for name in names] for names in random_bot(0, frames)]
+    delta = 1.0 / FPS
+    game = Game(first_scene=scene, backend=backend)
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        game.step(delta, game.scripted_events(held_keys[frame]))
+        game.present()
+    return frames / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Surface vs Texture render backend benchmark.")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--hardware", action="store_true")
+    args = parser.parse_args()
+
+    pg.display.init()
+    for scene in (Test, TitleScreen):
+        for backend in (SurfaceBackend(), TextureBackend(software=not args.hardware)):
+            fps = bench(backend, scene, args.frames)
+            uploads = f" | texture uploads {backend.upload_count}" if isinstance(backend, TextureBackend) else ""
+            print(f"{scene.__name__:<12} {backend.name:<8} {fps:9.1f} frames/s{uploads}")
+            backend.close()
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
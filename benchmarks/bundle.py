@@ -0,0 +1,73 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.bundle import DERIVED, LABEL_PREFIX, STATIC_LABELS, open_bundle
+from sky_dogma.constants import PNG_DIR
+
+"""
+Cold start asset cost, bundle (mmap + frombuffer) vs decoding pngs / deriving / rendering labels.
+Every mode runs in a fresh process (nothing warm), asks for every asset once and compares that to opening the window.
+python -m benchmarks.bundle --repeat 5
+"""
+
+
+##########
+# WORKER #
+##########
+def measure(mode: str):
+    """
+    Window open time, then the time to get every asset, in ms.
+    """
+    autoload.is_bundle_enabled = mode == "bundle"
+
+    start = time.perf_counter()
+    autoload.get_display_surface()
+    window = time.perf_counter() - start
+
+    keys = [os.path.splitext(filename)[0] for filename in sorted(os.listdir(PNG_DIR))]
+    keys += list(DERIVED) + [LABEL_PREFIX + text for text in STATIC_LABELS]
+    start = time.perf_counter()
+    for key in keys:
+        autoload.SURFACES_DICT[key]
+    assets = time.perf_counter() - start
+    return {"mode": mode, "window_ms": window * 1000.0, "assets_ms": assets * 1000.0, "assets": len(keys)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Asset bundle cold start benchmark.")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh processes per mode")
+    parser.add_argument("--worker", choices=("bundle", "decode"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.worker)))
+        return
+
+    # build (or refresh) once here, so no run times the build
+    open_bundle()
+    pg.quit()
+
+    for mode in ("decode", "bundle"):
+        results = []
+        for _ in range(args.repeat):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bundle", "--worker", mode],
+                capture_output=True, text=True, check=True
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+        window = min(result["window_ms"] for result in results)
+        assets = min(result["assets_ms"] for result in results)
+        print(f"{mode:<7} {results[0]['assets']} assets {assets:7.2f} ms | window {window:7.2f} ms (best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import os
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload, collision
+from sky_dogma.nodes import Sprite
+
+"""
+Player (16x16 banking frames) vs a field of bullets.
+naive = pg.mask.from_surface of both frames per check (no rect test), cached = collision.collide_many.
+python -m benchmarks.collision --bullets 2000 --frames 120
+"""
+
+
+def make_bullet_sheet():
+    """
+    2 frame, 6x6 round bullet sheet.
+    """
+    sheet = pg.Surface((12, 6), pg.SRCALPHA)
+    for frame in range(2):
+        pg.draw.circle(sheet, (255, 255, 255), (frame * 6 + 3, 3), 3 - frame)
+    return sheet
+
+
+def naive_hits(player, bullets):
+    hits = []
+    player_mask = pg.mask.from_surface(player.image.subsurface(player.frame_data[player.frame]))
+    for bullet in bullets:
+        bullet_mask = pg.mask.from_surface(bullet.image.subsurface(bullet.frame_data[bullet.frame]))
+        if player_mask.overlap(bullet_mask, (bullet.rect.x - player.rect.x, bullet.rect.y - player.rect.y)) is not None:
+            hits.append(bullet)
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collision narrow phase benchmark.")
+    parser.add_argument("--bullets", type=int, default=2000)
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    player = Sprite(autoload.SURFACES_DICT["player"], 11, 1)
+    player.rect.topleft = (152, 82)
+    sheet = make_bullet_sheet()
+    bullets = []
+    for _ in range(args.bullets):
+        bullet = Sprite(sheet, 2, 1)
+        bullet.frame = rng.randrange(2)
+        bullets.append(bullet)
+
+    # same bullet positions for both, bullets swarm around the player
+    positions = [
+        [(rng.randint(120, 200), rng.randint(50, 130)) for _ in bullets]
+        for _ in range(args.frames)
+    ]
+
+    results = {}
+    for name in ("naive", "cached"):
+        collision.stats.reset()
+        hit_count = 0
+        start = time.perf_counter()
+        for frame, frame_positions in enumerate(positions):
+            player.frame = frame % 11
+            for bullet, position in zip(bullets, frame_positions):
+                bullet.rect.topleft = position
+            if name == "naive":
+                hit_count += len(naive_hits(player, bullets))
+            else:
+                hit_count += len(collision.collide_many(player, bullets))
+        seconds = time.perf_counter() - start
+        results[name] = hit_count
+        checks = args.bullets * args.frames
+        print(f"{name:<7} {seconds / checks * 1e6:7.3f} us/check | {seconds / args.frames * 1000.0:7.3f} ms/frame | hits {hit_count}")
+    print(f"cached  {collision.stats.as_dict()}")
+    assert results["naive"] == results["cached"], "naive and cached disagree"
+
+
+if __name__ == "__main__":
+    main()
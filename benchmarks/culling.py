@@ -0,0 +1,87 @@
+import os
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.constants import NATIVE_RESOLUTION
+from sky_dogma.misc import Camera, cull_stats
+from sky_dogma.backends import SurfaceBackend
+from sky_dogma.nodes import Sprite
+from sky_dogma.layers import RenderLayers, Z_SHIPS
+
+"""
+Draw time of many sprites spread over a tall stretch of a stage (most of them above or below the screen, waiting to
+scroll in): blitting every one (no culling, the canvas clips) vs Sprite.draw culling itself vs a y sorted render layer
+culling by y first (only the nodes near the view are called).
+python -m benchmarks.culling --count 5000 --screens 10
+"""
+
+
+def measure(draw, frames: int):
+    start = time.perf_counter()
+    for frame in range(frames):
+        autoload.Cam.global_position.y = -frame  # the camera scrolls up, like the stage
+        draw()
+        cull_stats.end_frame()
+    return (time.perf_counter() - start) / frames * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Camera space visibility culling benchmark.")
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--screens", type=int, default=10, help="screen heights the sprites are spread over")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    autoload.get_display_surface()
+    autoload.NATIVE_SURFACE = pg.Surface(NATIVE_RESOLUTION)
+    autoload.Backend = SurfaceBackend()
+    autoload.Cam = Camera()
+    width, height = NATIVE_RESOLUTION
+    surface = pg.Surface((16, 16))
+
+    rng = random.Random(1)
+    sprites = []
+    for _ in range(args.count):
+        sprite = Sprite(surface, 1, 1)
+        sprite.rect.topleft = (rng.randrange(-16, width), rng.randrange(-height * (args.screens - 1), height))
+        sprites.append(sprite)
+
+    # no culling: what Sprite.draw did before, every sprite goes to the backend
+    def draw_all():
+        camera = autoload.Cam.global_position
+        for sprite in sprites:
+            frame_rect = pg.Rect(sprite.frame_data[sprite.frame])
+            on_camera_rect = pg.Rect(sprite.rect.x - camera.x, sprite.rect.y - camera.y, sprite.rect.width, sprite.rect.height)
+            autoload.Backend.blit(sprite.image, on_camera_rect, frame_rect)
+
+    def draw_sprites():
+        for sprite in sprites:
+            sprite.draw()
+
+    layers = RenderLayers()
+    layers.add_layer(Z_SHIPS, is_y_sorted=True)
+    layers.add(*sprites, z=Z_SHIPS)
+
+    all_ms = measure(draw_all, args.frames)
+    sprite_ms = measure(draw_sprites, args.frames)
+    sprite_stats = cull_stats.as_dict()
+    layer_ms = measure(layers.draw, args.frames)
+    layer_stats = cull_stats.as_dict()
+
+    print(f"{args.count} sprites over {args.screens} screens, {args.frames} frames")
+    print(f"  no culling     {all_ms:7.3f} ms / frame")
+    print(f"  sprite culling {sprite_ms:7.3f} ms / frame | last frame drawn {sprite_stats['drawn']} culled {sprite_stats['culled']}")
+    print(
+        f"  layer culling  {layer_ms:7.3f} ms / frame | last frame drawn {layer_stats['drawn']} "
+        f"culled {layer_stats['culled']} + {layers.stats()['culled']} by y"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import os
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # https://numpy.org/
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma.constants import NATIVE_RESOLUTION
+from sky_dogma.env import Environment, VectorEnvironment, ACTION_COUNT
+
+"""
+Agent environment throughput: steps/s of 1 instance (frameskip 1 and 4) and of a vector of instances in 1 process,
+plus what reading the pixels costs: zero copy view vs tobytes copy vs get_at per pixel.
+python -m benchmarks.env --steps 2000 --count 8
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Agent environment benchmark.")
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--count", type=int, default=8, help="instances in the vector environment")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    actions = [rng.randrange(ACTION_COUNT) for _ in range(args.steps)]
+
+    environment = Environment()
+    for frameskip in (1, 4):
+        environment.reset()
+        start = time.perf_counter()
+        checksum = 0
+        for action in actions:
+            observation, state = environment.step(action, frameskip)
+            checksum += int(observation[90, 160, 0])
+        seconds = time.perf_counter() - start
+        print(
+            f"1 env  frameskip {frameskip} | {args.steps / seconds:8.0f} steps/s | "
+            f"{args.steps * frameskip / seconds:8.0f} frames/s (checksum {checksum})"
+        )
+
+    vector = VectorEnvironment(args.count)
+    vector.reset()
+    batch_actions = np.array([[rng.randrange(ACTION_COUNT) for _ in range(args.count)] for _ in range(args.steps // args.count)])
+    start = time.perf_counter()
+    for actions_row in batch_actions:
+        observations, states = vector.step(actions_row)
+    seconds = time.perf_counter() - start
+    steps = len(batch_actions) * args.count
+    print(f"{args.count} envs vector          | {steps / seconds:8.0f} steps/s | observations {observations.shape} {observations.dtype}")
+
+    # reading pixels
+    surface = environment.game.NATIVE_SURFACE
+    repeat = 1000
+    start = time.perf_counter()
+    for _ in range(repeat):
+        total = int(environment.observation[::16, ::16].sum())
+    view = (time.perf_counter() - start) / repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        pixels = np.frombuffer(pg.image.tobytes(surface, "RGB"), np.uint8).reshape(NATIVE_RESOLUTION[1], NATIVE_RESOLUTION[0], 3)
+        total = int(pixels[::16, ::16].sum())
+    copied = (time.perf_counter() - start) / repeat
+    start = time.perf_counter()
+    for y in range(NATIVE_RESOLUTION[1]):
+        for x in range(NATIVE_RESOLUTION[0]):
+            surface.get_at((x, y))
+    get_at = time.perf_counter() - start
+    print(f"pixels view {view * 1e6:8.1f} us | tobytes copy {copied * 1e6:8.1f} us | get_at {get_at * 1e6:8.1f} us (sum {total})")
+
+
+if __name__ == "__main__":
+    main()
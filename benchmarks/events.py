@@ -0,0 +1,53 @@
+import time
+import argparse
+from dataclasses import dataclass
+
+from sky_dogma.events import Event, EventBus
+
+"""
+Event bus cost per frame with thousands of hit events, half of them duplicates.
+python -m benchmarks.events --events 5000
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class BenchHit(Event):
+    other: int = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event bus post + dispatch benchmark.")
+    parser.add_argument("--events", type=int, default=5000, help="events posted per frame")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--sources", type=int, default=100)
+    args = parser.parse_args()
+
+    bus = EventBus()
+    sources = [object() for _ in range(args.sources)]
+    calls = [0]
+
+    def on_hit(event):
+        calls[0] += 1
+
+    # 1 catch all listener + 1 listener per source
+    bus.subscribe(BenchHit, on_hit)
+    for source in sources:
+        bus.subscribe(BenchHit, on_hit, source=source)
+
+    # every event is posted twice, the 2nd one is coalesced
+    events = [BenchHit(sources[index % args.sources], index) for index in range(args.events // 2)] * 2
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for event in events:
+            bus.post(event)
+        bus.dispatch()
+    seconds = time.perf_counter() - start
+
+    per_frame = seconds / args.frames
+    print(f"{len(events)} events/frame | {per_frame * 1000.0:.3f} ms/frame | {per_frame / len(events) * 1e9:.0f} ns/event")
+    print(bus.stats())
+
+
+if __name__ == "__main__":
+    main()
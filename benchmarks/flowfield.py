@@ -0,0 +1,88 @@
+import os
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # https://numpy.org/
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma.constants import BACKGROUND_WIDTH, NATIVE_RESOLUTION
+from sky_dogma.flowfield import FlowField
+
+"""
+Flow field cost: recompute from scratch vs warm (target moved 1 cell), and steering N homing enemies with 1 sampled
+lookup vs per enemy vector math toward the player (the Vector2 way, ignores obstacles).
+python -m benchmarks.flowfield --enemies 100 1000 10000
+"""
+
+
+class Target:
+    """
+    Stands in for the player.
+    """
+    def __init__(self):
+        self.rect = pg.FRect(0, 0, 8, 8)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flow field benchmark.")
+    parser.add_argument("--enemies", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--obstacles", type=int, default=30, help="blocked cells")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    target = Target()
+    field = FlowField()
+    field.set_target(target)
+    for _ in range(args.obstacles):
+        field.set_blocked(rng.randrange(field.cols), rng.randrange(field.rows))
+
+    # recompute, walk the target around 1 cell at a time
+    cells = [(col, row) for row in range(1, field.rows - 1) for col in (range(1, field.cols - 1) if row % 2 else range(field.cols - 2, 0, -1))]
+    cells = [cell for cell in cells if not field.blocked[cell[1], cell[0]]]
+    start = time.perf_counter()
+    for col, row in cells:
+        field.is_blocked_dirty = True  # forces from scratch
+        field.compute((col, row))
+    full = (time.perf_counter() - start) / len(cells)
+    iterations = field.iteration_count
+    start = time.perf_counter()
+    for col, row in cells:
+        field.compute((col, row))
+    warm = (time.perf_counter() - start) / len(cells)
+    print(
+        f"recompute {field.cols}x{field.rows} cells | full {full * 1000.0:6.3f} ms | warm {warm * 1000.0:6.3f} ms | "
+        f"passes full {iterations / len(cells):.1f} warm {(field.iteration_count - iterations) / len(cells):.1f}"
+    )
+
+    # sampling
+    target.rect.center = (BACKGROUND_WIDTH / 2, NATIVE_RESOLUTION[1] / 2)
+    field.update(0)
+    for count in args.enemies:
+        xs = np.array([rng.uniform(0, BACKGROUND_WIDTH) for _ in range(count)], dtype=np.float32)
+        ys = np.array([rng.uniform(0, NATIVE_RESOLUTION[1]) for _ in range(count)], dtype=np.float32)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            dx, dy = field.sample(xs, ys)
+            xs += dx
+            ys += dy
+        sampled = (time.perf_counter() - start) / args.repeat
+
+        positions = [pg.Vector2(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+        goal = pg.Vector2(target.rect.center)
+        repeat = max(1, args.repeat * 100 // count)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for position in positions:
+                heading = goal - position
+                if heading.length_squared() > 1e-6:
+                    position += heading.normalize()
+        vector = (time.perf_counter() - start) / repeat
+        print(f"steer {count:6d} enemies | field {sampled * 1000.0:7.3f} ms/tick | per enemy vectors {vector * 1000.0:7.3f} ms/tick")
+
+
+if __name__ == "__main__":
+    main()
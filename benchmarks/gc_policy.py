@@ -0,0 +1,75 @@
+import os
+import sys
+import argparse
+import subprocess
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.gc_policy import GCPolicy, MODES
+from sky_dogma.game import Game
+from sky_dogma.pacing import FramePacer
+from sky_dogma.scenes import Test
+
+"""
+Real time Test scene plus a synthetic load of cyclic garbage per frame (what many short lived entities leave behind),
+once per gc mode, each in its own process. Compare automatic collections (mid frame hitches) and missed deadlines.
+python -m benchmarks.gc_policy --frames 600 --garbage 300
+"""
+
+
+class Garbage:
+    """
+    Refers to itself, only the cyclic collector frees it.
+    """
+    def __init__(self):
+        self.me = self
+        self.parts = [object() for _ in range(4)]
+
+
+def measure(mode: str, frames: int, garbage: int):
+    autoload.get_display_surface()
+    autoload.GC_POLICY = GCPolicy(mode)
+    game = Game(first_scene=Test)
+    kept = []  # a slowly growing live set, so old generations have work too
+
+    step = game.step
+
+    def step_with_garbage(delta, events=()):
+        step(delta, events)
+        for _ in range(garbage):
+            Garbage()
+        kept.append([Garbage() for _ in range(garbage // 10)])
+
+    game.step = step_with_garbage
+    pacer = FramePacer()
+    game.run(frames, None, pacer)
+    print(autoload.GC_POLICY.report())
+    print(pacer.report())
+    autoload.GC_POLICY.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GC policy benchmark.")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--garbage", type=int, default=300, help="cyclic objects thrown away per frame")
+    parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        measure(args.worker, args.frames, args.garbage)
+        pg.quit()
+        return
+
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.gc_policy", "--worker", mode, "--frames", str(args.frames), "--garbage", str(args.garbage)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        print("\n".join(line for line in output.splitlines() if not line.startswith("pygame")))
+
+
+if __name__ == "__main__":
+    main()
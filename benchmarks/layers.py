@@ -0,0 +1,107 @@
+import os
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.misc import Node, Camera
+from sky_dogma.layers import RenderLayers, Z_SHADOWS, Z_SHIPS, Z_EXPLOSIONS, Z_BULLETS
+
+"""
+Ordering cost of many sprites when a few move every frame: sorting everything by (z, y) every frame vs RenderLayers
+(z buckets, y sorted ones only move the nodes whose y changed). Draws are no-ops, this times the ordering only.
+Both orders are checked equal.
+python -m benchmarks.layers --count 10000 --moving 0.05
+"""
+
+# z, y sorted, share of the sprites
+MIX = ((Z_SHADOWS, True, 0.3), (Z_SHIPS, True, 0.3), (Z_EXPLOSIONS, True, 0.1), (Z_BULLETS, False, 0.3))
+
+
+class Dot(Node):
+    """
+    Sprite stand in, drawing is free.
+    """
+    __slots__ = ("rect", "z", "added")
+
+    def __init__(self, y: int, z: int, added: int):
+        self.rect = pg.Rect(0, y, 8, 8)
+        self.z = z
+        self.added = added
+
+    def draw(self):
+        pass
+
+
+def spawn(count: int, rng):
+    dots = []
+    for z, _, share in MIX:
+        for _ in range(int(count * share)):
+            dots.append(Dot(rng.randrange(180), z, len(dots)))
+    return dots
+
+
+def move(dots, share: float, rng):
+    for dot in rng.sample(dots, int(len(dots) * share)):
+        dot.rect.y += rng.randint(-3, 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Z ordered render layers benchmark.")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--moving", type=float, default=0.05, help="share of the sprites moving every frame")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    autoload.Cam = Camera()  # every dot stays in the view, nothing is culled
+    y_sorted = {z: is_y_sorted for z, is_y_sorted, _ in MIX}
+
+    def sort_key(dot):
+        return (dot.z, dot.rect.y if y_sorted[dot.z] else 0, dot.added)
+
+    # sort everything every frame
+    rng = random.Random(1)
+    dots = spawn(args.count, rng)
+    full_time = 0.0
+    for _ in range(args.frames):
+        move(dots, args.moving, rng)
+        start = time.perf_counter()
+        ordered = sorted(dots, key=sort_key)
+        for dot in ordered:
+            dot.draw()
+        full_time += time.perf_counter() - start
+    full_order = [dot.added for dot in ordered]
+
+    # render layers, same sprites, same moves
+    rng = random.Random(1)
+    dots = spawn(args.count, rng)
+    layers = RenderLayers()
+    for z, is_y_sorted, _ in MIX:
+        layers.add_layer(z, is_y_sorted)
+    for dot in dots:
+        layers.add(dot, z=dot.z)
+    layer_time = 0.0
+    for _ in range(args.frames):
+        move(dots, args.moving, rng)
+        start = time.perf_counter()
+        layers.draw()
+        layer_time += time.perf_counter() - start
+    layer_order = [dot.added for dot in layers.sprites()]
+
+    stats = layers.stats()
+    print(
+        f"{args.count} sprites, {args.moving:.0%} moving | "
+        f"sort every frame {full_time / args.frames * 1000.0:7.3f} ms | "
+        f"render layers {layer_time / args.frames * 1000.0:7.3f} ms | "
+        f"moved last frame {stats['moved']} | full sorts {stats['full_sorts']} | "
+        f"order {'same' if full_order == layer_order else 'DIFFERENT'}"
+    )
+    print("  " + " | ".join(f"z {z}: {count}" for z, count in stats["layers"].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+import os
+import sys
+import json
+import resource
+import argparse
+import subprocess
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma.nodes import Animator, Sprite
+
+"""
+Memory per live entity (1 Sprite + 1 Animator playing a looping frame animation on it, like the exhaust flame).
+legacy = the dict based Sprite / Animator from before they became slot based (copied below), current = sky_dogma.nodes.
+Every (mode, count) runs in its own process so peak RSS is not shared.
+python -m benchmarks.memory --counts 10000 100000
+"""
+
+KEYFRAMES = [(0, 0), (2, 1), (4, 2), (6, 0)]
+
+
+##########
+# LEGACY #
+##########
+class LegacyAnimator:
+    """
+    Animator before slots: __dict__, 1 dict per animation, listeners dict.
+    """
+    def __init__(self):
+        self.animations = {}
+        self.current_animation = None
+        self.keyframe_index = 0
+        self.elapsed_frame = 0
+        self.listeners = {}
+        self.is_stopped = False
+
+    def add_animation(self, name, target, keyframes, property_name, is_looping=False, is_interpolate=False):
+        self.animations[name] = {
+            'target': target,
+            'keyframes': keyframes,
+            'property_name': property_name,
+            'is_looping': is_looping,
+            "is_interpolate": is_interpolate
+        }
+
+    def play(self, name):
+        self.is_stopped = False
+        if name in self.animations:
+            self.current_animation = name
+
+
+class LegacySprite(pg.sprite.Sprite):
+    """
+    Sprite before slots: pg.sprite.Sprite (__dict__ + groups dict), own frame_data dict.
+    """
+    def __init__(self, surface, h_frame, v_frame):
+        super().__init__()
+        self.image = surface
+        self.rect = surface.get_rect()
+        self.frame = 0
+        self.frame_data = {}
+        self._alpha = 255
+        self.frame_width = surface.get_width() // h_frame
+        self.frame_height = surface.get_height() // v_frame
+        for col in range(h_frame):
+            for row in range(v_frame):
+                self.frame_data[len(self.frame_data)] = (col * self.frame_width, row * self.frame_height, self.frame_width, self.frame_height)
+
+
+MODES = {
+    "legacy": (LegacySprite, LegacyAnimator),
+    "current": (Sprite, Animator),
+}
+
+
+##########
+# WORKER #
+##########
+def measure(mode: str, count: int):
+    """
+    Build count entities, return bytes per entity (tracemalloc) and the process peak RSS.
+    """
+    sprite_class, animator_class = MODES[mode]
+    sheet = pg.Surface((48, 16), pg.SRCALPHA)  # 3 frames, shared by all
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = []
+    for _ in range(count):
+        sprite = sprite_class(sheet, 3, 1)
+        animator = animator_class()
+        # new list per entity, like a scene writing the keyframes literal in each constructor
+        animator.add_animation("default", sprite, list(KEYFRAMES), "frame", is_looping=True)
+        animator.play("default")
+        entities.append((sprite, animator))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # entities list itself is not entity memory
+    per_entity = (after - before - sys.getsizeof(entities)) / count
+    # linux reports KiB
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return {"mode": mode, "count": count, "bytes_per_entity": per_entity, "peak_rss": peak_rss}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sprite + Animator memory benchmark.")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--worker", nargs=2, metavar=("MODE", "COUNT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.worker[0], int(args.worker[1]))))
+        return
+
+    for count in args.counts:
+        results = {}
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.memory", "--worker", mode, str(count)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            results[mode] = json.loads(output.strip().splitlines()[-1])
+            result = results[mode]
+            print(
+                f"{count:7d} {mode:<8} {result['bytes_per_entity']:8.0f} B/entity | "
+                f"peak rss {result['peak_rss'] / 2 ** 20:8.1f} MiB"
+            )
+        saved = 1.0 - results["current"]["bytes_per_entity"] / results["legacy"]["bytes_per_entity"]
+        print(f"        saved {saved * 100.0:.0f}% per entity")
+
+
+if __name__ == "__main__":
+    main()
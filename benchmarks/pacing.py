@@ -0,0 +1,34 @@
+import os
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma.constants import FPS
+from sky_dogma.game import Game
+from sky_dogma.pacing import FramePacer, SLEEP, HYBRID, BUSY
+from sky_dogma.scenes import Test
+
+"""
+Frame pacing strategies at 60 FPS, Test scene step as the frame work (no present).
+python -m benchmarks.pacing --frames 300
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame pacing strategies benchmark.")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    for strategy in (SLEEP, HYBRID, BUSY):
+        game = Game(first_scene=Test)
+        pacer = FramePacer(FPS, strategy)
+        for _ in range(args.frames):
+            game.step(pacer.tick())
+        print(pacer.report())
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
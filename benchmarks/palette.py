@@ -0,0 +1,72 @@
+import os
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.constants import NATIVE_RESOLUTION
+from sky_dogma.helpers import apply_flash_shader
+from sky_dogma.palette import INDEXED_NAMES, PALETTE_VARIANTS
+
+"""
+RGBA sheets vs 8 bit paletted ones: pixel memory with --variants recolored variants each, cost of making 1 variant
+(apply_flash_shader vs a palette swap) and blit cost onto the native canvas (1 frame of a sheet, whole sheet).
+python -m benchmarks.palette --variants 4 --blits 20000
+"""
+
+FRAMES = {"player": 11, "player_exhaust": 3, "field": 1}  # frames across each sheet
+
+
+def time_blits(canvas, surface, area, count: int):
+    start = time.perf_counter()
+    for _ in range(count):
+        canvas.blit(surface, (8, 8), area)
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paletted sheet benchmark.")
+    parser.add_argument("--variants", type=int, default=4, help="recolored variants per sheet")
+    parser.add_argument("--blits", type=int, default=20000)
+    args = parser.parse_args()
+
+    autoload.get_display_surface()
+    canvas = pg.Surface(NATIVE_RESOLUTION)
+    total_rgba = total_indexed = 0
+    for name in INDEXED_NAMES:
+        rgba = autoload.SOURCE_SURFACES[name]
+        sheet = autoload.get_indexed_sheet(name)
+        indexed = sheet.surface()
+        width, height = sheet.size
+        rgba_bytes = width * height * 4 * (1 + args.variants)
+        indexed_bytes = sheet.nbytes(1 + args.variants)
+        total_rgba += rgba_bytes
+        total_indexed += indexed_bytes
+
+        # making 1 variant
+        start = time.perf_counter()
+        apply_flash_shader(rgba, color=(255, 255, 255, 255))
+        shader = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(100):
+            sheet.surface("flash")
+        swap = (time.perf_counter() - start) / 100
+
+        frame = pg.Rect(0, 0, width // FRAMES[name], height)
+        count = args.blits if FRAMES[name] > 1 else args.blits // 20
+        rgba_frame = time_blits(canvas, rgba, frame, count)
+        indexed_frame = time_blits(canvas, indexed, frame, count)
+        print(
+            f"{name:<15} {width}x{height} {len(sheet.palette) - 1:3d} colors | "
+            f"memory rgba {rgba_bytes / 1024:7.1f} KiB indexed {indexed_bytes / 1024:6.1f} KiB | "
+            f"variant shader {shader * 1000.0:7.2f} ms swap {swap * 1000.0:6.3f} ms | "
+            f"blit rgba {rgba_frame * 1e6:6.2f} us indexed {indexed_frame * 1e6:6.2f} us"
+        )
+    print(f"total ({len(PALETTE_VARIANTS)} palettes available) rgba {total_rgba / 1024:.1f} KiB | indexed {total_indexed / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
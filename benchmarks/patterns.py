@@ -0,0 +1,118 @@
+import os
+import math
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # https://numpy.org/
+
+from sky_dogma.constants import FPS
+from sky_dogma.patterns import Pattern, CompiledPattern, BulletField, compile_pattern, SPIRAL, FAN
+
+"""
+Bullet pattern cost: compile (cold vs cached), spawn cost per bullet and update cost per bullet per tick,
+vs per bullet python objects with an update method (the Player.update way).
+python -m benchmarks.patterns --bullets 4000
+"""
+
+PATTERNS = (
+    Pattern(kind=SPIRAL, count=16, waves=10, wave_interval=4, spin=7.0, speed=70.0, curve=20.0, delay=10, lifetime=300),
+    Pattern(kind=FAN, count=9, spread=60.0, speed=110.0, acceleration=40.0, lifetime=240),
+)
+
+
+class NaiveBullet:
+    """
+    1 object per bullet, moved by its own update.
+    """
+    __slots__ = ("x", "y", "heading", "speed", "age", "pattern")
+
+    def __init__(self, pattern, x, y, heading):
+        self.pattern = pattern
+        self.x = x + math.cos(heading) * pattern.radius
+        self.y = y + math.sin(heading) * pattern.radius
+        self.heading = heading
+        self.speed = pattern.speed
+        self.age = 0
+
+    def update(self):
+        pattern = self.pattern
+        if self.age >= pattern.delay:
+            self.x += math.cos(self.heading) * self.speed / FPS
+            self.y += math.sin(self.heading) * self.speed / FPS
+            self.speed += pattern.acceleration / FPS
+            self.heading += math.radians(pattern.curve) / FPS
+        self.age += 1
+        return self.age < pattern.lifetime
+
+
+def naive_fire(bullets, pattern, x, y, aim):
+    # waves all at once, spawn cost is what is measured
+    for wave in range(pattern.waves):
+        for index in range(pattern.count):
+            if pattern.kind == FAN:
+                gaps = pattern.count if pattern.spread >= 360.0 else pattern.count - 1
+                angle = -pattern.spread / 2.0 + index * pattern.spread / max(1, gaps)
+            else:
+                angle = index * 360.0 / pattern.count
+            bullets.append(NaiveBullet(pattern, x, y, math.radians(aim + angle + wave * pattern.spin)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bullet pattern benchmark.")
+    parser.add_argument("--bullets", type=int, default=4000, help="about how many bullets to keep alive")
+    parser.add_argument("--ticks", type=int, default=120)
+    args = parser.parse_args()
+
+    # compile
+    start = time.perf_counter()
+    for pattern in PATTERNS:
+        CompiledPattern(pattern)
+    cold = (time.perf_counter() - start) / len(PATTERNS)
+    compile_pattern(PATTERNS[0])
+    start = time.perf_counter()
+    for _ in range(1000):
+        compile_pattern(PATTERNS[0])
+    cached = (time.perf_counter() - start) / 1000
+    print(f"compile  cold {cold * 1e6:8.1f} us | cached {cached * 1e6:6.2f} us")
+
+    volleys = []
+    while sum(compile_pattern(pattern).size for pattern in volleys) < args.bullets:
+        volleys.append(PATTERNS[len(volleys) % len(PATTERNS)])
+    total = sum(compile_pattern(pattern).size for pattern in volleys)
+
+    # spawn
+    field = BulletField(capacity=total)
+    start = time.perf_counter()
+    for index, pattern in enumerate(volleys):
+        field.fire(pattern, 160.0 + index % 7, 40.0, 90.0)
+    field_spawn = time.perf_counter() - start
+
+    bullets = []
+    start = time.perf_counter()
+    for index, pattern in enumerate(volleys):
+        naive_fire(bullets, pattern, 160.0 + index % 7, 40.0, 90.0)
+    naive_spawn = time.perf_counter() - start
+    print(f"spawn    field {field_spawn / total * 1e6:6.3f} us/bullet | naive {naive_spawn / total * 1e6:6.3f} us/bullet ({total} bullets)")
+
+    # update
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        field.update()
+    field_update = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        bullets = [bullet for bullet in bullets if bullet.update()]
+    naive_update = time.perf_counter() - start
+    print(
+        f"update   field {field_update / args.ticks * 1000.0:6.3f} ms/tick | naive {naive_update / args.ticks * 1000.0:6.3f} ms/tick "
+        f"({field_update / args.ticks / total * 1e9:.0f} vs {naive_update / args.ticks / total * 1e9:.0f} ns/bullet)"
+    )
+    xs, _ = field.positions()
+    print(f"alive    field {len(xs)} | naive {len(bullets)} | max |x| {np.abs(xs).max():.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import os
+import time
+import argparse
+
+# headless by default, set SDL_VIDEODRIVER to bench a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.constants import FPS, NATIVE_RESOLUTION
+from sky_dogma.farm import random_bot
+from sky_dogma.game import Game
+from sky_dogma.presenter import Presenter, DROP_OLDEST, BLOCK
+from sky_dogma.scenes import Test
+
+"""
+Serial vs pipelined presentation, uncapped, Test scene driven by the random bot.
+python -m benchmarks.pipeline --frames 2000
+"""
+
+DISPLAY_SIZES = ((1280, 720), (1920, 1080))
+
+
+def bench(display_size, frames: int, drop_policy=None):
+    """
+    Run the Test scene uncapped. drop_policy None = serial present. Returns (frames/s, presenter stats or None).
+    """
+    autoload.DISPLAY_SURFACE = pg.display.set_mode(display_size)
+    held_keys = [[getattr(pg, name) for name in names] for names in random_bot(0, frames)]
+    delta = 1.0 / FPS
+
+    game = Game(first_scene=Test)
+    presenter = None
+    if drop_policy:
+        presenter = Presenter(autoload.DISPLAY_SURFACE, drop_policy)
+        game.NATIVE_SURFACE = presenter.acquire()
+        presenter.start()
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        game.step(delta, game.scripted_events(held_keys[frame]))
+        if presenter:
+            game.present_pipelined(presenter)
+        else:
+            # serial, same as Game.present but for this display size
+            scaled_native_surface = pg.transform.scale(game.NATIVE_SURFACE, display_size)
+            autoload.DISPLAY_SURFACE.blit(scaled_native_surface, (0, 0))
+            pg.display.flip()
+    if presenter:
+        presenter.stop()
+    seconds = time.perf_counter() - start
+
+    return frames / seconds, presenter.stats() if presenter else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial vs pipelined presentation benchmark.")
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    pg.display.init()
+    # warm up the assets so the first run does not pay for decoding
+    Game(first_scene=Test)
+
+    print(f"native {NATIVE_RESOLUTION[0]}x{NATIVE_RESOLUTION[1]}, {args.frames} frames, {os.cpu_count()} cpu")
+    for display_size in DISPLAY_SIZES:
+        for label, drop_policy in (("serial", None), ("pipelined block", BLOCK), ("pipelined drop", DROP_OLDEST)):
+            fps, stats = bench(display_size, args.frames, drop_policy)
+            line = f"{display_size[0]:5d}x{display_size[1]:<5d} {label:<16} {fps:9.1f} sim frames/s"
+            if stats:
+                line += f" | presented {stats['presented']:6d} dropped {stats['dropped']:6d} wait {stats['wait_ms']:8.1f} ms"
+            print(line)
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import os
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.game import Game
+from sky_dogma.pacing import FramePacer
+from sky_dogma.quality import QualityGovernor
+from sky_dogma.scenes import Test
+
+"""
+Real time Test scene with a heavy moment in the middle (a synthetic particle system spinning for --heavy ms per frame),
+without and with the quality governor. The particle system registers its budget as a knob, like a real one would.
+Compare missed deadlines and read the tier change log.
+python -m benchmarks.quality --frames 900 --heavy 18
+"""
+
+PARTICLE_TIERS = (1.0, 0.6, 0.3, 0.1)  # share of the particle budget, high -> minimal
+
+
+class Particles:
+    """
+    Costs heavy_ms * budget share per frame while heavy.
+    """
+    def __init__(self, heavy_ms: float):
+        self.heavy = heavy_ms / 1000.0
+        self.share = 1.0
+        self.is_heavy = False
+        if autoload.GOVERNOR is not None:
+            autoload.GOVERNOR.register("particles", PARTICLE_TIERS, self.set_share)
+
+    def set_share(self, share: float):
+        self.share = share
+
+    def update(self):
+        if not self.is_heavy:
+            return
+        end = time.perf_counter() + self.heavy * self.share
+        while time.perf_counter() < end:
+            pass
+
+
+def measure(frames: int, heavy_ms: float, is_governed: bool):
+    autoload.GOVERNOR = QualityGovernor() if is_governed else None
+    game = Game(first_scene=Test)
+    particles = Particles(heavy_ms)
+
+    step = game.step
+
+    def step_with_particles(delta, events=()):
+        step(delta, events)
+        # heavy from 1/4 to 3/4 of the run
+        particles.is_heavy = frames // 4 <= game.frame_count < frames * 3 // 4
+        particles.update()
+
+    game.step = step_with_particles
+    pacer = FramePacer()
+    game.run(frames, None, pacer)
+    print(f"governor {'on' if is_governed else 'off'}")
+    print(pacer.report())
+    if is_governed:
+        print(autoload.GOVERNOR.report())
+    autoload.GOVERNOR = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quality governor benchmark.")
+    parser.add_argument("--frames", type=int, default=900)
+    parser.add_argument("--heavy", type=float, default=18.0, help="ms of particle work per frame at full quality")
+    args = parser.parse_args()
+
+    autoload.get_display_surface()
+    for is_governed in (False, True):
+        measure(args.frames, args.heavy, is_governed)
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import os
+import math
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.constants import FPS
+from sky_dogma.misc import Camera, Group
+from sky_dogma.scheduler import UpdateScheduler, EVERY_TICK, EVERY_2ND, EVERY_4TH
+
+"""
+Frame time of many entities spread over a world 8 screens wide: every entity updated every tick (Group) vs the tiered
+scheduler (on screen every tick, off screen every 4th, ambient every 2nd, replanning within a budget).
+Replanning is the expensive optional work, asked for every REPLAN_EVERY updates.
+python -m benchmarks.scheduler --counts 500 2000 8000
+"""
+
+REPLAN_EVERY = 30
+REPLAN_COST = 300  # loop iterations, about what a small path search costs
+
+
+def replan(entity):
+    # stand in for a path search
+    total = 0.0
+    for index in range(REPLAN_COST):
+        total += math.sin(index + entity.rect.x)
+    entity.heading = total % 6.283
+
+
+class Entity:
+    """
+    Moves along a heading, replans now and then.
+    """
+    def __init__(self, x: float, y: float, scheduler):
+        self.rect = pg.FRect(x, y, 16, 16)
+        self.heading = random.random() * 6.283
+        self.updates = 0
+        self.scheduler = scheduler  # None = replan right away
+
+    def update(self, delta):
+        self.rect.x += math.cos(self.heading) * 20.0 * delta
+        self.rect.y += math.sin(self.heading) * 20.0 * delta
+        self.updates += 1
+        if self.updates % REPLAN_EVERY == 0:
+            if self.scheduler is None:
+                replan(self)
+            else:
+                self.scheduler.request(self, replan, self)
+
+
+def spawn(count: int, scheduler):
+    rng = random.Random(1)
+    return [Entity(rng.uniform(0, 320 * 8), rng.uniform(0, 180), scheduler) for _ in range(count)]
+
+
+def measure(layer, ticks: int):
+    times = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        layer.update(1 / FPS)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return sum(times) / ticks * 1000.0, times[int(ticks * 0.99) - 1] * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiered update scheduler benchmark.")
+    parser.add_argument("--counts", type=int, nargs="+", default=[500, 2000, 8000])
+    parser.add_argument("--ticks", type=int, default=240)
+    parser.add_argument("--budget", type=float, default=2.0, help="ms per frame for replanning")
+    args = parser.parse_args()
+
+    autoload.Cam = Camera()  # viewport at the world left edge
+
+    for count in args.counts:
+        group = Group()
+        group.add(*spawn(count, None))
+        group_mean, group_p99 = measure(group, args.ticks)
+
+        scheduler = UpdateScheduler(budget_ms=args.budget)
+        entities = spawn(count, scheduler)
+        ambient = count // 4  # never interesting enough for every tick
+        scheduler.add(*entities[:ambient], tier=EVERY_2ND)
+        scheduler.add(*entities[ambient:], tier=EVERY_TICK, lod=True)
+        scheduler.update_lod()
+        scheduler_mean, scheduler_p99 = measure(scheduler, args.ticks)
+        deferred = scheduler.stats()["requests_deferred"]
+        tiers = scheduler.stats()["tiers"]
+
+        print(
+            f"{count:6d} entities | group {group_mean:7.3f} ms mean {group_p99:7.3f} ms p99 | "
+            f"scheduler {scheduler_mean:6.3f} ms mean {scheduler_p99:6.3f} ms p99 | "
+            f"tiers 1:{tiers[EVERY_TICK]} 2:{tiers[EVERY_2ND]} 4:{tiers[EVERY_4TH]} | replans waiting {deferred}"
+        )
+
+
+if __name__ == "__main__":
+    main()
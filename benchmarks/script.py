@@ -0,0 +1,107 @@
+import os
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from sky_dogma.script import ScriptRunner
+
+"""
+Frame time of many enemy behaviour scripts that mostly wait (fire, wait 20 - 120 frames, again, now and then a long
+wait): a per frame countdown per enemy (polling, how Animator holds wait) vs coroutines parked in the timer wheel.
+Both fire at the same frames, the shot counts are checked equal.
+python -m benchmarks.script --counts 1000 10000 50000
+"""
+
+SHORT_WAIT = (20, 120)  # frames
+LONG_WAIT = (600, 6000)  # frames, 1 wait in LONG_EVERY
+LONG_EVERY = 8
+
+
+def waits(seed: int):
+    """
+    Endless wait lengths of 1 enemy.
+    """
+    rng = random.Random(seed)
+    while True:
+        if rng.randrange(LONG_EVERY) == 0:
+            yield rng.randint(*LONG_WAIT)
+        else:
+            yield rng.randint(*SHORT_WAIT)
+
+
+class PolledEnemy:
+    """
+    Counts its wait down every frame.
+    """
+    def __init__(self, seed: int):
+        self.waits = waits(seed)
+        self.countdown = next(self.waits)
+        self.shots = 0
+
+    def update(self):
+        self.countdown -= 1
+        if self.countdown == 0:
+            self.shots += 1
+            self.countdown = next(self.waits)
+
+
+class ScriptedEnemy:
+    """
+    Same behaviour as a script.
+    """
+    def __init__(self, seed: int):
+        self.shots = 0
+        self.seed = seed
+
+    def behaviour(self):
+        for frames in waits(self.seed):
+            yield frames - 1  # the script first runs 1 frame after it starts
+            self.shots += 1
+            yield 1
+
+
+def measure(update, ticks: int):
+    times = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        update()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return sum(times) / ticks * 1000.0, times[int(ticks * 0.99) - 1] * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Timer wheel script scheduler benchmark.")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--ticks", type=int, default=600)
+    args = parser.parse_args()
+
+    for count in args.counts:
+        enemies = [PolledEnemy(seed) for seed in range(count)]
+
+        def update_polled():
+            for enemy in enemies:
+                enemy.update()
+
+        polled_mean, polled_p99 = measure(update_polled, args.ticks)
+        polled_shots = sum(enemy.shots for enemy in enemies)
+
+        runner = ScriptRunner()
+        scripted = [ScriptedEnemy(seed) for seed in range(count)]
+        for enemy in scripted:
+            runner.start(enemy.behaviour())
+        runner.update()  # first run of every script (start tick), not a steady state frame
+        script_mean, script_p99 = measure(runner.update, args.ticks - 1)
+        script_shots = sum(enemy.shots for enemy in scripted)
+
+        print(
+            f"{count:6d} scripts | polled {polled_mean:7.3f} ms mean {polled_p99:7.3f} ms p99 | "
+            f"wheel {script_mean:6.3f} ms mean {script_p99:6.3f} ms p99 | "
+            f"shots {polled_shots} / {script_shots}{'' if polled_shots == script_shots else ' MISMATCH'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
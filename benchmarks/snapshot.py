@@ -0,0 +1,58 @@
+import os
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma.constants import FPS
+from sky_dogma.farm import random_bot
+from sky_dogma.game import Game
+from sky_dogma.scenes import Test
+from sky_dogma.snapshot import SnapshotRing
+
+"""
+Snapshot cost on the Test scene: capture every frame into the ring, restore, and restore vs rebuilding the scene.
+python -m benchmarks.snapshot --frames 1200
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="State snapshot benchmark.")
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--seconds", type=float, default=5.0, help="ring length")
+    args = parser.parse_args()
+
+    game = Game(first_scene=Test)
+    ring = SnapshotRing(game, args.seconds)
+    held_keys = [[getattr(pg, name) for name in names] for names in random_bot(0, args.frames)]
+
+    capture_seconds = 0.0
+    for keys in held_keys:
+        game.step(1.0 / FPS, game.scripted_events(keys))
+        start = time.perf_counter()
+        ring.capture()
+        capture_seconds += time.perf_counter() - start
+
+    oldest = ring.oldest()
+    start = time.perf_counter()
+    ring.restore(oldest, is_truncating=False)
+    restore_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    game.SceneManager.current_scene.retry()
+    retry_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    game.SceneManager.change_scene_to(Test())
+    rebuild_seconds = time.perf_counter() - start
+
+    print(f"slot {ring.slot_size} B x {ring.capacity} = {len(ring.buffer) / 1024:.0f} KiB ({args.seconds:.0f} s)")
+    print(f"capture {capture_seconds / args.frames * 1e6:7.1f} us/frame")
+    print(f"restore {restore_seconds * 1e6:7.1f} us (frame {oldest})")
+    print(f"retry   {retry_seconds * 1e6:7.1f} us | rebuilding Test {rebuild_seconds * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
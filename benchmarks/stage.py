@@ -0,0 +1,69 @@
+import os
+import time
+import random
+import resource
+import argparse
+import tempfile
+
+from sky_dogma.stage import build_stage, StageStream, KIND_NAMES
+
+"""
+Stage streaming: open time, per tick advance cost and window size for a very long generated stage.
+python -m benchmarks.stage --records 1000000
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stage streaming benchmark.")
+    parser.add_argument("--records", type=int, default=1000000)
+    parser.add_argument("--density", type=float, default=2.0, help="records per scroll px")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    length = int(args.records / args.density)
+    source = {"chunk_size": 64, "events": [
+        {
+            "scroll": rng.randrange(length), "kind": rng.choice(tuple(KIND_NAMES.values())),
+            "name": f"enemy_{rng.randrange(32)}", "x": rng.randrange(336), "y": -16, "arg": 0
+        }
+        for _ in range(args.records)
+    ]}
+
+    start = time.perf_counter()
+    data = build_stage(source)
+    build_seconds = time.perf_counter() - start
+    del source
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.stage")
+        with open(path, "wb") as file:
+            file.write(data)
+        del data
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        stage = StageStream(path)
+        open_seconds = time.perf_counter() - start
+
+        # scroll the whole stage 1 px per tick
+        due_count = 0
+        start = time.perf_counter()
+        for scroll in range(length + 1):
+            due_count += len(stage.advance(scroll))
+        stream_seconds = time.perf_counter() - start
+
+        # seek somewhere in the middle (restart from checkpoint)
+        start = time.perf_counter()
+        stage.seek(length // 2)
+        seek_seconds = time.perf_counter() - start
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        stage.close()
+
+    print(f"{args.records} records over {length} px, {args.records * 16 / 2 ** 20:.1f} MiB of records")
+    print(f"build {build_seconds * 1000.0:.0f} ms | open {open_seconds * 1000.0:.3f} ms | seek {seek_seconds * 1e6:.1f} us")
+    print(f"advance {stream_seconds / (length + 1) * 1e6:.2f} us/tick | {due_count} records due | max window {stage.max_window}")
+    print(f"peak rss growth while streaming {(rss_after - rss_before) / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import os
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.constants import NATIVE_RESOLUTION
+from sky_dogma.misc import Camera, Group, layer_stats
+from sky_dogma.backends import SurfaceBackend
+from sky_dogma.nodes import Sprite
+
+"""
+Static layer cache: the same members drawn by a plain Group and by Group(is_static=True), pixels compared (every case
+must be the same), then the draw time of a splash like layer (full screen background + labels, curtain at alpha 0).
+python -m benchmarks.static_layers --frames 2000
+"""
+
+
+def sprite(surface, x: int, y: int, alpha: int = 255):
+    node = Sprite(surface, 1, 1)
+    node.rect.topleft = (x, y)
+    node.alpha = alpha
+    return node
+
+
+def make_surfaces():
+    """
+    1 image of every kind members have: plain, per pixel alpha (partial too), colorkey.
+    """
+    plain = pg.Surface((40, 30))
+    plain.fill((200, 100, 50))
+    per_pixel = pg.Surface((40, 30), pg.SRCALPHA)
+    per_pixel.fill((30, 160, 220, 255))
+    per_pixel.fill((30, 160, 220, 96), (0, 0, 20, 30))
+    keyed = pg.Surface((40, 30))
+    keyed.fill((255, 0, 255))
+    keyed.fill((250, 250, 60), (10, 5, 20, 20))
+    keyed.set_colorkey((255, 0, 255))
+    return plain, per_pixel, keyed
+
+
+def splash_members():
+    """
+    Background + 2 labels + a curtain that is not showing, like the splash scenes while the labels hold.
+    """
+    background = pg.Surface(NATIVE_RESOLUTION)
+    background.fill((0, 0, 0))
+    curtain = pg.Surface(NATIVE_RESOLUTION)
+    curtain.fill((0, 0, 0))
+    made_by = autoload.get_label("made by clifford")
+    press_any = autoload.get_label("press any key to skip")
+    return [sprite(background, 0, 0), sprite(made_by, 130, 85), sprite(press_any, 200, 160), sprite(curtain, 0, 0, 0)]
+
+
+def cases():
+    plain, per_pixel, keyed = make_surfaces()
+    background = pg.Surface(NATIVE_RESOLUTION)
+    background.fill((255, 255, 255))
+    return {
+        "opaque": lambda: [sprite(plain, 10, 10), sprite(per_pixel, 30, 20), sprite(keyed, 50, 30)],
+        "translucent": lambda: [sprite(plain, 10, 10, 128), sprite(plain, 15, 10, 128)],
+        "translucent mid": lambda: [sprite(plain, 10, 10), sprite(per_pixel, 30, 20, 128), sprite(keyed, 35, 25)],
+        "alpha 0 + background": lambda: [sprite(background, 0, 0), sprite(plain, 10, 10, 0), sprite(keyed, 20, 20), sprite(per_pixel, 25, 15)],
+        "splash": splash_members,
+    }
+
+
+def render(members, is_static: bool, frames: int = 2):
+    """
+    Canvas bytes after drawing the layer over white (2 frames: the static one comes from its cache the 2nd time).
+    """
+    layer = Group(*members, is_static=is_static)
+    for _ in range(frames):
+        autoload.NATIVE_SURFACE.fill((255, 255, 255))
+        layer.draw()
+    return pg.image.tobytes(autoload.NATIVE_SURFACE, "RGB")
+
+
+def measure(layer, frames: int):
+    start = time.perf_counter()
+    for _ in range(frames):
+        layer.draw()
+        layer_stats.end_frame()
+    return (time.perf_counter() - start) / frames * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Static layer cache benchmark.")
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    autoload.get_display_surface()
+    autoload.NATIVE_SURFACE = pg.Surface(NATIVE_RESOLUTION)
+    autoload.Backend = SurfaceBackend()
+    autoload.Cam = Camera()
+
+    # same pixels
+    for name, make in cases().items():
+        is_same = render(make(), False) == render(make(), True)
+        print(f"pixels {name:<22} {'same' if is_same else 'DIFFERENT'}")
+
+    # splash like layer
+    group_ms = measure(Group(*splash_members()), args.frames)
+    static_ms = measure(Group(*splash_members(), is_static=True), args.frames)
+    print(f"splash layer | group {group_ms:6.4f} ms / frame | static {static_ms:6.4f} ms / frame | {layer_stats.total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import os
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.constants import NATIVE_RESOLUTION, ONE_TILE
+from sky_dogma.misc import Camera
+from sky_dogma.backends import SurfaceBackend
+from sky_dogma.tilemap import TileLayer, TileMap, TILEMAPS, get_tilemap
+
+"""
+Background draw time + memory: the old scroller (2 full field images blitted every frame, clipped by the canvas) vs
+tilemap layers (only the strips crossing the viewport), 1 layer and parallax stacks. Memory of a tall stage background
+made of the field tiles: as a map vs as 1 flat image.
+python -m benchmarks.tilemap --frames 2000 --stage-rows 400
+"""
+
+
+def measure(draw, frames: int):
+    start = time.perf_counter()
+    for scroll in range(frames):
+        draw(scroll)
+    return (time.perf_counter() - start) / frames * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tilemap background benchmark.")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--stage-rows", type=int, default=400, help="tile rows of the tall stage background")
+    args = parser.parse_args()
+
+    autoload.get_display_surface()
+    autoload.NATIVE_SURFACE = pg.Surface(NATIVE_RESOLUTION)
+    autoload.Backend = SurfaceBackend()
+    autoload.Cam = Camera()
+    field = autoload.SURFACES_DICT["field"]
+    height = field.get_height()
+
+    # old: 2 images, 1 screen apart, wrapped
+    def draw_images(scroll):
+        y = scroll % height
+        autoload.Backend.blit(field, pg.Rect(0, y - height, *field.get_size()), field.get_rect())
+        autoload.Backend.blit(field, pg.Rect(0, y, *field.get_size()), field.get_rect())
+
+    results = [("2 full images", measure(draw_images, args.frames))]
+    for factors in ((1.0,), (0.5, 1.0), (0.25, 0.5, 1.0)):
+        layers = [TileLayer("field", factor) for factor in factors]
+
+        def draw_layers(scroll):
+            for layer in layers:
+                layer.draw(scroll)
+
+        layers_ms = measure(draw_layers, args.frames)
+        rows = sum(layer.drawn_rows for layer in layers)
+        results.append((f"tilemap {len(factors)} layer{'s' if len(factors) > 1 else ''}", layers_ms, rows))
+
+    for result in results:
+        rows = f" | {result[2]} strips / frame" if len(result) > 2 else ""
+        print(f"{result[0]:<18} {result[1]:7.4f} ms / frame{rows}")
+
+    # tall background out of the field tiles (rows shuffled), map vs flat image
+    tilemap = get_tilemap("field")
+    rng = random.Random(1)
+    indices = []
+    for _ in range(args.stage_rows):
+        row = rng.randrange(tilemap.rows)
+        indices += tilemap.indices[row * tilemap.columns:(row + 1) * tilemap.columns]
+    stage = TileMap("stage", tilemap.tiles, tilemap.columns, indices)
+    TILEMAPS["stage"] = stage
+    flat = stage.width * args.stage_rows * ONE_TILE * 4
+    layer = TileLayer("stage")
+    stage_ms = measure(layer.draw, args.frames)
+    print(
+        f"stage {args.stage_rows} rows | map {stage.nbytes() / 1024:.0f} KiB (+ {len(stage.strips)} cached strips) "
+        f"vs flat image {flat / 1024:.0f} KiB | draw {stage_ms:.4f} ms / frame"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+import time
+
+"""
+Sky Dogma, top down shooter + reusable 2D framework.
+Importing this package (or any module in it) has no side effects: no window, no asset decode.
+Run the game with main() from sky_dogma.game (python test.py).
+"""
+
+STARTUP_START = time.perf_counter()  # cold start clock, the package is the 1st thing imported
@@ -0,0 +1,345 @@
+import pygame as pg  # https://pyga.me/docs/
+import struct
+
+from sky_dogma import autoload
+from sky_dogma.constants import BACKGROUND_WIDTH, NATIVE_RESOLUTION
+from sky_dogma.helpers import Sign, lerp
+from sky_dogma.misc import Node
+from sky_dogma.nodes import Animator, Sprite
+from sky_dogma.tilemap import TileLayer
+
+
+##########
+# ACTORS #
+##########
+class BackgroundScroller(Node):
+    """
+    Scrolls the tilemap background layers (back to front, see tilemap.py), 1 px per tick at parallax factor 1.
+    Stage tile records switch a layer map, the new one streams in from the top.
+    """
+    __slots__ = ("layers", "scroll")
+
+    layer_count = 99  # layers drawn (back ones first), quality governor knob
+    LAYER_COUNT_TIERS = (99, 99, 2, 1)  # high -> minimal
+
+    # snapshot: scroll (+ every layer maps)
+    STATE = struct.Struct("<I")
+
+    def __init__(self, layers=(("field", 1.0),)):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.scroll = 0  # px scrolled so far, the stage timeline position
+
+        ############
+        # CHILDREN #
+        ############
+        # (map name, parallax factor) each, back first
+        self.layers = [TileLayer(name, factor) for name, factor in layers]
+
+        if autoload.GOVERNOR is not None:
+            autoload.GOVERNOR.register("background_layers", self.LAYER_COUNT_TIERS, BackgroundScroller.set_layer_count)
+
+    ###########
+    # METHODS #
+    ###########
+    @staticmethod
+    def set_layer_count(layer_count: int):
+        BackgroundScroller.layer_count = layer_count
+
+    def draw(self):
+        """
+        This func is called by the Group class. 
+        Call sprite objects draw functions here.
+        """
+        for layer in self.layers[:self.layer_count]:
+            layer.draw(self.scroll)
+    
+    def update(self, delta):
+        """
+        This func is called by the Group class.
+        Scrolls the layers.
+        """
+        self.scroll += 1
+        for layer in self.layers:
+            layer.advance(self.scroll)
+
+    def switch(self, name: str, layer_index: int = 0, scroll=None):
+        """
+        Layer map becomes name, from scroll (default now) on. Smooth, rows already shown stay.
+        """
+        self.layers[layer_index].switch(name, self.scroll if scroll is None else scroll)
+
+    def save_state(self, buffer, offset: int):
+        """
+        Pack scroll and layer maps into buffer at offset, return the offset after it.
+        """
+        self.STATE.pack_into(buffer, offset, self.scroll)
+        offset += self.STATE.size
+        for layer in self.layers:
+            offset = layer.save_state(buffer, offset)
+        return offset
+
+    def load_state(self, buffer, offset: int):
+        (self.scroll,) = self.STATE.unpack_from(buffer, offset)
+        offset += self.STATE.size
+        for layer in self.layers:
+            offset = layer.load_state(buffer, offset)
+        return offset
+
+
+class PlayerShadow(Node):
+    """
+    This is always a child of someone. Frame is updated based on parent's. 
+    """
+    __slots__ = ("Sprite", "image", "rect", "local_position")
+
+    is_shown = True  # every shadow, quality governor knob
+    SHOWN_TIERS = (True, True, False, False)  # high -> minimal
+
+    def __init__(self):
+        ##############   
+        # PROPERTIES #
+        ##############
+
+        # player sheet turned black and scaled down by 50%, pre baked (see bundle.derive_player_shadow)
+        self.Sprite = Sprite(surface=autoload.SURFACES_DICT["player_shadow"], h_frame=11, v_frame=1)
+        self.image = self.Sprite.image
+        self.rect = self.Sprite.rect
+
+        self.local_position = pg.Vector2(0, 0)
+
+        if autoload.GOVERNOR is not None:
+            autoload.GOVERNOR.register("shadows", self.SHOWN_TIERS, PlayerShadow.set_shown)
+
+    ###########
+    # METHODS #
+    ###########
+    @staticmethod
+    def set_shown(is_shown: bool):
+        PlayerShadow.is_shown = is_shown
+
+    def draw(self):
+        """
+        This func is called by the parent.
+        """
+        if not PlayerShadow.is_shown:
+            return
+        self.Sprite.draw()
+    
+    def update(self, delta, parent_rect, parent_sprite_frame_index):
+        """
+        This func is called by the parent.
+        Updates position and my Sprite frame index.
+        """
+        self.rect.x = parent_rect.x + self.local_position.x
+        self.rect.y = parent_rect.y + self.local_position.y
+        self.Sprite.frame = parent_sprite_frame_index
+
+
+class PlayerExhaustFlame(Node):
+    """
+    This is always a child of someone. Autoplays its burning animation. 
+    (Maybe has other anim in future).
+    """
+    __slots__ = ("Sprite", "image", "rect", "local_position", "Animator")
+
+    def __init__(self):
+        ##############   
+        # PROPERTIES #
+        ##############
+        self.Sprite = Sprite(surface=autoload.SURFACES_DICT["player_exhaust"], h_frame=3, v_frame=1)
+        self.image = self.Sprite.image
+        self.rect = self.Sprite.rect
+
+        self.local_position = pg.Vector2(0, 0)
+
+        # animation
+        self.Animator = Animator()
+        self.Animator.add_animation(
+            name="default",
+            target=self.Sprite,
+             keyframes=[
+                 (0, 0),
+                 (2, 1),
+                 (4, 2),
+                 (6, 0),
+             ],
+            property_name="frame",
+             is_looping=True
+        )
+        self.Animator.play("default")
+
+    ###########
+    # METHODS #
+    ###########
+    def draw(self):
+        """
+        This func is called by the parent.
+        """
+        self.Sprite.draw()
+    
+    def update(self, delta, parent_rect):
+        """
+        This func is called by the parent.
+        Updates animation and position.
+        """
+        self.Animator.update()
+        self.rect.x = parent_rect.x + self.local_position.x
+        self.rect.y = parent_rect.y + self.local_position.y
+
+
+class Player(Node):
+    """
+    Listens to user input and updates it's position.
+    Has Sprite that is updated based on it's velocity.x
+    """
+    __slots__ = ("Sprite", "image", "rect", "ExhaustFlame", "Shadow", "children", "velocity", "remainder")
+
+    # movement
+    MAX_VELOCITY = 90.0  # px / s
+    MOVEMENT_WEIGHT = 0.1
+
+    # snapshot: velocity x, y, sub pixel remainder x, y (+ own sprite, flame sprite + animator, shadow sprite)
+    STATE = struct.Struct("<dddd")
+
+    def __init__(self):
+        ##############   
+        # PROPERTIES #
+        ##############
+        self.Sprite = Sprite(surface=autoload.SURFACES_DICT["player"], h_frame=11, v_frame=1)
+        self.image = self.Sprite.image
+        self.rect = self.Sprite.rect
+
+        # initial sprite frame (5 = no banking)
+        self.Sprite.frame = 5
+
+        ############
+        # CHILDREN #
+        ############
+        # exhaust flame
+        self.ExhaustFlame = PlayerExhaustFlame()
+        self.ExhaustFlame.local_position.y = 15.0
+        # shadow
+        self.Shadow = PlayerShadow()
+        self.Shadow.local_position.y = 24.0
+        self.Shadow.local_position.x = 24.0
+        # lists (drawing does not need any args)
+        self.children = [
+            self.ExhaustFlame,
+            self.Shadow
+        ]
+
+        # movement
+        self.velocity = pg.math.Vector2(0, 0)
+        self.remainder = pg.math.Vector2(0, 0)
+
+    ###########
+    # METHODS #
+    ###########
+    def draw(self):
+        """
+        This func is called by the Group class. 
+        Call sprite objects draw functions here.
+        """
+        self.Sprite.draw()
+
+        # draw children
+        for child in self.children:
+            child.draw()
+    
+    def save_state(self, buffer, offset: int):
+        """
+        Pack movement state, own and children sprites into buffer at offset, return the offset after it.
+        """
+        self.STATE.pack_into(buffer, offset, self.velocity.x, self.velocity.y, self.remainder.x, self.remainder.y)
+        offset = self.Sprite.save_state(buffer, offset + self.STATE.size)
+        offset = self.ExhaustFlame.Sprite.save_state(buffer, offset)
+        offset = self.ExhaustFlame.Animator.save_state(buffer, offset)
+        return self.Shadow.Sprite.save_state(buffer, offset)
+
+    def load_state(self, buffer, offset: int):
+        velocity_x, velocity_y, remainder_x, remainder_y = self.STATE.unpack_from(buffer, offset)
+        self.velocity.update(velocity_x, velocity_y)
+        self.remainder.update(remainder_x, remainder_y)
+        offset = self.Sprite.load_state(buffer, offset + self.STATE.size)
+        offset = self.ExhaustFlame.Sprite.load_state(buffer, offset)
+        offset = self.ExhaustFlame.Animator.load_state(buffer, offset)
+        return self.Shadow.Sprite.load_state(buffer, offset)
+
+    def update(self, delta):
+        """
+        This func is called by the Group class.
+        Updates anything here based on user input / other actor influences.
+        """
+        # direction
+        direction = pg.math.Vector2(
+            autoload.Input.is_action_pressed(pg.K_RIGHT) - autoload.Input.is_action_pressed(pg.K_LEFT), 
+            autoload.Input.is_action_pressed(pg.K_DOWN) - autoload.Input.is_action_pressed(pg.K_UP)
+        )
+        if direction.x or direction.y:
+            direction.normalize()
+
+        # update velocity with direction
+        self.velocity.y = lerp(self.velocity.y, self.MAX_VELOCITY * direction.y, self.MOVEMENT_WEIGHT)
+        self.velocity.x = lerp(self.velocity.x, self.MAX_VELOCITY * direction.x, self.MOVEMENT_WEIGHT)
+        if self.velocity.x or self.velocity.y:
+            self.velocity.normalize()
+
+        # update frame index with velocity (100% to 5%, then shift by 5 frames)
+        self.Sprite.frame = int((self.velocity.x / self.MAX_VELOCITY * 100.0) / 17.0) + 5
+        
+        # update position with velocity
+        # https://www.reddit.com/r/pygame/comments/q8whz6/why_is_my_movement_faster_in_some_directions_then/
+        self.move_x(self.velocity.x * delta)
+        self.move_y(self.velocity.y * delta)
+
+        # update children (position, animation, etc)
+        self.ExhaustFlame.update(delta, self.rect)
+        self.Shadow.update(delta, self.rect, self.Sprite.frame)
+        
+    
+    ##########
+    # HELPER #
+    ##########
+    # https://maddythorson.medium.com/celeste-and-towerfall-physics-d24bd2ae0fc5
+    def move_x(self, amount: float):
+        """
+        Position updates with int, so collect the lost decimals and adds it to distance to be covered.
+        """
+        self.remainder.x += amount
+        move = round(self.remainder.x)
+
+        if move == 0:
+            return
+        
+        self.remainder.x -= move
+        sign = Sign(move)
+
+        while move != 0:
+            # check collision here, break if collided
+            self.rect.x += sign
+            # clamp x, keep player within background
+            self.rect.x = max(0, min(self.rect.x, BACKGROUND_WIDTH - 16))
+            move -= sign
+
+    # https://maddythorson.medium.com/celeste-and-towerfall-physics-d24bd2ae0fc5
+    def move_y(self, amount: float):
+        """
+        Position updates with int, so collect the lost decimals and adds it to distance to be covered.
+        """
+        self.remainder.y += amount
+        move = round(self.remainder.y)
+
+        if move == 0:
+            return
+        
+        self.remainder.y -= move
+        sign = Sign(move)
+
+        while move != 0:
+            # check collision here, break if collided
+            self.rect.y += sign
+            # clamp y, keep player within background
+            self.rect.y = max(0, min(self.rect.y, NATIVE_RESOLUTION[1] - 16))
+            move -= sign
@@ -0,0 +1,223 @@
+import pygame as pg  # https://pyga.me/docs/
+import os
+import math
+from array import array
+
+from sky_dogma.constants import ROOT_DIR
+
+"""
+Sound manager. Samples are decoded once into a pool (never a Sound per shot), every category owns a fixed group of
+reserved mixer channels. A saturated category steals 1 of its own voices (oldest or quietest), so a burst of shots
+can never cut the music. The same sample played twice in 1 frame only sounds once (louder of the 2).
+Works on the SDL dummy audio driver (headless, farm).
+"""
+
+SFX_DIR = os.path.join(ROOT_DIR, "assets/sfx")
+EXTENSIONS = (".ogg", ".wav")
+
+# steal policies
+OLDEST = "oldest"
+QUIETEST = "quietest"
+
+# categories
+SHOTS = "shots"
+EXPLOSIONS = "explosions"
+UI = "ui"
+MUSIC = "music"
+
+# key = category | val = (channel count, steal policy)
+CATEGORIES = {
+    SHOTS: (8, OLDEST),
+    EXPLOSIONS: (6, QUIETEST),
+    UI: (2, OLDEST),
+    MUSIC: (1, OLDEST),
+}
+
+
+# key = mixer format (pg.mixer.get_init, negative = signed, -32 = float) | val = (array typecode, full scale, silence)
+SAMPLE_FORMATS = {
+    8: ("B", 127, 128),
+    -8: ("b", 127, 0),
+    16: ("H", 32767, 32768),
+    -16: ("h", 32767, 0),
+    32: ("f", 1.0, 0.0),
+    -32: ("f", 1.0, 0.0),
+}
+
+
+def make_tone(frequency: float, seconds: float, volume: float = 0.5):
+    """
+    Square wave Sound in the mixer format. Placeholder sample for sounds that have no file yet (and for benchmarks).
+    """
+    rate, size, channels = pg.mixer.get_init()
+    if size not in SAMPLE_FORMATS:
+        raise ValueError(f"mixer sample format {size} is not supported")
+    typecode, full_scale, silence = SAMPLE_FORMATS[size]
+    amplitude = volume * full_scale
+    if typecode != "f":
+        amplitude = int(amplitude)
+    high = [silence + amplitude] * channels
+    low = [silence - amplitude] * channels
+    period = rate / frequency
+    frames = array(typecode)
+    for frame in range(int(rate * seconds)):
+        frames.extend(high if math.fmod(frame, period) < period / 2 else low)
+    return pg.mixer.Sound(buffer=frames.tobytes())
+
+
+class Voice:
+    """
+    1 reserved mixer channel and what it was last asked to play.
+    """
+    __slots__ = ("channel", "sample_name", "volume", "started")
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.sample_name = None
+        self.volume = 0.0
+        self.started = -1  # play order, lower = older
+
+
+class ChannelGroup:
+    """
+    The voices of 1 category + its counters.
+    """
+    __slots__ = ("name", "voices", "steal_policy", "played_count", "stolen_count", "limited_count")
+
+    def __init__(self, name: str, voices: list, steal_policy: str):
+        self.name = name
+        self.voices = voices
+        self.steal_policy = steal_policy
+        self.played_count = 0
+        self.stolen_count = 0  # played over a voice that was still sounding
+        self.limited_count = 0  # same sample again in the same frame, not played
+
+    def pick_voice(self):
+        """
+        A free voice, else the one the policy gives up.
+        """
+        for voice in self.voices:
+            if not voice.channel.get_busy():
+                return voice, False
+        if self.steal_policy == QUIETEST:
+            return min(self.voices, key=lambda voice: (voice.volume, voice.started)), True
+        return min(self.voices, key=lambda voice: voice.started), True
+
+
+class SoundManager:
+    """
+    Needs the mixer started (autoload.get_audio does that). Takes every mixer channel and reserves them,
+    so nothing else (Sound.play) can grab one.
+    """
+    def __init__(self, categories: dict = CATEGORIES):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.samples = {}  # key = sample name | val = Sound, the pool
+
+        channel_count = sum(count for count, _ in categories.values())
+        pg.mixer.set_num_channels(channel_count)
+        pg.mixer.set_reserved(channel_count)
+        self.groups = {}  # key = category | val = ChannelGroup
+        channel_id = 0
+        for category, (count, steal_policy) in categories.items():
+            voices = [Voice(pg.mixer.Channel(channel_id + index)) for index in range(count)]
+            self.groups[category] = ChannelGroup(category, voices, steal_policy)
+            channel_id += count
+
+        self.play_order = 0
+        self.played_this_frame = {}  # key = (category, sample name) | val = Voice, cleared by end_frame
+
+    ###########
+    # METHODS #
+    ###########
+    def add(self, name: str, sound):
+        """
+        Put an already made Sound in the pool (generated, or loaded elsewhere).
+        """
+        self.samples[name] = sound
+
+    def load(self, name: str):
+        """
+        Decode assets/sfx/<name>.ogg (or .wav) into the pool, once.
+        """
+        if name not in self.samples:
+            for extension in EXTENSIONS:
+                path = os.path.join(SFX_DIR, name + extension)
+                if os.path.exists(path):
+                    self.samples[name] = pg.mixer.Sound(path)
+                    break
+            else:
+                raise FileNotFoundError(f"no sample named {name} in {SFX_DIR}")
+        return self.samples[name]
+
+    def preload(self, *names: str):
+        """
+        Decode these now (scene load), so the first play of each does not stall a frame.
+        """
+        for name in names:
+            self.load(name)
+
+    def play(self, name: str, category: str = SHOTS, volume: float = 1.0, loops: int = 0):
+        """
+        Play a pooled sample on a voice of category. Returns the Channel, or None when rate limited.
+        """
+        group = self.groups[category]
+
+        # rate limit, identical sound this frame = keep 1, at the louder volume
+        key = (category, name)
+        voice = self.played_this_frame.get(key)
+        if voice is not None and voice.sample_name == name:
+            group.limited_count += 1
+            if volume > voice.volume:
+                voice.volume = volume
+                voice.channel.set_volume(volume)
+            return None
+
+        sound = self.samples.get(name) or self.load(name)
+        voice, is_stolen = group.pick_voice()
+        if is_stolen:
+            group.stolen_count += 1
+        voice.channel.play(sound, loops)
+        voice.channel.set_volume(volume)
+        voice.sample_name = name
+        voice.volume = volume
+        voice.started = self.play_order
+        self.play_order += 1
+        group.played_count += 1
+        self.played_this_frame[key] = voice
+        return voice.channel
+
+    def end_frame(self):
+        """
+        Called once per frame (Game.step), the rate limit window is 1 frame.
+        """
+        if self.played_this_frame:
+            self.played_this_frame.clear()
+
+    def stop(self, category: str = None):
+        """
+        Stop every voice of category (all categories if None).
+        """
+        groups = self.groups.values() if category is None else (self.groups[category],)
+        for group in groups:
+            for voice in group.voices:
+                voice.channel.stop()
+                voice.volume = 0.0
+
+    ###########
+    # GETTERS #
+    ###########
+    def stats(self):
+        """
+        Per category counters so far: played, stolen, limited, voices sounding now.
+        """
+        return {
+            category: {
+                "played": group.played_count,
+                "stolen": group.stolen_count,
+                "limited": group.limited_count,
+                "busy": sum(voice.channel.get_busy() for voice in group.voices),
+            }
+            for category, group in self.groups.items()
+        }
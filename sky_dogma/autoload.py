@@ -0,0 +1,244 @@
+import pygame as pg  # https://pyga.me/docs/
+import os
+import time
+from contextlib import contextmanager
+
+from sky_dogma.constants import DISPLAY_SIZE, PNG_DIR, TTF_DIR_TO_FILE, FONT_SIZE
+from sky_dogma.bundle import DERIVED, LABEL_PREFIX, render_label, open_bundle
+from sky_dogma.audio import SoundManager
+from sky_dogma.palette import INDEXED_NAMES, VARIANT_SEPARATOR, index_surface
+
+"""
+Global things everyone can reach, like Godot autoloads.
+Nothing here starts on import, each pygame subsystem starts the first time it is needed.
+Backend, Cam, EventBus, Input, SceneManager, PauseMenu and NATIVE_SURFACE belong to the active Game (Game.activate sets them).
+"""
+
+
+###########
+# STARTUP #
+###########
+startup_phases = []  # list of (depth, phase name, seconds), in the order they started
+startup_depth = 0
+
+
+@contextmanager
+def timed_phase(name: str):
+    """
+    Time a cold start phase. Phases can nest (first scene -> png decode), the report indents them.
+    """
+    global startup_depth
+    index = len(startup_phases)
+    startup_phases.append((startup_depth, name, 0.0))  # reserve the slot so parents print above children
+    startup_depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        startup_depth -= 1
+        startup_phases[index] = (startup_depth, name, time.perf_counter() - start)
+
+
+def startup_report():
+    """
+    Cold start time broken down by phase. Only top level phases count into the total.
+    """
+    lines = ["STARTUP"]
+    total = 0.0
+    for depth, name, seconds in startup_phases:
+        lines.append(f"{'  ' * (depth + 1)}{name:<{32 - depth * 2}} {seconds * 1000.0:8.2f} ms")
+        if depth == 0:
+            total += seconds
+    lines.append(f"  {'total':<32} {total * 1000.0:8.2f} ms")
+    return "\n".join(lines)
+
+
+#########
+# DEBUG #
+#########
+is_debug = False
+is_debug_in_game = False  # in game has bg wider than native width
+is_debug_allowed = True  # False = debug keys do nothing (quality governor knob)
+
+
+###########
+# PG INIT #
+###########
+DISPLAY_SURFACE = None  # window, opened by get_display_surface
+
+
+def get_display_surface():
+    """
+    Open the window on first call.
+    """
+    global DISPLAY_SURFACE
+    if DISPLAY_SURFACE is None:
+        with timed_phase("display"):
+            pg.display.init()
+            DISPLAY_SURFACE = pg.display.set_mode(DISPLAY_SIZE)
+    return DISPLAY_SURFACE
+
+
+def init_mixer():
+    """
+    Start the mixer on first call.
+    """
+    if not pg.mixer.get_init():
+        with timed_phase("mixer"):
+            pg.mixer.init()
+
+
+#########
+# AUDIO #
+#########
+# the mixer is 1 per process, so is the sound manager (not per Game)
+AUDIO = None
+
+
+def get_audio():
+    """
+    Start the mixer and the sound manager on first call. See audio.py.
+    """
+    global AUDIO
+    if AUDIO is None:
+        init_mixer()
+        AUDIO = SoundManager()
+    return AUDIO
+
+
+######
+# GC #
+######
+GC_POLICY = None  # gc_policy.GCPolicy, per process, set by main (None = python defaults)
+
+
+###########
+# QUALITY #
+###########
+GOVERNOR = None  # quality.QualityGovernor, per process, set by main (None = always full quality)
+
+
+##########
+# CANVAS #
+##########
+# BLIT HERE, THEN BLIT THIS TO DISPLAY_SURFACE
+# each Game owns one, this points to the active Game canvas
+NATIVE_SURFACE = None
+
+
+#############
+# AUTOLOADS #
+#############
+# set by Game.activate
+Backend = None  # render backend, see backends.py
+Cam = None
+EventBus = None  # see events.py
+Input = None
+SceneManager = None
+PauseMenu = None
+
+
+##########
+# BUNDLE #
+##########
+is_bundle_enabled = True  # False = decode pngs / render labels like before the bundle (benchmarks, --no-bundle)
+BUNDLE = None  # pre decoded assets, opened by get_bundle
+
+
+def get_bundle():
+    """
+    Map the asset bundle on first call (rebuilding it when a source changed). None when disabled.
+    """
+    global BUNDLE
+    if BUNDLE is None and is_bundle_enabled:
+        with timed_phase("bundle"):
+            BUNDLE = open_bundle()
+    return BUNDLE
+
+
+################
+# PNG -> SURFS #
+################
+class SourceSurfaces(dict):
+    """
+    key = filename (without extension), derived name (see bundle.DERIVED) or "label:<text>" | val = RGBA surface.
+    Made the first time its key is asked for: mapped from the bundle, else decoded / derived / rendered.
+    """
+    def __missing__(self, key):
+        bundle = get_bundle()
+        surface = bundle.get(key) if bundle is not None else None
+        if surface is None:
+            if key.startswith(LABEL_PREFIX):
+                surface = render_label(get_font(), key[len(LABEL_PREFIX):])
+            elif key in DERIVED:
+                surface = DERIVED[key](self)
+            else:
+                with timed_phase(f"png {key}"):
+                    surface = pg.image.load(os.path.join(PNG_DIR, key + ".png"))
+        self[key] = surface
+        return surface
+
+
+class SurfacesDict(dict):
+    """
+    What the game draws. Same keys as SourceSurfaces + "name@variant" = a palette variant of name (see palette.py).
+    Indexed mode: INDEXED_NAMES are 8 bit paletted sheets, everything else is the source surface.
+    Surfaces are shared, whoever draws them modified (not just alpha) copies first.
+    """
+    def __missing__(self, key):
+        name, _, variant = key.partition(VARIANT_SEPARATOR)
+        if key.startswith(LABEL_PREFIX) or not (variant or is_indexed_enabled and name in INDEXED_NAMES):
+            surface = SOURCE_SURFACES[key]
+        else:
+            surface = get_indexed_sheet(name).surface(variant)
+        self[key] = surface
+        return surface
+
+
+SOURCE_SURFACES = SourceSurfaces()  # derived sheets are made from these, never from paletted ones
+SURFACES_DICT = SurfacesDict()
+
+
+###########
+# INDEXED #
+###########
+is_indexed_enabled = False  # True = INDEXED_NAMES are drawn from 8 bit paletted sheets (--indexed)
+INDEXED_SHEETS = {}  # key = name | val = palette.IndexedSheet, variants share its indices
+
+
+def get_indexed_sheet(name: str):
+    """
+    Paletted version of a source sheet, made on first call.
+    """
+    sheet = INDEXED_SHEETS.get(name)
+    if sheet is None:
+        with timed_phase(f"index {name}"):
+            sheet = index_surface(SOURCE_SURFACES[name])
+        INDEXED_SHEETS[name] = sheet
+    return sheet
+
+
+########
+# FONT #
+########
+FONT = None  # 1 font for this game, loaded by get_font
+
+
+def get_font():
+    """
+    Load the font on first call.
+    """
+    global FONT
+    if FONT is None:
+        with timed_phase("font"):
+            if not pg.font.get_init():
+                pg.font.init()
+            FONT = pg.font.Font(TTF_DIR_TO_FILE, FONT_SIZE)
+    return FONT
+
+
+def get_label(text: str):
+    """
+    Static text surface. Pre rendered in the bundle, so the font is only loaded for texts the bundle does not have.
+    """
+    return SURFACES_DICT[LABEL_PREFIX + text]
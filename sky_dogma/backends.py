@@ -0,0 +1,197 @@
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.constants import DISPLAY_SIZE, NATIVE_RESOLUTION
+
+"""
+Render backends. Sprite.draw / Group.draw / Game only talk to autoload.Backend, so the backend can be swapped.
+SurfaceBackend = software Surface.blit onto NATIVE_SURFACE + software transform.scale (the original path).
+TextureBackend = SDL2 Renderer / Texture, sheets are uploaded once, the renderer does the logical size scaling.
+"""
+
+# surface backend scalers
+NEAREST = "nearest"  # transform.scale, blocky
+EPX = "epx"  # transform.scale2x twice, smoother pixel art edges, a bit slower (needs a 4x window, else nearest), opt in
+SCALERS = (NEAREST, EPX)
+# quality governor knob, high -> minimal, None = the scaler the backend was made with (only ever lowered from there)
+SCALER_TIERS = (None, NEAREST, NEAREST, NEAREST)
+
+
+class RenderBackend:
+    """
+    What every backend must do. Positions / rects are in native resolution pixels.
+    """
+    name = "base"
+
+    def clear(self, color):
+        """
+        Fill the whole frame with color.
+        """
+        raise NotImplementedError
+
+    def blit(self, image, dest_rect, frame_rect):
+        """
+        Draw the frame_rect part of image (a spritesheet surface) at dest_rect. Uses the image alpha.
+        """
+        raise NotImplementedError
+
+    def draw_rect(self, color, rect, width=1):
+        """
+        Debug outline.
+        """
+        raise NotImplementedError
+
+    def draw_line(self, color, start, end, width=1):
+        """
+        Debug line.
+        """
+        raise NotImplementedError
+
+    def present(self):
+        """
+        Show the frame in the window.
+        """
+        raise NotImplementedError
+
+    def forget(self, image):
+        """
+        Pixels of image changed, drop whatever was made from the old ones. Nothing to drop by default.
+        """
+
+    def close(self):
+        """
+        Release whatever the backend holds. Call before pg.quit.
+        """
+
+
+class SurfaceBackend(RenderBackend):
+    """
+    Blits onto the active NATIVE_SURFACE, present scales it up to the window (opens the window on first present).
+    """
+    name = "surface"
+
+    def __init__(self, scaler: str = NEAREST):
+        self.default_scaler = scaler
+        self.scaler = scaler
+        self.scaled_surface = None  # window sized, reused every present (no 1280x720 surface per frame)
+        self.half_surface = None  # epx, 2x native in between
+        if autoload.GOVERNOR is not None:
+            autoload.GOVERNOR.register("scaler", SCALER_TIERS, self.set_scaler)
+
+    def set_scaler(self, scaler):
+        """
+        None = back to the scaler the backend was made with.
+        """
+        self.scaler = scaler or self.default_scaler
+
+    def clear(self, color):
+        autoload.NATIVE_SURFACE.fill(color)
+
+    def blit(self, image, dest_rect, frame_rect):
+        autoload.NATIVE_SURFACE.blit(image, dest_rect, frame_rect)
+
+    def draw_rect(self, color, rect, width=1):
+        pg.draw.rect(autoload.NATIVE_SURFACE, color, rect, width)
+
+    def draw_line(self, color, start, end, width=1):
+        pg.draw.line(autoload.NATIVE_SURFACE, color, start, end, width)
+
+    def present(self):
+        display_surface = autoload.get_display_surface()
+
+        # BLIT NATIVE TO DISPLAY
+        if self.scaled_surface is None:
+            self.scaled_surface = pg.Surface(DISPLAY_SIZE, 0, autoload.NATIVE_SURFACE)
+        if self.scaler == EPX and DISPLAY_SIZE == (NATIVE_RESOLUTION[0] * 4, NATIVE_RESOLUTION[1] * 4):
+            if self.half_surface is None:
+                self.half_surface = pg.Surface((NATIVE_RESOLUTION[0] * 2, NATIVE_RESOLUTION[1] * 2), 0, autoload.NATIVE_SURFACE)
+            pg.transform.scale2x(autoload.NATIVE_SURFACE, self.half_surface)
+            pg.transform.scale2x(self.half_surface, self.scaled_surface)
+        else:
+            pg.transform.scale(autoload.NATIVE_SURFACE, DISPLAY_SIZE, self.scaled_surface)
+        display_surface.blit(self.scaled_surface, (0, 0))
+
+        # UPDATE DISPLAY SURF TO SCREEN
+        pg.display.flip()
+
+
+class TextureBackend(RenderBackend):
+    """
+    Draws with pygame._sdl2.video. Owns its own window (do not mix with pg.display.set_mode).
+    Each surface is uploaded to a texture the first time it is drawn, then reused.
+    Software = SDL software renderer, works under the dummy video driver (headless tests / benchmarks).
+    """
+    name = "texture"
+
+    def __init__(self, software: bool = False, vsync: bool = False):
+        # optional, only this backend needs it
+        from pygame._sdl2.video import Window, Renderer, Texture
+
+        ##############
+        # PROPERTIES #
+        ##############
+        if not pg.display.get_init():
+            pg.display.init()
+        self.Texture = Texture
+        self.window = Window("Sky Dogma", DISPLAY_SIZE)
+        self.renderer = Renderer(self.window, accelerated=0 if software else -1, vsync=vsync)
+        # renderer scales the native frame up to the window
+        self.renderer.logical_size = NATIVE_RESOLUTION
+        self.textures = {}  # key = surface | val = its texture
+        self.upload_count = 0
+
+    ###########
+    # METHODS #
+    ###########
+    def get_texture(self, image):
+        """
+        Texture of given surface, uploaded on first use.
+        """
+        texture = self.textures.get(image)
+        if texture is None:
+            texture = self.Texture.from_surface(self.renderer, image)
+            texture.blend_mode = pg.BLENDMODE_BLEND
+            self.textures[image] = texture
+            self.upload_count += 1
+        return texture
+
+    def forget(self, image):
+        """
+        Drop the texture of a surface whose pixels changed, it is uploaded again on next draw.
+        """
+        self.textures.pop(image, None)
+
+    def clear(self, color):
+        self.renderer.draw_color = pg.Color(color)
+        self.renderer.clear()
+
+    def blit(self, image, dest_rect, frame_rect):
+        texture = self.get_texture(image)
+        alpha = image.get_alpha()
+        texture.alpha = 255 if alpha is None else alpha
+        texture.draw(frame_rect, (dest_rect[0], dest_rect[1], frame_rect[2], frame_rect[3]))
+
+    def draw_rect(self, color, rect, width=1):
+        self.renderer.draw_color = pg.Color(color)
+        self.renderer.draw_rect(rect)
+
+    def draw_line(self, color, start, end, width=1):
+        self.renderer.draw_color = pg.Color(color)
+        self.renderer.draw_line(start, end)
+
+    def present(self):
+        self.renderer.present()
+
+    def close(self):
+        # textures -> renderer -> window, other orders crash on pg.quit
+        self.textures.clear()
+        self.renderer = None
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
+
+
+BACKENDS = {
+    SurfaceBackend.name: SurfaceBackend,
+    TextureBackend.name: TextureBackend,
+}
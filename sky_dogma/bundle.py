@@ -0,0 +1,279 @@
+import pygame as pg  # https://pyga.me/docs/
+import os
+import mmap
+import types
+import struct
+import hashlib
+import argparse
+
+from sky_dogma.constants import ROOT_DIR, PNG_DIR, TTF_DIR_TO_FILE, FONT_SIZE
+from sky_dogma.helpers import apply_flash_shader
+
+"""
+Pre decoded asset bundle. Every png, the derived surfaces (shadows, flashes) and the static labels are stored as raw
+BGRA pixels (same channel order as the window, so blits need no conversion) in 1 file with an index header.
+At runtime the file is memory mapped and surfaces are made with pg.image.frombuffer, nothing is decoded or copied.
+The header keeps a hash of the sources (files + recipe parameters + recipe code), a stale bundle is rebuilt.
+
+HEADER  magic, version, source hash, entry count
+INDEX   per entry: u16 name length, name, u16 width, u16 height, u64 offset, u64 size
+DATA    pixels, every entry 64 byte aligned
+
+python -m sky_dogma.bundle build
+python -m sky_dogma.bundle info
+"""
+
+BUNDLE_PATH = os.path.join(ROOT_DIR, "assets/bundle.bin")
+PIXEL_FORMAT = "BGRA"
+
+MAGIC = b"SKYBUNDL"
+VERSION = 1
+HEADER = struct.Struct("<8sH32sI")  # magic, version, source hash, entry count
+NAME_LENGTH = struct.Struct("<H")
+ENTRY = struct.Struct("<HHQQ")  # width, height, offset, size
+ALIGNMENT = 64
+
+# what the bundle holds besides the pngs, recipes parameters and code are hashed (no version to bump by hand)
+LABEL_PREFIX = "label:"
+LABEL_COLOR = (255, 255, 255)
+STATIC_LABELS = (
+    "made by clifford",
+    "powered by python",
+    "press any key to skip",
+    "press any key",
+)
+# key = derived surface name | val = its parameters
+RECIPES = {
+    "player_shadow": {"color": (0, 0, 0, 112), "size": (12 * 11, 12)},  # see through black, 50% of the player sheet
+    "player_flash": {"color": (255, 255, 255, 255)},
+}
+
+
+###########
+# DERIVED #
+###########
+def derive_player_shadow(surfaces):
+    """
+    Player sheet, non transparent pixels turned see through black, scaled down by 50%.
+    """
+    recipe = RECIPES["player_shadow"]
+    # pre process the surface, turn non transparent pixel to black
+    black_sprite_sheet_surface = apply_flash_shader(surfaces["player"], color=recipe["color"])
+
+    # scale it down by 50%
+    # TODO: have this scaling be configurable for animation (take off and landing)
+    return pg.transform.scale(black_sprite_sheet_surface, recipe["size"])
+
+
+def derive_player_flash(surfaces):
+    """
+    Player sheet, non transparent pixels turned white (hit flash).
+    """
+    return apply_flash_shader(surfaces["player"], color=RECIPES["player_flash"]["color"])
+
+
+# key = surface name | val = function(surfaces) -> surface
+DERIVED = {
+    "player_shadow": derive_player_shadow,
+    "player_flash": derive_player_flash,
+}
+
+
+def render_label(font, text: str):
+    """
+    Static label surface (what scenes used to render in their constructor).
+    """
+    return font.render(text, False, LABEL_COLOR)
+
+
+#########
+# BUILD #
+#########
+def code_fingerprint(code):
+    """
+    Bytes that change when a function body changes: bytecode, names it uses, constants (nested code too, its repr
+    holds an address). Same python version = same bytes.
+    """
+    parts = [code.co_code, " ".join(code.co_names).encode("utf-8")]
+    for constant in code.co_consts:
+        parts.append(code_fingerprint(constant) if isinstance(constant, types.CodeType) else repr(constant).encode("utf-8"))
+    return b"\0".join(parts)
+
+
+def sources_hash():
+    """
+    Hash of everything the bundle is made from. Files are stat based (name, size, mtime), so checking it costs no decode.
+    Recipes count too: their parameters, the code of the functions that make derived surfaces / labels, pygame version.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(
+        f"{VERSION} {PIXEL_FORMAT} {FONT_SIZE} {STATIC_LABELS} {LABEL_COLOR} {RECIPES} {pg.version.ver}".encode("utf-8")
+    )
+    for function in (*DERIVED.values(), apply_flash_shader, render_label):
+        digest.update(code_fingerprint(function.__code__))
+    for path in sorted(os.path.join(PNG_DIR, filename) for filename in os.listdir(PNG_DIR)) + [TTF_DIR_TO_FILE]:
+        stat = os.stat(path)
+        digest.update(f"{os.path.basename(path)} {stat.st_size} {stat.st_mtime_ns}".encode("utf-8"))
+    return digest.digest()
+
+
+def build_bundle(path: str = BUNDLE_PATH):
+    """
+    Decode + derive + render everything, write the bundle (atomically). Returns the entry names.
+    """
+    surfaces = {}
+    for filename in sorted(os.listdir(PNG_DIR)):
+        surfaces[os.path.splitext(filename)[0]] = pg.image.load(os.path.join(PNG_DIR, filename))
+    for name, derive in DERIVED.items():
+        surfaces[name] = derive(surfaces)
+    if not pg.font.get_init():
+        pg.font.init()
+    font = pg.font.Font(TTF_DIR_TO_FILE, FONT_SIZE)
+    for text in STATIC_LABELS:
+        surfaces[LABEL_PREFIX + text] = render_label(font, text)
+
+    # index size is known before the data, so offsets can be absolute
+    names = list(surfaces)
+    index_size = sum(NAME_LENGTH.size + len(name.encode("utf-8")) + ENTRY.size for name in names)
+    offset = HEADER.size + index_size
+
+    index = bytearray()
+    data = bytearray()
+    for name in names:
+        # colorkey surfaces (labels are 8 bit) go through a blit to turn the key into alpha 0
+        # per pixel alpha ones are read as is, blitting would blend their half transparent pixels
+        surface = surfaces[name]
+        if not surface.get_flags() & pg.SRCALPHA:
+            normalized = pg.Surface(surface.get_size(), pg.SRCALPHA)
+            normalized.blit(surface, (0, 0))
+            surface = normalized
+        pixels = pg.image.tobytes(surface, PIXEL_FORMAT)
+
+        padding = -(offset + len(data)) % ALIGNMENT
+        data += bytes(padding)
+        encoded = name.encode("utf-8")
+        index += NAME_LENGTH.pack(len(encoded)) + encoded
+        index += ENTRY.pack(surface.get_width(), surface.get_height(), offset + len(data), len(pixels))
+        data += pixels
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, sources_hash(), len(names)))
+        file.write(index)
+        file.write(data)
+    os.replace(temp_path, path)
+    return names
+
+
+##########
+# BUNDLE #
+##########
+class Bundle:
+    """
+    Memory mapped bundle. get returns a surface whose pixels are the mapped file (copy on write, never written back).
+    """
+    def __init__(self, path: str = BUNDLE_PATH):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.file = open(path, "rb")
+        self.buffer = None
+        self.view = None
+        self.entries = {}  # key = name | val = (width, height, offset, size)
+        try:
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+            self.view = memoryview(self.buffer)
+            self.read_index(path)
+        except (ValueError, struct.error) as error:
+            # empty / truncated / other format: 1 error type for the caller, nothing left open
+            self.close()
+            raise ValueError(f"{path} is not a readable version {VERSION} bundle ({error})") from error
+
+    ###########
+    # METHODS #
+    ###########
+    def read_index(self, path: str):
+        """
+        Header + index. ValueError / struct.error when the file is not a whole bundle of this version.
+        """
+        magic, version, self.source_hash, entry_count = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} bundle")
+
+        offset = HEADER.size
+        for _ in range(entry_count):
+            (length,) = NAME_LENGTH.unpack_from(self.buffer, offset)
+            offset += NAME_LENGTH.size
+            name = bytes(self.view[offset:offset + length]).decode("utf-8")
+            offset += length
+            entry = ENTRY.unpack_from(self.buffer, offset)
+            offset += ENTRY.size
+            if entry[2] + entry[3] > len(self.buffer):
+                raise ValueError(f"{path} is truncated ({name} ends past the file)")
+            self.entries[name] = entry
+
+    def close(self):
+        """
+        Unmap + close the file. Surfaces made by get must be gone first (they use the mapped pixels).
+        """
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+        self.file.close()
+
+    def is_fresh(self):
+        """
+        Sources did not change since this bundle was built.
+        """
+        return self.source_hash == sources_hash()
+
+    def get(self, name: str):
+        """
+        Surface of given entry, or None when the bundle does not have it.
+        """
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        width, height, offset, size = entry
+        return pg.image.frombuffer(self.view[offset:offset + size], (width, height), PIXEL_FORMAT)
+
+
+def open_bundle(path: str = BUNDLE_PATH):
+    """
+    Open the bundle, (re)building it first when missing, stale or unreadable (old version, half written).
+    """
+    if os.path.exists(path):
+        try:
+            bundle = Bundle(path)
+        except ValueError:
+            bundle = None  # closed already
+        if bundle is not None:
+            if bundle.is_fresh():
+                return bundle
+            # nothing may hold the old file while it is replaced
+            bundle.close()
+    build_bundle(path)
+    return Bundle(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Asset bundler.")
+    parser.add_argument("command", choices=("build", "info"))
+    args = parser.parse_args()
+
+    if args.command == "build":
+        names = build_bundle()
+        print(f"{BUNDLE_PATH}: {len(names)} entries, {os.path.getsize(BUNDLE_PATH)} bytes")
+        return
+
+    bundle = Bundle()
+    print(f"{BUNDLE_PATH}: {'fresh' if bundle.is_fresh() else 'stale'}")
+    for name, (width, height, offset, size) in bundle.entries.items():
+        print(f"  {name:<32} {width:4d}x{height:<4d} @ {offset:8d} ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import pygame as pg  # https://pyga.me/docs/
+
+"""
+Pixel perfect collision between Sprites. Masks are made once per spritesheet frame (same frame table as Sprite,
+so every sprite on a sheet shares them) and once per quantized angle for rotated frames. Never from_surface per check.
+Every check is rect overlap first (plain int compares), mask overlap only when the rects touch.
+Positions are global (sprite.rect.topleft), the box is 1 frame (sprite.rect is as wide as the whole sheet).
+"""
+
+ROTATION_STEPS = 16  # quantized angles per turn, for rotated masks
+
+# key = (surface, frame table) | val = tuple of masks, index = frame
+MASK_TABLES = {}
+# key = (surface, frame table, steps) | val = tuple per frame of tuple per step of (mask, x offset, y offset)
+ROTATED_MASK_TABLES = {}
+
+
+class CollisionStats:
+    """
+    How far checks go: checks = pairs tested, narrow = pairs whose rects overlapped (mask tested), hits = masks overlapped.
+    """
+    __slots__ = ("checks", "narrow", "hits")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.checks = 0
+        self.narrow = 0
+        self.hits = 0
+
+    def as_dict(self):
+        return {
+            "checks": self.checks,
+            "narrow": self.narrow,
+            "hits": self.hits,
+            "narrow_ratio": self.narrow / self.checks if self.checks else 0.0,
+        }
+
+
+stats = CollisionStats()
+
+
+#########
+# MASKS #
+#########
+def get_mask_table(surface, frame_table):
+    """
+    1 mask per frame of the sheet, made on first call.
+    """
+    key = (surface, frame_table)
+    masks = MASK_TABLES.get(key)
+    if masks is None:
+        masks = tuple(pg.mask.from_surface(surface.subsurface(frame_rect)) for frame_rect in frame_table)
+        MASK_TABLES[key] = masks
+    return masks
+
+
+def get_rotated_mask_table(surface, frame_table, steps: int = ROTATION_STEPS):
+    """
+    Per frame, 1 mask per quantized angle. Rotated frames grow, the offsets keep them centered on the frame.
+    """
+    key = (surface, frame_table, steps)
+    table = ROTATED_MASK_TABLES.get(key)
+    if table is None:
+        table = []
+        for frame_rect in frame_table:
+            frame_surface = surface.subsurface(frame_rect)
+            variants = []
+            for step in range(steps):
+                rotated_surface = pg.transform.rotate(frame_surface, step * 360.0 / steps)
+                variants.append((
+                    pg.mask.from_surface(rotated_surface),
+                    (frame_rect[2] - rotated_surface.get_width()) // 2,
+                    (frame_rect[3] - rotated_surface.get_height()) // 2
+                ))
+            table.append(tuple(variants))
+        table = tuple(table)
+        ROTATED_MASK_TABLES[key] = table
+    return table
+
+
+def quantize_angle(angle: float, steps: int = ROTATION_STEPS):
+    """
+    Degrees -> nearest rotation step.
+    """
+    return int(round(angle * steps / 360.0)) % steps
+
+
+def get_mask(sprite, angle: float = None, steps: int = ROTATION_STEPS):
+    """
+    (mask, x, y) of the sprite current frame, global position. Angle = use the rotated variant.
+    """
+    if angle is None:
+        return get_mask_table(sprite.image, sprite.frame_data)[sprite.frame], sprite.rect.x, sprite.rect.y
+    mask, x_offset, y_offset = get_rotated_mask_table(sprite.image, sprite.frame_data, steps)[sprite.frame][quantize_angle(angle, steps)]
+    return mask, sprite.rect.x + x_offset, sprite.rect.y + y_offset
+
+
+##########
+# CHECKS #
+##########
+def collide(sprite_a, sprite_b, angle_a: float = None, angle_b: float = None):
+    """
+    Pixel perfect overlap of 2 sprites (current frames).
+    """
+    mask_a, x_a, y_a = get_mask(sprite_a, angle_a)
+    mask_b, x_b, y_b = get_mask(sprite_b, angle_b)
+    width_a, height_a = mask_a.get_size()
+    width_b, height_b = mask_b.get_size()
+
+    stats.checks += 1
+    # rect overlap
+    if x_b >= x_a + width_a or x_a >= x_b + width_b or y_b >= y_a + height_a or y_a >= y_b + height_b:
+        return False
+    # mask overlap
+    stats.narrow += 1
+    if mask_a.overlap(mask_b, (x_b - x_a, y_b - y_a)) is None:
+        return False
+    stats.hits += 1
+    return True
+
+
+def collide_many(sprite, candidates, angle: float = None):
+    """
+    Candidates (sprites, unrotated) whose current frame overlaps sprite's, in candidates order.
+    Sprite mask and box are looked up once for the whole batch (1 player vs every bullet).
+    """
+    mask, x, y = get_mask(sprite, angle)
+    width, height = mask.get_size()
+    right = x + width
+    bottom = y + height
+
+    hits = []
+    narrow = 0
+    for candidate in candidates:
+        rect = candidate.rect
+        candidate_x = rect.x
+        candidate_y = rect.y
+        # rect overlap
+        if candidate_x >= right or candidate_y >= bottom:
+            continue
+        if x >= candidate_x + candidate.frame_width or y >= candidate_y + candidate.frame_height:
+            continue
+        # mask overlap
+        narrow += 1
+        candidate_mask = get_mask_table(candidate.image, candidate.frame_data)[candidate.frame]
+        if mask.overlap(candidate_mask, (candidate_x - x, candidate_y - y)) is not None:
+            hits.append(candidate)
+
+    stats.checks += len(candidates)
+    stats.narrow += narrow
+    stats.hits += len(hits)
+    return hits
+
+
+def collide_any(sprite, candidates, angle: float = None):
+    """
+    First candidate that overlaps sprite, or None. Stops at the first hit.
+    """
+    mask, x, y = get_mask(sprite, angle)
+    width, height = mask.get_size()
+    right = x + width
+    bottom = y + height
+
+    checks = 0
+    hit = None
+    for candidate in candidates:
+        checks += 1
+        rect = candidate.rect
+        candidate_x = rect.x
+        candidate_y = rect.y
+        if candidate_x >= right or candidate_y >= bottom:
+            continue
+        if x >= candidate_x + candidate.frame_width or y >= candidate_y + candidate.frame_height:
+            continue
+        stats.narrow += 1
+        candidate_mask = get_mask_table(candidate.image, candidate.frame_data)[candidate.frame]
+        if mask.overlap(candidate_mask, (candidate_x - x, candidate_y - y)) is not None:
+            hit = candidate
+            stats.hits += 1
+            break
+
+    stats.checks += checks
+    return hit
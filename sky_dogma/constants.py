@@ -0,0 +1,20 @@
+import pygame as pg  # https://pyga.me/docs/
+import os
+
+
+################
+# GLOBAL CONST #
+################
+FPS = 60
+DISPLAY_SIZE = (1280, 720)  # use the user setting to define this
+NATIVE_RESOLUTION = (320, 180)
+HALF_NATIVE_RESOLUTION = (160, 90)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # so assets load from any cwd
+PNG_DIR = os.path.join(ROOT_DIR, "assets/png")
+TTF_DIR_TO_FILE = os.path.join(ROOT_DIR, "assets/ttf/CG_pixel_3x5_mono.ttf")  # 1 font for this game
+FONT_SIZE = 5  # 1 font for this game
+BACKGROUND_WIDTH = 336
+HALF_BACKGROUND_WIDTH = 168
+ONE_TILE = 16
+DEBUG_KEY = pg.K_d
+DEBUG_KEY_IN_GAME = pg.K_e
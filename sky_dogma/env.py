@@ -0,0 +1,185 @@
+import pygame as pg  # https://pyga.me/docs/
+import os
+
+import numpy as np  # optional, only the agent environment and bullet patterns need it
+
+from sky_dogma.constants import FPS, NATIVE_RESOLUTION
+from sky_dogma.game import Game
+from sky_dogma.scenes import Test
+from sky_dogma.snapshot import snapshot_size
+
+"""
+Environment for bots: reset, step(action, frameskip), observation. Headless (SDL dummy driver) and uncapped, every step
+is a fixed 1 / FPS delta with no waiting.
+Observation = zero copy NumPy view (height, width, RGB) of the game canvas. The canvas itself is made on a NumPy buffer
+(pg.image.frombuffer), surfarray pixel references would lock the surface and blits onto a locked surface fail.
+Views stay valid and change in place every step, copy what you want to keep.
+State = float32 vector, layout in STATE_FIELDS, then MAX_ENTITIES rows of ENTITY_FIELDS (drawn things but the player).
+Action = bit mask of held keys, ACTION_KEYS order (0 = nothing, 1 | 4 = left + up ...).
+VectorEnvironment steps many instances in 1 process, their canvases + states are slices of 1 batch array each.
+"""
+
+# agents never open a real window / audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ACTION_KEYS = (pg.K_LEFT, pg.K_RIGHT, pg.K_UP, pg.K_DOWN)
+ACTION_COUNT = 1 << len(ACTION_KEYS)
+# key = action | val = keys held
+ACTION_TABLE = [[key for bit, key in enumerate(ACTION_KEYS) if action & (1 << bit)] for action in range(ACTION_COUNT)]
+
+STATE_FIELDS = (
+    "frame", "is_paused",
+    "player_x", "player_y", "velocity_x", "velocity_y",
+    "camera_x", "camera_y", "scroll",
+)
+ENTITY_FIELDS = ("is_alive", "x", "y", "width", "height")
+MAX_ENTITIES = 32
+STATE_SIZE = len(STATE_FIELDS) + MAX_ENTITIES * len(ENTITY_FIELDS)
+
+PIXEL_FORMAT = "BGRA"  # same layout as the game sprites, blits take the fast path (an RGBX canvas is ~10x slower)
+
+
+def make_canvas(pixels):
+    """
+    Native size surface drawn straight into pixels ((height, width, 4) uint8, C contiguous). The clear fill is opaque,
+    so the alpha channel stays 255 and blending matches a plain canvas.
+    """
+    return pg.image.frombuffer(pixels, NATIVE_RESOLUTION, PIXEL_FORMAT)
+
+
+class Environment:
+    """
+    1 Test scene game for an agent. Pixels / state = where it writes, None = its own arrays.
+    """
+    def __init__(self, seed: int = 0, frameskip: int = 1, scene=Test, pixels=None, state=None):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.frameskip = frameskip
+        self.seed = seed
+        self.pixels = pixels if pixels is not None else np.zeros((NATIVE_RESOLUTION[1], NATIVE_RESOLUTION[0], 4), np.uint8)
+        self.observation = self.pixels[:, :, 2::-1]  # (height, width, RGB) view, B G R A bytes read backwards
+        self.state = state if state is not None else np.zeros(STATE_SIZE, np.float32)
+        self.entities = self.state[len(STATE_FIELDS):].reshape(MAX_ENTITIES, len(ENTITY_FIELDS))
+
+        self.game = Game(first_scene=scene, seed=seed)
+        self.game.NATIVE_SURFACE = make_canvas(self.pixels)
+        self.game.activate()
+
+        # start point, reset restores it in place (no scene rebuild)
+        self.start_state = bytearray(snapshot_size(self.game))
+        self.game.save_state(self.start_state)
+
+    ###########
+    # METHODS #
+    ###########
+    def reset(self, seed=None):
+        """
+        Back to the first frame (seed = reseed gameplay randomness). Returns (observation, state).
+        """
+        game = self.game
+        game.load_state(self.start_state)
+        if seed is not None:
+            self.seed = seed
+        game.rng.seed(self.seed)
+        # nothing held
+        game.held_keys = set()
+        game.Input.key_states.clear()
+        game.Input.was_pressed = False
+        game.is_running = True
+        game.activate()
+        game.Backend.clear("blue4")
+        game.draw()
+        return self.observation, self.read_state()
+
+    def step(self, action: int, frameskip=None):
+        """
+        Hold action for frameskip frames (only the last one is drawn). Returns (observation, state).
+        """
+        game = self.game
+        events = game.scripted_events(ACTION_TABLE[action])
+        frames = frameskip or self.frameskip
+        for frame in range(frames):
+            game.step(1.0 / FPS, events, is_drawing=frame == frames - 1)
+            events = ()
+        return self.observation, self.read_state()
+
+    def read_state(self):
+        """
+        Fill the state vector from the live objects.
+        """
+        game = self.game
+        scene = game.SceneManager.current_scene
+        state = self.state
+        state[0] = game.frame_count
+        state[1] = game.PauseMenu.is_paused
+        player = getattr(scene, "Player", None)
+        if player is not None:
+            state[2] = player.rect.x
+            state[3] = player.rect.y
+            state[4] = player.velocity.x
+            state[5] = player.velocity.y
+        state[6] = game.Cam.global_position.x
+        state[7] = game.Cam.global_position.y
+        scroller = getattr(scene, "BackgroundScroller", None)
+        if scroller is not None:
+            state[8] = scroller.scroll
+
+        # entities, everything drawn but the player (frame sized, sprite sheet rects are sheet wide)
+        entities = self.entities
+        entities.fill(0.0)
+        index = 0
+        for node in scene.DrawnLayer.sprites():
+            if node is player or getattr(node, "rect", None) is None or index == MAX_ENTITIES:
+                continue
+            sprite = getattr(node, "Sprite", node)
+            entities[index] = (1.0, node.rect.x, node.rect.y, getattr(sprite, "frame_width", node.rect.width), getattr(sprite, "frame_height", node.rect.height))
+            index += 1
+        return state
+
+    ###########
+    # GETTERS #
+    ###########
+    def state_dict(self):
+        """
+        State vector fields by name (debugging, not for the hot loop).
+        """
+        return {name: float(self.state[index]) for index, name in enumerate(STATE_FIELDS)}
+
+
+class VectorEnvironment:
+    """
+    count Environments in 1 process, stepped one after another. Observations = (count, height, width, RGB) view,
+    states = (count, STATE_SIZE), both updated in place.
+    """
+    def __init__(self, count: int, seed: int = 0, frameskip: int = 1, scene=Test):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.pixels = np.zeros((count, NATIVE_RESOLUTION[1], NATIVE_RESOLUTION[0], 4), np.uint8)
+        self.observations = self.pixels[:, :, :, 2::-1]
+        self.states = np.zeros((count, STATE_SIZE), np.float32)
+        self.environments = [
+            Environment(seed + index, frameskip, scene, self.pixels[index], self.states[index])
+            for index in range(count)
+        ]
+
+    ###########
+    # METHODS #
+    ###########
+    def reset(self, seeds=None):
+        """
+        Reset every instance (seeds = 1 per instance, None = keep). Returns (observations, states).
+        """
+        for index, environment in enumerate(self.environments):
+            environment.reset(None if seeds is None else seeds[index])
+        return self.observations, self.states
+
+    def step(self, actions, frameskip=None):
+        """
+        actions = 1 action per instance. Returns (observations, states).
+        """
+        for environment, action in zip(self.environments, actions):
+            environment.step(int(action), frameskip)
+        return self.observations, self.states
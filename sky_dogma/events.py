@@ -0,0 +1,163 @@
+from dataclasses import dataclass
+from collections import Counter, defaultdict
+
+"""
+Engine wide event bus. Events are posted anytime but only dispatched once per tick, at a fixed point of the frame
+(Game.step: after update, before draw), so listeners never run in the middle of someone else's update loop.
+Equal events posted in the same tick are coalesced into 1 dispatch.
+"""
+
+
+##########
+# EVENTS #
+##########
+# frozen = hashable, that is what lets the bus coalesce equal events
+# source = who posted it, listeners can subscribe to 1 source only
+@dataclass(frozen=True, slots=True)
+class Event:
+    source: object = None
+
+
+@dataclass(frozen=True, slots=True)
+class AnimationFinished(Event):
+    """
+    A non looping animation reached its last keyframe. Source = the Animator.
+    """
+    animation_name: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class StageRecordReached(Event):
+    """
+    The stage scrolled to a spawn / tile / trigger record. Source = the StageStream.
+    """
+    record: object = None
+
+
+@dataclass(frozen=True, slots=True)
+class ViewEntered(Event):
+    """
+    A node of a view tracked render layer started overlapping the camera view. Source = the node.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class ViewExited(Event):
+    """
+    A node of a view tracked render layer stopped overlapping the camera view. Source = the node.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class SceneChangeRequested(Event):
+    """
+    Change to a new scene_type() at dispatch (scene scripts run in update). Source = who asks.
+    """
+    scene_type: type = None
+
+
+#######
+# BUS #
+#######
+class EventBus:
+    """
+    Typed, deferred, coalescing. Listener lookup is 2 dict gets per event (by type, by type + source), no scans.
+    """
+    def __init__(self):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.queue = []  # events posted this tick, duplicates included
+        self.listeners = defaultdict(list)  # key = event type | val = callbacks for any source
+        self.source_listeners = defaultdict(list)  # key = (event type, source) | val = callbacks
+        self.owners = defaultdict(list)  # key = callback owner | val = list of (listeners dict, key, callback)
+
+        # stats, key = event type
+        self.posted_counts = defaultdict(int)
+        self.coalesced_counts = defaultdict(int)
+        self.dispatched_counts = defaultdict(int)
+        self.call_counts = defaultdict(int)
+
+    ###########
+    # METHODS #
+    ###########
+    def subscribe(self, event_type, callback, source=None, owner=None):
+        """
+        Callback(event) is called for every event of given type (only the ones from source, if given).
+        Owner = who unsubscribe_owner drops it with, None = the object of a bound method callback.
+        """
+        if source is None:
+            listeners, key = self.listeners, event_type
+        else:
+            listeners, key = self.source_listeners, (event_type, source)
+        listeners[key].append(callback)
+
+        # bound methods are remembered by owner, so unsubscribe_owner can drop a whole scene
+        if owner is None:
+            owner = getattr(callback, "__self__", None)
+        if owner is not None:
+            self.owners[owner].append((listeners, key, callback))
+
+    def unsubscribe_owner(self, owner):
+        """
+        Drop every callback that is a method of owner (or was subscribed with it).
+        """
+        for listeners, key, callback in self.owners.pop(owner, ()):
+            callbacks = listeners.get(key)
+            if callbacks and callback in callbacks:
+                callbacks.remove(callback)
+                if not callbacks:
+                    del listeners[key]
+
+    def post(self, event):
+        """
+        Queue an event for the next dispatch. Equal events this tick are dispatched once.
+        Hot path (thousands per frame), just an append. Coalescing + stats happen once per tick in dispatch.
+        """
+        self.queue.append(event)
+
+    def dispatch(self):
+        """
+        Call listeners of everything queued, in post order. Events posted by listeners wait for the next dispatch.
+        """
+        if not self.queue:
+            return
+        # coalesce, Counter hashes each event once (in C) and keeps post order
+        queue = Counter(self.queue)
+        self.queue = []
+
+        listeners = self.listeners
+        source_listeners = self.source_listeners
+        for event, count in queue.items():
+            event_type = type(event)
+            self.posted_counts[event_type] += count
+            self.coalesced_counts[event_type] += count - 1
+            self.dispatched_counts[event_type] += 1
+
+            # copy, a listener may unsubscribe (scene change) while we iterate
+            callbacks = list(listeners.get(event_type, ()))
+            if event.source is not None:
+                callbacks += source_listeners.get((event_type, event.source), ())
+            for callback in callbacks:
+                callback(event)
+            self.call_counts[event_type] += len(callbacks)
+
+    def clear(self):
+        """
+        Forget queued events (not listeners), they are not counted.
+        """
+        self.queue.clear()
+
+    def stats(self):
+        """
+        Per event type counters so far: posted, coalesced, dispatched, listener calls.
+        """
+        return {
+            event_type.__name__: {
+                "posted": self.posted_counts[event_type],
+                "coalesced": self.coalesced_counts[event_type],
+                "dispatched": self.dispatched_counts[event_type],
+                "calls": self.call_counts[event_type],
+            }
+            for event_type in self.posted_counts
+        }
@@ -0,0 +1,163 @@
+import pygame as pg  # https://pyga.me/docs/
+import os
+import json
+import time
+import random
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from sky_dogma import autoload
+from sky_dogma.constants import FPS
+from sky_dogma.game import Game
+from sky_dogma.scenes import Test
+
+"""
+Headless simulation farm.
+Runs many bot playthroughs of the Test scene across CPU cores (SDL dummy driver, no window).
+python -m sky_dogma.farm --runs 1000 --frames 600
+python -m sky_dogma.farm --runs 64 --scaling  (runs it with 1, 2, 4 .. N workers, prints the speedup)
+python -m sky_dogma.farm --replay replay.json  (replay.json = [["K_LEFT", "K_UP"], [], ...] 1 list of held keys per frame)
+"""
+
+# workers never open a real window / audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+########
+# BOTS #
+########
+BOT_KEYS = ("K_LEFT", "K_RIGHT", "K_UP", "K_DOWN")
+
+
+def random_bot(seed: int, frames: int):
+    """
+    Scripted input: hold random arrow key combos for random durations. Returns 1 list of key names per frame.
+    """
+    rng = random.Random(seed)
+    held_keys = []
+    while len(held_keys) < frames:
+        combo = [key for key in BOT_KEYS if rng.random() < 0.35]
+        held_keys.extend([combo] * rng.randint(5, 60))
+    return held_keys[:frames]
+
+
+##########
+# WORKER #
+##########
+def init_worker():
+    """
+    Runs once in every worker process. Warms up the assets every run needs, so runs time only the game.
+    """
+    autoload.get_bundle()
+    for key in ("field", "player", "player_shadow", "player_exhaust"):
+        autoload.SURFACES_DICT[key]
+
+
+def run_playthrough(run_spec: tuple):
+    """
+    Expects run_spec = (seed, frames, replay). Replay = held key names per frame or None for the random bot.
+    Steps a fresh Test scene with fixed delta as fast as possible, returns the run metrics.
+    """
+    seed, frames, replay = run_spec
+    held_key_names = replay if replay is not None else random_bot(seed, frames)
+    # key names -> key codes
+    held_keys = [[getattr(pg, name) for name in names] for names in held_key_names]
+    delta = 1.0 / FPS
+
+    start = time.perf_counter()
+    game = Game(first_scene=Test)
+    for frame in range(min(frames, len(held_keys))):
+        game.step(delta, game.scripted_events(held_keys[frame]))
+    seconds = time.perf_counter() - start
+
+    return {
+        "seed": seed,
+        "frames": game.frame_count,
+        "seconds": seconds,
+        "fps": game.frame_count / seconds if seconds else 0.0,
+        "state_hash": game.state_hash(),
+    }
+
+
+########
+# FARM #
+########
+def run_farm(runs: int, frames: int, workers: int, replay=None, seed: int = 0):
+    """
+    Spread runs over a process pool. Returns (list of run metrics, wall seconds).
+    """
+    run_specs = [(seed + index, frames, replay) for index in range(runs)]
+    # big chunks = less ipc, still enough chunks to balance the workers
+    chunksize = max(1, runs // (workers * 4))
+
+    start = time.perf_counter()
+    # spawn = every worker gets a clean SDL state
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker
+    ) as pool:
+        results = list(pool.map(run_playthrough, run_specs, chunksize=chunksize))
+    wall_seconds = time.perf_counter() - start
+
+    return results, wall_seconds
+
+
+def report(results, wall_seconds, workers):
+    """
+    Print the aggregate of 1 farm run.
+    """
+    total_frames = sum(result["frames"] for result in results)
+    mean_run_fps = sum(result["fps"] for result in results) / len(results)
+    distinct_hashes = len({result["state_hash"] for result in results})
+    print(
+        f"workers {workers:3d} | runs {len(results):6d} | wall {wall_seconds:8.2f}s | "
+        f"runs/s {len(results) / wall_seconds:8.1f} | sim frames/s {total_frames / wall_seconds:10.0f} | "
+        f"mean run fps {mean_run_fps:8.0f} | distinct hashes {distinct_hashes}"
+    )
+    return total_frames / wall_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless simulation farm for the Test scene.")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--replay", help="json file, list of held key names per frame")
+    parser.add_argument("--scaling", action="store_true", help="repeat with 1, 2, 4 .. workers")
+    parser.add_argument("--out", help="write every run metrics to this json file")
+    args = parser.parse_args()
+
+    replay = None
+    if args.replay:
+        with open(args.replay) as file:
+            replay = json.load(file)
+
+    # 1, 2, 4 .. workers, always ending with the requested count
+    worker_counts = [args.workers]
+    if args.scaling:
+        worker_counts = []
+        count = 1
+        while count < args.workers:
+            worker_counts.append(count)
+            count *= 2
+        worker_counts.append(args.workers)
+
+    baseline = None
+    for workers in worker_counts:
+        results, wall_seconds = run_farm(args.runs, args.frames, workers, replay, args.seed)
+        throughput = report(results, wall_seconds, workers)
+        baseline = baseline or throughput
+        if args.scaling:
+            print(f"    speedup x{throughput / baseline:.2f} (ideal x{workers / worker_counts[0]:.0f})")
+
+    if args.out:
+        with open(args.out, "w") as file:
+            json.dump(results, file, indent=1)
+
+
+if __name__ == "__main__":
+    main()
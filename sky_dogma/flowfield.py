@@ -0,0 +1,225 @@
+import math
+import time
+
+import numpy as np  # optional, the game runs without it (Test skips the flow field)
+
+from sky_dogma.constants import BACKGROUND_WIDTH, NATIVE_RESOLUTION, ONE_TILE
+
+"""
+Flow field over the play area (BACKGROUND_WIDTH x NATIVE_RESOLUTION[1] in ONE_TILE cells), toward 1 target (the player).
+Every cell stores its distance to the target cell (8 neighbours, diagonals cost sqrt 2, no corner cutting past
+obstacles) and the unit direction to its best neighbour. Homing things sample it, any number of them in 1 lookup.
+Recomputed only when the target changes cell or obstacles change, warm started where that is valid:
+- target moved: old distance + old distance of the new target cell is still an upper bound (triangle inequality)
+- obstacles removed: old distances are still upper bounds
+- obstacles added: distances may grow, full recompute
+The target cell always counts as open (the player flies over obstacles, homing things still reach it).
+Relaxation only lowers values, so from any upper bound it converges to the same field as from scratch.
+"""
+
+COLS = math.ceil(BACKGROUND_WIDTH / ONE_TILE)
+ROWS = math.ceil(NATIVE_RESOLUTION[1] / ONE_TILE)
+
+# neighbours, (row, col) offsets, orthogonal first
+OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+COSTS = np.array([1.0] * 4 + [math.sqrt(2.0)] * 4)
+DIRECTION_X = np.array([col / math.hypot(row, col) for row, col in OFFSETS], dtype=np.float32)
+DIRECTION_Y = np.array([row / math.hypot(row, col) for row, col in OFFSETS], dtype=np.float32)
+
+
+class FlowField:
+    """
+    Goes in an UpdateLayer, follows its target like the Camera does.
+    """
+    def __init__(self, cols: int = COLS, rows: int = ROWS, cell_size: int = ONE_TILE):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.target = None
+        self.target_cell = None  # (col, row) the field was computed for
+
+        self.blocked = np.zeros((rows, cols), dtype=bool)
+        self.distance = np.full((rows, cols), np.inf)
+        self.direction_x = np.zeros((rows, cols), dtype=np.float32)
+        self.direction_y = np.zeros((rows, cols), dtype=np.float32)
+        # key = neighbour index | val = (rows, cols) step cost to that neighbour, inf = not allowed
+        self.move_costs = self.allowed_moves(None)
+        self.padded = np.full((rows + 2, cols + 2), np.inf)  # reused, inf border = outside
+        self.is_blocked_dirty = False  # obstacles added since the last compute
+        self.is_freed_dirty = False  # obstacles removed since the last compute
+
+        # stats
+        self.full_count = 0
+        self.warm_count = 0
+        self.iteration_count = 0
+        self.compute_seconds = 0.0
+
+    ###########
+    # METHODS #
+    ###########
+    def set_target(self, target):
+        """
+        Target = a node with a rect (a Sprite child = its frame center is used, rects of sheets are sheet wide).
+        """
+        self.target = target
+
+    def set_blocked(self, col: int, row: int, is_blocked: bool = True):
+        if self.blocked[row, col] == is_blocked:
+            return
+        self.blocked[row, col] = is_blocked
+        if is_blocked:
+            self.is_blocked_dirty = True
+        else:
+            self.is_freed_dirty = True
+
+    def set_blocked_rect(self, rect, is_blocked: bool = True):
+        """
+        Every cell the world space rect touches.
+        """
+        left = max(0, int(rect.left // self.cell_size))
+        top = max(0, int(rect.top // self.cell_size))
+        right = min(self.cols, int(math.ceil(rect.right / self.cell_size)))
+        bottom = min(self.rows, int(math.ceil(rect.bottom / self.cell_size)))
+        for row in range(top, bottom):
+            for col in range(left, right):
+                self.set_blocked(col, row, is_blocked)
+
+    def update(self, delta):
+        """
+        Recompute if the target changed cell or obstacles changed, else nothing.
+        """
+        if self.target is None:
+            return
+        x, y = self.target_point()
+        cell = (
+            min(self.cols - 1, max(0, int(x // self.cell_size))),
+            min(self.rows - 1, max(0, int(y // self.cell_size)))
+        )
+        if cell != self.target_cell or self.is_blocked_dirty or self.is_freed_dirty:
+            self.compute(cell)
+
+    def compute(self, cell):
+        """
+        Distances + directions toward cell, warm started from the last field when valid.
+        """
+        start = time.perf_counter()
+        col, row = cell
+        # a blocked target cell is open while it is the target, leaving it blocks it again
+        was_open = self.target_cell is not None and self.blocked[self.target_cell[1], self.target_cell[0]]
+        if self.is_blocked_dirty or self.is_freed_dirty or was_open or self.blocked[row, col]:
+            self.move_costs = self.allowed_moves(cell)
+        distance = self.distance
+        is_warm = (
+            not self.is_blocked_dirty and not was_open and self.target_cell is not None
+            and np.isfinite(distance[row, col])
+        )
+        if is_warm:
+            distance += distance[row, col]  # upper bound
+            self.warm_count += 1
+        else:
+            distance.fill(np.inf)
+            self.full_count += 1
+        distance[self.blocked] = np.inf
+        distance[row, col] = 0.0
+
+        # relax until nothing gets shorter
+        padded = self.padded
+        inner = padded[1:-1, 1:-1]
+        views = tuple(zip(self.neighbour_views(padded), self.move_costs))
+        best = np.empty_like(distance)
+        step = np.empty_like(distance)
+        while True:
+            self.iteration_count += 1
+            inner[...] = distance
+            best[...] = distance
+            for candidate, move_cost in views:
+                np.add(candidate, move_cost, out=step)
+                np.minimum(best, step, out=best)
+            if not (best < distance).any():
+                break
+            distance[...] = best
+
+        # directions, toward the cheapest neighbour (none at the target and unreachable cells)
+        inner[...] = distance
+        candidates = np.stack([candidate + move_cost for candidate, move_cost in views])
+        nearest = candidates.argmin(axis=0)
+        is_moving = np.isfinite(distance) & (distance > 0.0)
+        self.direction_x[...] = np.where(is_moving, DIRECTION_X[nearest], 0.0)
+        self.direction_y[...] = np.where(is_moving, DIRECTION_Y[nearest], 0.0)
+
+        self.target_cell = cell
+        self.is_blocked_dirty = False
+        self.is_freed_dirty = False
+        self.compute_seconds += time.perf_counter() - start
+
+    def neighbour_views(self, padded):
+        """
+        Per neighbour offset, a (rows, cols) view of padded where every cell sees that neighbour.
+        """
+        rows, cols = self.rows, self.cols
+        return [padded[1 + row:1 + row + rows, 1 + col:1 + col + cols] for row, col in OFFSETS]
+
+    def allowed_moves(self, cell):
+        """
+        Per neighbour offset, the step cost to it, inf where stepping there is not allowed: outside, blocked (the
+        target cell never is), diagonals past a blocked side.
+        """
+        free = np.zeros((self.rows + 2, self.cols + 2), dtype=bool)
+        free[1:-1, 1:-1] = ~self.blocked
+        if cell is not None:
+            free[1 + cell[1], 1 + cell[0]] = True
+        views = self.neighbour_views(free)
+        up, down, left, right = views[:4]
+        allowed = (
+            up, down, left, right,
+            views[4] & up & left, views[5] & up & right,
+            views[6] & down & left, views[7] & down & right,
+        )
+        return [np.where(is_allowed, cost, np.inf) for is_allowed, cost in zip(allowed, COSTS)]
+
+    def sample(self, xs, ys):
+        """
+        Unit directions (dx, dy float32 arrays) for world positions xs, ys. Positions in the target cell get a direct
+        vector to the target point, blocked / unreachable ones get 0.
+        """
+        xs = np.asarray(xs, dtype=np.float32)
+        ys = np.asarray(ys, dtype=np.float32)
+        cols = np.clip((xs // self.cell_size).astype(np.intp), 0, self.cols - 1)
+        rows = np.clip((ys // self.cell_size).astype(np.intp), 0, self.rows - 1)
+        dx = self.direction_x[rows, cols]
+        dy = self.direction_y[rows, cols]
+
+        if self.target_cell is not None:
+            is_home = (cols == self.target_cell[0]) & (rows == self.target_cell[1])
+            if is_home.any():
+                target_x, target_y = self.target_point()
+                home_x = target_x - xs[is_home]
+                home_y = target_y - ys[is_home]
+                length = np.maximum(np.hypot(home_x, home_y), 1e-6)
+                dx[is_home] = home_x / length
+                dy[is_home] = home_y / length
+        return dx, dy
+
+    ###########
+    # GETTERS #
+    ###########
+    def target_point(self):
+        target = self.target
+        sprite = getattr(target, "Sprite", None)
+        if sprite is not None:
+            return target.rect.x + sprite.frame_width / 2, target.rect.y + sprite.frame_height / 2
+        return target.rect.centerx, target.rect.centery
+
+    def stats(self):
+        """
+        Recomputes so far (full / warm), relaxation passes and total ms.
+        """
+        return {
+            "full": self.full_count,
+            "warm": self.warm_count,
+            "iterations": self.iteration_count,
+            "compute_ms": self.compute_seconds * 1000.0,
+        }
@@ -0,0 +1,343 @@
+import pygame as pg  # https://pyga.me/docs/
+import time
+import random
+import struct
+import hashlib
+import argparse
+
+import sky_dogma
+from sky_dogma import autoload
+from sky_dogma.constants import FPS, NATIVE_RESOLUTION, DEBUG_KEY, DEBUG_KEY_IN_GAME
+from sky_dogma.backends import BACKENDS, SCALERS, NEAREST, SurfaceBackend, TextureBackend
+from sky_dogma.events import EventBus, SceneChangeRequested
+from sky_dogma.gc_policy import GCPolicy, MODES, MANUAL
+from sky_dogma.misc import Input, Camera, layer_stats, cull_stats
+from sky_dogma.pacing import FramePacer, STRATEGIES, HYBRID, VSYNC
+from sky_dogma.presenter import Presenter, DROP_OLDEST, BLOCK
+from sky_dogma.quality import QualityGovernor, TIER_NAMES
+from sky_dogma.recorder import Recorder, FORMATS, DELTA
+from sky_dogma.scenes import SceneManager, PauseMenu, MadeBySplash
+
+
+DEBUG_TIERS = (True, True, True, False)  # debug overlays allowed, quality governor knob, high -> minimal
+
+
+def set_debug_allowed(is_allowed: bool):
+    autoload.is_debug_allowed = is_allowed
+    if not is_allowed:
+        autoload.is_debug = False
+        autoload.is_debug_in_game = False
+
+
+########
+# GAME #
+########
+class Game:
+    """
+    One game instance. Owns its canvas, render backend and autoloads (Cam, EventBus, Input, SceneManager, PauseMenu).
+    The autoload globals are rebound to the active instance, so many games can live in 1 process.
+    Does not need a window unless present / run is called.
+    """
+    # snapshot: frame count, is paused, rng (mersenne twister words + position), then the scene state
+    STATE = struct.Struct("<Q?")
+    RNG_STATE = struct.Struct("<625I")
+
+    def __init__(self, first_scene=None, backend=None, seed: int = 0):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.is_running = True
+        self.frame_count = 0
+        self.rng = random.Random(seed)  # gameplay randomness goes through this, so it is seeded + snapshotted
+        self.held_keys = set()  # for scripted input, keys held in the last step
+        self.pacer = None  # set by run
+
+        # own canvas + autoloads
+        self.NATIVE_SURFACE = pg.Surface(NATIVE_RESOLUTION)
+        self.Backend = backend or SurfaceBackend()
+        self.Cam = Camera()
+        self.EventBus = EventBus()
+        self.Input = Input()
+        self.SceneManager = SceneManager()
+        self.PauseMenu = PauseMenu()
+        # scene scripts ask for scene changes, applied at dispatch like any listener
+        self.EventBus.subscribe(SceneChangeRequested, self.SceneManager.on_scene_change_requested)
+
+        if autoload.GOVERNOR is not None:
+            autoload.GOVERNOR.register("debug_overlays", DEBUG_TIERS, set_debug_allowed)
+
+        # scenes talk to the autoloads, activate before building the first one
+        self.activate()
+        self.SceneManager.change_scene_to((first_scene or MadeBySplash)())
+
+    ###########
+    # METHODS #
+    ###########
+    def activate(self):
+        """
+        Rebind the autoload globals to this instance. Call before touching any of its objects.
+        """
+        autoload.NATIVE_SURFACE = self.NATIVE_SURFACE
+        autoload.Backend = self.Backend
+        autoload.Cam = self.Cam
+        autoload.EventBus = self.EventBus
+        autoload.Input = self.Input
+        autoload.SceneManager = self.SceneManager
+        autoload.PauseMenu = self.PauseMenu
+
+    def step(self, delta, events=(), is_drawing=True):
+        """
+        Advance 1 frame: events -> clear -> update -> dispatch event bus -> draw. Draws through the backend, does not present.
+        is_drawing = False skips clear + draw (frames nobody looks at, like skipped agent frames), simulation is the same.
+        """
+        self.activate()
+
+        # EVENTS
+        for event in events:
+            # check window x button clicked
+            if event.type == pg.QUIT:
+                self.is_running = False
+            # update manager
+            self.Input.update(event)
+            # DEBUG TRIGGER
+            autoload.is_debug_in_game = autoload.is_debug_allowed and self.Input.is_action_pressed(DEBUG_KEY_IN_GAME)
+            autoload.is_debug = autoload.is_debug_allowed and self.Input.is_action_pressed(DEBUG_KEY)
+
+        # CLEAR
+        if is_drawing:
+            self.Backend.clear("blue4")
+
+        # UPDATE
+        self.SceneManager.current_scene.update(delta)
+        self.PauseMenu.update(delta)
+
+        # DISPATCH (listeners run here, never in the middle of an update)
+        self.EventBus.dispatch()
+
+        # DRAW
+        if is_drawing:
+            self.draw()
+
+        # STATS (static layer cache, culling, per frame)
+        layer_stats.end_frame()
+        cull_stats.end_frame()
+
+        # AUDIO (same sound twice in 1 frame plays once)
+        if autoload.AUDIO is not None:
+            autoload.AUDIO.end_frame()
+
+        self.frame_count += 1
+
+    def draw(self):
+        """
+        Scene + pause menu + debug lines onto the canvas.
+        """
+        self.SceneManager.current_scene.draw()
+        self.PauseMenu.draw()
+
+        # DEBUG
+        if autoload.is_debug_in_game:
+            # draw on viewport, 2 lines in mid horizontal and mid vertical (FOR GAMEPLAY - HAS WIDE BG)
+            self.Backend.draw_line("red", (167, 0), (167, 180), 2)
+            self.Backend.draw_line("red", (0, 89), (320, 89), 2)
+        if autoload.is_debug:
+            # (FOR VIEWPORT)
+            self.Backend.draw_line("red", (159, 0), (159, 180), 2)
+            self.Backend.draw_line("red", (0, 89), (320, 89), 2)
+
+    def present(self):
+        """
+        Show the frame in the window (the surface backend opens it on first call).
+        """
+        self.activate()
+        self.Backend.present()
+
+    def present_pipelined(self, presenter):
+        """
+        Hand the frame just drawn to the presenter thread, draw the next one into a free buffer.
+        """
+        presenter.submit(self.NATIVE_SURFACE)
+        self.NATIVE_SURFACE = presenter.acquire()
+
+    def run(self, frames=None, presenter=None, pacer=None, recorder=None):
+        """
+        Real time loop, 60 FPS limit, reads the window events. Frames = stop after that many (None = until closed).
+        Presenter = scale + flip on its own thread (see presenter.py), None = serial.
+        Pacer = FramePacer that waits for each frame (see pacing.py), None = a hybrid one.
+        Recorder = copy every frame to an encoder thread (see recorder.py), needs the surface backend.
+        Frame work time (everything but the pacing wait) goes to the quality governor when there is one.
+        """
+        self.pacer = pacer or FramePacer(FPS, HYBRID)
+        if presenter:
+            self.NATIVE_SURFACE = presenter.acquire()
+            presenter.start()
+        if recorder:
+            recorder.start()
+
+        while self.is_running and (frames is None or frames > 0):
+            # 60 FPS LIMIT
+            delta = self.pacer.tick()
+            work_start = time.perf_counter()
+            self.step(delta, pg.event.get())
+            if recorder:
+                recorder.capture(self.NATIVE_SURFACE)
+            if presenter:
+                self.present_pipelined(presenter)
+            else:
+                self.present()
+            # QUALITY (steps tiers on the frame work time)
+            if autoload.GOVERNOR is not None:
+                autoload.GOVERNOR.frame_done(self.frame_count, time.perf_counter() - work_start)
+            # IDLE (gc in what is left of the frame budget)
+            if autoload.GC_POLICY is not None:
+                autoload.GC_POLICY.idle(self.frame_count, self.pacer.time_left())
+            if frames is not None:
+                frames -= 1
+
+        if presenter:
+            presenter.stop()
+        if recorder:
+            recorder.stop()
+
+    ##########
+    # HELPER #
+    ##########
+    def scripted_events(self, held_keys):
+        """
+        Turn the set of keys held this frame into KEYDOWN / KEYUP events (diffed against last call).
+        """
+        held_keys = set(held_keys)
+        events = [pg.event.Event(pg.KEYDOWN, key=key) for key in sorted(held_keys - self.held_keys)]
+        events += [pg.event.Event(pg.KEYUP, key=key) for key in sorted(self.held_keys - held_keys)]
+        self.held_keys = held_keys
+        return events
+
+    def save_state(self, buffer, offset: int = 0):
+        """
+        Pack the simulation state into buffer at offset (see snapshot.py), return the offset after it.
+        Scenes without save_state (splashes) only get the game part.
+        """
+        self.activate()
+        self.STATE.pack_into(buffer, offset, self.frame_count, self.PauseMenu.is_paused)
+        offset += self.STATE.size
+        # gauss cache (only random.gauss uses it) is not kept
+        _, words, _ = self.rng.getstate()
+        self.RNG_STATE.pack_into(buffer, offset, *words)
+        offset += self.RNG_STATE.size
+        scene = self.SceneManager.current_scene
+        if hasattr(scene, "save_state"):
+            offset = scene.save_state(buffer, offset)
+        return offset
+
+    def load_state(self, buffer, offset: int = 0):
+        """
+        Inverse of save_state, in place, into the same scene that saved it.
+        """
+        self.activate()
+        self.frame_count, is_paused = self.STATE.unpack_from(buffer, offset)
+        if is_paused != self.PauseMenu.is_paused:
+            self.PauseMenu.is_paused = is_paused
+        offset += self.STATE.size
+        self.rng.setstate((3, self.RNG_STATE.unpack_from(buffer, offset), None))
+        offset += self.RNG_STATE.size
+        scene = self.SceneManager.current_scene
+        if hasattr(scene, "load_state"):
+            offset = scene.load_state(buffer, offset)
+        # events of the abandoned future must not reach the restored past
+        self.EventBus.clear()
+        return offset
+
+    def state_hash(self):
+        """
+        Hash of what this game shows right now + its frame count. Same input = same hash.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.frame_count.to_bytes(8, "little"))
+        digest.update(pg.image.tobytes(self.NATIVE_SURFACE, "RGB"))
+        return digest.hexdigest()
+
+
+########
+# MAIN #
+########
+def main():
+    """
+    Entry point. Opens the window and runs the game from the first scene.
+    """
+    parser = argparse.ArgumentParser(description="Sky Dogma")
+    parser.add_argument("--startup-report", action="store_true", help="print cold start time by phase")
+    parser.add_argument("--frames", type=int, help="quit after this many frames")
+    parser.add_argument("--pipelined", action="store_true", help="scale + flip on a presenter thread")
+    parser.add_argument("--drop-policy", choices=(DROP_OLDEST, BLOCK), default=DROP_OLDEST)
+    parser.add_argument("--backend", choices=tuple(BACKENDS), default=SurfaceBackend.name)
+    parser.add_argument("--software", action="store_true", help="texture backend on the SDL software renderer")
+    parser.add_argument("--scaler", choices=SCALERS, default=NEAREST, help="surface backend upscaling (epx = smoothed, slower)")
+    parser.add_argument("--pacing", choices=STRATEGIES, default=HYBRID, help="vsync needs the texture backend")
+    parser.add_argument("--pacing-report", action="store_true", help="print frame time stats on quit")
+    parser.add_argument("--no-bundle", action="store_true", help="decode pngs / render labels instead of mapping the asset bundle")
+    parser.add_argument("--indexed", action="store_true", help="draw the pixel art sheets from 8 bit paletted copies")
+    parser.add_argument("--record", metavar="PATH", help="record gameplay to PATH (file, directory for png)")
+    parser.add_argument("--record-format", choices=FORMATS, default=DELTA)
+    parser.add_argument("--record-policy", choices=(DROP_OLDEST, BLOCK), default=BLOCK, help="when the encoder falls behind")
+    parser.add_argument("--gc", choices=MODES, default=MANUAL, help="garbage collector mode in gameplay scenes")
+    parser.add_argument("--gc-report", action="store_true", help="print every gc collection stats on quit")
+    parser.add_argument("--quality", choices=("auto",) + TIER_NAMES, help="auto = adapt to the frame budget, else pin a tier (default: no governor)")
+    parser.add_argument("--quality-report", action="store_true", help="print quality tier changes on quit")
+    args = parser.parse_args()
+    if args.pipelined and args.backend != SurfaceBackend.name:
+        parser.error("--pipelined needs the surface backend")
+    if args.record and args.backend != SurfaceBackend.name:
+        parser.error("--record needs the surface backend")
+    autoload.is_bundle_enabled = not args.no_bundle
+    autoload.is_indexed_enabled = args.indexed
+
+    # everything up to here was imports
+    autoload.startup_phases.append((0, "import", time.perf_counter() - sky_dogma.STARTUP_START))
+
+    # before the backend + game, they register their knobs
+    if args.quality == "auto":
+        autoload.GOVERNOR = QualityGovernor()
+    elif args.quality:
+        autoload.GOVERNOR = QualityGovernor(TIER_NAMES.index(args.quality), is_adaptive=False)
+
+    if args.backend == TextureBackend.name:
+        with autoload.timed_phase("display"):
+            backend = TextureBackend(software=args.software, vsync=args.pacing == VSYNC)
+    else:
+        backend = SurfaceBackend(args.scaler)
+        autoload.get_display_surface()
+
+    autoload.GC_POLICY = GCPolicy(args.gc)
+
+    # FIRST SCENE
+    with autoload.timed_phase("first scene"):
+        game = Game(MadeBySplash, backend)
+
+    with autoload.timed_phase("first frame"):
+        game.step(0.0, pg.event.get())
+        game.present()
+
+    if args.startup_report:
+        print(autoload.startup_report())
+
+    presenter = None
+    if args.pipelined:
+        presenter = Presenter(autoload.get_display_surface(), args.drop_policy)
+
+    recorder = None
+    if args.record:
+        recorder = Recorder(args.record, args.record_format, args.record_policy)
+
+    pacer = FramePacer(FPS, args.pacing)
+    game.run(None if args.frames is None else args.frames - 1, presenter, pacer, recorder)
+    if args.pacing_report:
+        print(pacer.report())
+    if recorder:
+        print(recorder.report())
+    if args.gc_report:
+        print(autoload.GC_POLICY.report())
+    if args.quality_report and autoload.GOVERNOR is not None:
+        print(autoload.GOVERNOR.report())
+    autoload.GC_POLICY.close()
+    backend.close()
+    pg.quit()
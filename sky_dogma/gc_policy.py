@@ -0,0 +1,149 @@
+import gc
+import time
+from collections import deque
+
+"""
+Garbage collector policy. Scene loading makes most of the long lived objects, so after every scene change the heap is
+collected once and frozen (gc.freeze, later passes skip it). During gameplay scenes (is_gameplay = True) automatic
+collection is tuned or off and young generations are collected in the idle time left before the next frame deadline.
+Every collection (automatic or not) is logged with its frame, generation and duration, to prove the hitches are gone.
+AUTO = python defaults everywhere
+TUNED = gameplay runs with higher thresholds, still automatic
+MANUAL = gameplay runs with automatic collection off, only idle collections (+ a safety net when there is never idle time)
+"""
+
+AUTO = "auto"
+TUNED = "tuned"
+MANUAL = "manual"
+MODES = (AUTO, TUNED, MANUAL)
+
+TUNED_THRESHOLDS = (20000, 20, 100)
+SAFETY_FACTOR = 20  # manual: gen 0 past this many times its threshold is collected even without idle time
+MIN_COST = 0.00005  # s, assumed cost of a generation never collected yet
+
+
+class GCPolicy:
+    """
+    1 per process (the collector is). SceneManager calls scene_changed, Game.run calls idle once per frame.
+    """
+    def __init__(self, mode: str = MANUAL, history: int = 4096):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.mode = mode
+        self.default_thresholds = gc.get_threshold()
+        self.is_gameplay = False
+        self.frame = 0  # frame collections are logged in
+        self.reason = None  # why the running collection was started, None = python did (automatic)
+        self.cost = [MIN_COST, MIN_COST, MIN_COST]  # s, moving average per generation
+
+        # log, (frame, generation, ms, collected, reason = auto / idle / load)
+        self.collections = deque(maxlen=history)
+        self.start_time = 0.0
+        self.freeze_count = 0
+        gc.callbacks.append(self.on_gc)
+
+    ###########
+    # METHODS #
+    ###########
+    def scene_changed(self, scene):
+        """
+        New scene is built: forget the old scene, collect its garbage, freeze what is left, apply the scene mode.
+        """
+        gc.unfreeze()
+        self.reason = "load"
+        gc.collect()
+        self.reason = None
+        gc.freeze()
+        self.freeze_count = gc.get_freeze_count()
+
+        self.is_gameplay = getattr(scene, "is_gameplay", False)
+        if not self.is_gameplay or self.mode == AUTO:
+            gc.set_threshold(*self.default_thresholds)
+            gc.enable()
+        elif self.mode == TUNED:
+            gc.set_threshold(*TUNED_THRESHOLDS)
+            gc.enable()
+        else:
+            gc.set_threshold(*self.default_thresholds)  # still what idle compares counts to
+            gc.disable()
+
+    def idle(self, frame: int, budget: float):
+        """
+        Frame is done, budget (s) left until the next one. Manual gameplay: collect the oldest generation that is due
+        and fits in the budget (young ones are cheap, gen 2 only fits on long idle frames).
+        """
+        self.frame = frame
+        if not self.is_gameplay or self.mode != MANUAL:
+            return
+
+        counts = gc.get_count()
+        thresholds = self.default_thresholds
+        generation = None
+        for candidate in (2, 1, 0):
+            if counts[candidate] >= thresholds[candidate] and self.cost[candidate] < budget:
+                generation = candidate
+                break
+        if generation is None and counts[0] >= thresholds[0] * SAFETY_FACTOR:
+            generation = 0
+        if generation is None:
+            return
+
+        self.reason = "idle"
+        gc.collect(generation)
+        self.reason = None
+
+    def on_gc(self, phase: str, info: dict):
+        """
+        gc.callbacks hook, times every collection.
+        """
+        if phase == "start":
+            self.start_time = time.perf_counter()
+            return
+        seconds = time.perf_counter() - self.start_time
+        generation = info["generation"]
+        self.cost[generation] += (seconds - self.cost[generation]) * 0.2
+        self.collections.append((self.frame, generation, seconds * 1000.0, info["collected"], self.reason or "auto"))
+
+    def close(self):
+        """
+        Unhook and give python its defaults back.
+        """
+        if self.on_gc in gc.callbacks:
+            gc.callbacks.remove(self.on_gc)
+        gc.unfreeze()
+        gc.set_threshold(*self.default_thresholds)
+        gc.enable()
+
+    ###########
+    # GETTERS #
+    ###########
+    def stats(self):
+        """
+        Per generation: collections by reason, total / max ms. Hitches = automatic ones (in the middle of a frame).
+        """
+        stats = {
+            generation: {"auto": 0, "idle": 0, "load": 0, "total_ms": 0.0, "max_ms": 0.0}
+            for generation in range(3)
+        }
+        for _, generation, ms, _, reason in self.collections:
+            generation_stats = stats[generation]
+            generation_stats[reason] += 1
+            generation_stats["total_ms"] += ms
+            generation_stats["max_ms"] = max(generation_stats["max_ms"], ms)
+        return stats
+
+    def report(self):
+        """
+        Stats as a printable block + the worst automatic collections.
+        """
+        lines = [f"GC {self.mode} | frozen {self.freeze_count} objects"]
+        for generation, stats in self.stats().items():
+            lines.append(
+                f"  gen {generation} auto {stats['auto']:6d} | idle {stats['idle']:6d} | load {stats['load']:3d} | "
+                f"total {stats['total_ms']:8.2f} ms | max {stats['max_ms']:6.3f} ms"
+            )
+        hitches = sorted((entry for entry in self.collections if entry[4] == "auto"), key=lambda entry: entry[2], reverse=True)
+        for frame, generation, ms, collected, _ in hitches[:5]:
+            lines.append(f"  frame {frame:6d} gen {generation} {ms:6.3f} ms ({collected} collected) automatic")
+        return "\n".join(lines)
@@ -0,0 +1,46 @@
+import pygame as pg  # https://pyga.me/docs/
+
+
+##########
+# HELPER #
+##########
+def lerp(start: float, end: float, weight: float):
+    """
+    Linear interpolation.
+    """
+    out = start + (end - start) * weight
+    if abs(out) < 1:
+        out = 0
+    return out
+
+def Sign(value):
+    """
+    Return value sign.
+    """
+    if value > 0:
+        return 1
+    elif value < 0:
+        return -1
+    else:
+        return 0
+
+def apply_flash_shader(surface, color=(0, 0, 0, 255)):
+    """
+    Apply a flash shader to given surface by blending it with a given color.
+    """
+    # copy surface (so does not change original)
+    surface_copy = surface.copy()
+
+    # check each pixel, turn non-transparent pixels to given color
+    for y in range(surface_copy.get_height()):
+        for x in range(surface_copy.get_width()):
+            pixel = surface_copy.get_at((x, y))
+            # pixel is non-transparent? set color
+            if pixel[3] != 0:
+                surface_copy.set_at((x, y), color)
+
+    # blit surface copy to output surface
+    output_surface = pg.Surface(surface_copy.get_size(), pg.SRCALPHA)
+    output_surface.blit(surface_copy, (0, 0))
+
+    return output_surface
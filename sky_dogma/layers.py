@@ -0,0 +1,223 @@
+from bisect import bisect_left, bisect_right, insort
+
+from sky_dogma import autoload
+from sky_dogma.constants import NATIVE_RESOLUTION, ONE_TILE
+from sky_dogma.events import ViewEntered, ViewExited
+
+"""
+Z ordered render layers. Every z is a bucket drawn in z order (lowest first), inside a bucket nodes draw in add order,
+or by rect.y (top edge, smaller = further back) for y sorted buckets, ties in add order (stable).
+Y sorted buckets keep their nodes sorted between frames: draw scans for nodes whose y changed and moves only those
+(bisect + insert in the sorted keys), a few moved nodes in thousands never pay a full sort. Past 1 in RESORT_SHARE
+moved it is cheaper to sort everything once (Timsort on mostly sorted keys).
+Culling: the sorted keys double as a spatial index along y, a y sorted bucket draws only the nodes whose y is within
+cull_margin of the camera view (2 bisects), the rest are not even called (a big bucket that wants culling is made y
+sorted, its order is the index). Sprites cull themselves precisely on top of that (Sprite.draw).
+View tracked buckets post ViewEntered / ViewExited (source = the node) when a node frame starts / stops overlapping
+the view, from draw, so listeners get them next tick.
+"""
+
+# z of what a top down shooter draws, gaps left for in betweens
+Z_BACKGROUND = 0
+Z_SHADOWS = 10
+Z_SHIPS = 20
+Z_EXPLOSIONS = 30
+Z_BULLETS = 40
+Z_UI = 50
+
+RESORT_SHARE = 8
+CULL_MARGIN = 4 * ONE_TILE  # px a node may draw away from its rect.y (own height + children below it)
+VIEW_WIDTH, VIEW_HEIGHT = NATIVE_RESOLUTION
+
+
+class RenderLayer:
+    """
+    1 z bucket. Keys = (y, add order) per node, same order as nodes (y sorted only).
+    Cull margin None = every node is drawn, visible = nodes in view last frame (view tracked only, else None).
+    """
+    __slots__ = ("z", "is_y_sorted", "is_visible", "nodes", "keys", "cull_margin", "visible")
+
+    def __init__(self, z: int, is_y_sorted: bool, cull_margin=None, is_view_tracked: bool = False):
+        self.z = z
+        self.is_y_sorted = is_y_sorted
+        self.is_visible = True
+        self.nodes = []
+        self.keys = []
+        self.cull_margin = cull_margin
+        self.visible = set() if is_view_tracked else None
+
+
+class RenderLayers:
+    """
+    Drawn layer of a scene, like Group but ordered by z (+ y). Nodes need draw(), y sorted ones a rect too.
+    """
+    def __init__(self):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.layers = {}  # key = z | val = RenderLayer
+        self.order = []  # z ascending
+        self.node_layers = {}  # key = node | val = its RenderLayer
+        self.added_count = 0  # next add order
+
+        # stats
+        self.moved_count = 0  # last frame
+        self.culled_count = 0  # last frame, nodes out of the view range (never called)
+        self.full_sort_count = 0  # since start
+
+    ###########
+    # METHODS #
+    ###########
+    def add_layer(self, z: int, is_y_sorted: bool = False, cull_margin=CULL_MARGIN, is_view_tracked: bool = False):
+        """
+        Make the bucket for z (add makes plain ones on its own). Returns it.
+        Y sorted buckets are culled by y with cull_margin (None = never), view tracked ones post view events.
+        """
+        layer = self.layers.get(z)
+        if layer is None:
+            layer = RenderLayer(z, is_y_sorted, cull_margin if is_y_sorted else None, is_view_tracked)
+            self.layers[z] = layer
+            insort(self.order, z)
+        return layer
+
+    def add(self, *nodes, z: int = 0):
+        """
+        Put nodes in the z bucket, after what is there (y sorted: where their y goes). A node already in is moved.
+        """
+        layer = self.add_layer(z)
+        for node in nodes:
+            if node in self.node_layers:
+                self.remove(node)
+            self.node_layers[node] = layer
+            if layer.is_y_sorted:
+                key = (node.rect.y, self.added_count)
+                index = bisect_right(layer.keys, key)
+                layer.keys.insert(index, key)
+                layer.nodes.insert(index, node)
+            else:
+                layer.nodes.append(node)
+            self.added_count += 1
+
+    def remove(self, *nodes):
+        for node in nodes:
+            layer = self.node_layers.pop(node, None)
+            if layer is None:
+                continue
+            index = layer.nodes.index(node)
+            del layer.nodes[index]
+            if layer.is_y_sorted:
+                del layer.keys[index]
+            if layer.visible is not None:
+                layer.visible.discard(node)
+
+    def set_visible(self, z: int, is_visible: bool):
+        self.add_layer(z).is_visible = is_visible
+
+    def sort(self, layer: RenderLayer):
+        """
+        Bring a y sorted bucket up to date with its nodes y. Returns how many moved.
+        """
+        nodes, keys = layer.nodes, layer.keys
+        ys = [node.rect.y for node in nodes]
+        moved = [index for index, (y, key) in enumerate(zip(ys, keys)) if y != key[0]]
+        if not moved:
+            return 0
+
+        # many moved, 1 sort of everything
+        if len(moved) * RESORT_SHARE > len(nodes):
+            keys = [(y, key[1]) for y, key in zip(ys, keys)]
+            order = sorted(range(len(nodes)), key=keys.__getitem__)
+            layer.keys = [keys[index] for index in order]
+            layer.nodes = [nodes[index] for index in order]
+            self.full_sort_count += 1
+            return len(moved)
+
+        # few moved, take them out (back to front, indices stay valid), put them back where their y goes
+        entries = [(nodes[index], keys[index][1]) for index in moved]
+        for index in reversed(moved):
+            del nodes[index]
+            del keys[index]
+        for node, added in entries:
+            key = (node.rect.y, added)
+            index = bisect_right(keys, key)
+            keys.insert(index, key)
+            nodes.insert(index, node)
+        return len(moved)
+
+    def draw(self):
+        """
+        Every visible bucket in z order, y sorted ones sorted (then culled) first.
+        """
+        moved_count = 0
+        culled_count = 0
+        camera = autoload.Cam.global_position
+        for z in self.order:
+            layer = self.layers[z]
+            if not layer.is_visible:
+                continue
+            nodes = layer.nodes
+            if layer.is_y_sorted:
+                moved_count += self.sort(layer)
+                nodes = layer.nodes
+                if layer.cull_margin is not None:
+                    # nodes whose y is in the view band (+ margin), 2 bisects on the sorted keys
+                    start = bisect_left(layer.keys, (camera.y - layer.cull_margin,))
+                    end = bisect_left(layer.keys, (camera.y + VIEW_HEIGHT + layer.cull_margin,))
+                    culled_count += len(nodes) - (end - start)
+                    nodes = nodes[start:end]
+            for node in nodes:
+                node.draw()
+            if layer.visible is not None:
+                self.track_view(layer, nodes, camera)
+        self.moved_count = moved_count
+        self.culled_count = culled_count
+
+    def track_view(self, layer: RenderLayer, nodes, camera):
+        """
+        Post ViewEntered / ViewExited for nodes of layer whose frame started / stopped overlapping the view.
+        Nodes = the ones drawn, the culled ones are out of view.
+        """
+        visible = set()
+        for node in nodes:
+            sprite = getattr(node, "Sprite", node)
+            x = node.rect.x - camera.x
+            y = node.rect.y - camera.y
+            width = getattr(sprite, "frame_width", node.rect.width)
+            height = getattr(sprite, "frame_height", node.rect.height)
+            if x < VIEW_WIDTH and y < VIEW_HEIGHT and x + width > 0 and y + height > 0:
+                visible.add(node)
+        for node in visible - layer.visible:
+            autoload.EventBus.post(ViewEntered(node))
+        for node in layer.visible - visible:
+            autoload.EventBus.post(ViewExited(node))
+        layer.visible = visible
+
+    ###########
+    # GETTERS #
+    ###########
+    def sprites(self):
+        """
+        Every node, in draw order (as of the last sort).
+        """
+        return [node for z in self.order for node in self.layers[z].nodes]
+
+    def __len__(self):
+        return len(self.node_layers)
+
+    def counts(self):
+        """
+        Nodes per z.
+        """
+        return {z: len(self.layers[z].nodes) for z in self.order}
+
+    def stats(self):
+        """
+        Per z counts, nodes moved / culled in y sorted buckets last frame, full sorts so far.
+        """
+        return {
+            "layers": self.counts(),
+            "sprites": len(self.node_layers),
+            "moved": self.moved_count,
+            "culled": self.culled_count,
+            "full_sorts": self.full_sort_count,
+        }
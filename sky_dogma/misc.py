@@ -0,0 +1,304 @@
+import pygame as pg  # https://pyga.me/docs/
+import struct
+
+from sky_dogma import autoload
+from sky_dogma.backends import SurfaceBackend
+from sky_dogma.constants import BACKGROUND_WIDTH, NATIVE_RESOLUTION, HALF_NATIVE_RESOLUTION
+from sky_dogma.helpers import lerp
+
+
+########
+# MISC #
+########
+class Input:
+    """
+    For all Input queries necessity.
+    """
+    def __init__(self):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.key_states = {}  # key: event.key | val: bool
+        self.was_pressed = False
+    
+    ###########
+    # METHODS #
+    ###########
+    def update(self, event):
+        """
+        Update the key_states dict with given event.
+        """
+        if event.type == pg.KEYDOWN:
+            self.key_states[event.key] = True
+        elif event.type == pg.KEYUP:
+            self.key_states[event.key] = False
+    
+    def is_action_pressed(self, key):
+        """
+        Return bool for held given key, expects key = pg.K_DOWN.
+        """
+        return self.key_states.get(key, False)
+    
+    def is_action_just_pressed(self, key):
+        """
+        Return bool for given key change state from not pressed to pressed, expects key = pg.K_DOWN.
+        """
+        if self.was_pressed == True and self.is_action_pressed(key) == False:
+            self.was_pressed = False
+        if self.was_pressed == False and self.is_action_pressed(key) == True:
+            self.was_pressed = True
+            return True
+
+
+class Node:
+    """
+    Slot based base for everything that goes in a Group (pg.sprite.Sprite always carries a __dict__ + a groups dict).
+    Subclasses list their attributes in __slots__. Nodes do not remember their groups, so there is no kill().
+    """
+    __slots__ = ()
+
+    # pg.sprite.Group calls these
+    def add_internal(self, group):
+        pass
+
+    def remove_internal(self, group):
+        pass
+
+
+class Camera(Node):
+    """
+    A point in space that can follow a target, things are drawn based on camera global position.
+    Camera is an illusion where things are drawn in respect to its global position.
+    This game camera only move sideways, left limit is always 0. Right limit is always 16 (bg is always 336 wide)
+    """
+    __slots__ = ("global_position", "target")
+
+    MOVEMENT_WEIGHT = 0.1
+    RIGHT_LIMIT = BACKGROUND_WIDTH - NATIVE_RESOLUTION[0]
+
+    # snapshot: global position (target is not state, scenes set it)
+    STATE = struct.Struct("<dd")
+
+    def __init__(self):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.global_position = pg.Vector2(0, 0)
+        self.target = None
+
+    ###########
+    # METHODS #
+    ###########
+    def update(self, delta):
+        """
+        Updates global position to approach target.
+        """
+        if self.target == None:
+            return
+        
+        # this game camera do not follow vertical movements
+        # centered_target_y = self.target.rect.y - HALF_NATIVE_RESOLUTION[1]
+        centered_target_x = self.target.rect.x - HALF_NATIVE_RESOLUTION[0]
+        
+        # this game camera do not follow vertical movements
+        # self.global_position.y = lerp(self.global_position.y, centered_target_y, self.MOVEMENT_WEIGHT)
+        self.global_position.x = lerp(self.global_position.x, centered_target_x, self.MOVEMENT_WEIGHT)
+
+        # camera limit
+        self.global_position.x = max(0, min(self.global_position.x, self.RIGHT_LIMIT))
+
+    def save_state(self, buffer, offset: int):
+        self.STATE.pack_into(buffer, offset, self.global_position.x, self.global_position.y)
+        return offset + self.STATE.size
+
+    def load_state(self, buffer, offset: int):
+        self.global_position.update(self.STATE.unpack_from(buffer, offset))
+        return offset + self.STATE.size
+
+    ##########
+    # SETTER #
+    ##########
+    def set_target(self, target: any):
+        self.target = target
+        centered_target_x = self.target.rect.x - HALF_NATIVE_RESOLUTION[0]
+        self.global_position.x = centered_target_x
+
+
+class LayerStats:
+    """
+    What static layers did: hits = cached surface reused, rebuilds = composited again,
+    direct = 1 member (drawn as is, already 1 blit), skipped = invisible / fully transparent.
+    frame = this frame so far, last_frame = the finished one, total = since start.
+    """
+    __slots__ = ("frame", "last_frame", "total")
+
+    KEYS = ("hits", "rebuilds", "direct", "skipped")
+
+    def __init__(self):
+        self.frame = dict.fromkeys(self.KEYS, 0)
+        self.last_frame = dict.fromkeys(self.KEYS, 0)
+        self.total = dict.fromkeys(self.KEYS, 0)
+
+    def count(self, key: str):
+        self.frame[key] += 1
+        self.total[key] += 1
+
+    def end_frame(self):
+        """
+        Called once per frame (Game.step).
+        """
+        self.last_frame, self.frame = self.frame, self.last_frame
+        for key in self.KEYS:
+            self.frame[key] = 0
+
+
+layer_stats = LayerStats()
+
+
+class CullStats:
+    """
+    Sprite draws: drawn = overlapped the camera view, culled = did not (skipped before any rect / blit).
+    Plain ints, every Sprite.draw counts. last_* = the finished frame, total_* = since start.
+    """
+    __slots__ = ("drawn", "culled", "last_drawn", "last_culled", "total_drawn", "total_culled")
+
+    def __init__(self):
+        self.drawn = self.culled = 0
+        self.last_drawn = self.last_culled = 0
+        self.total_drawn = self.total_culled = 0
+
+    def end_frame(self):
+        """
+        Called once per frame (Game.step).
+        """
+        self.last_drawn, self.last_culled = self.drawn, self.culled
+        self.total_drawn += self.drawn
+        self.total_culled += self.culled
+        self.drawn = self.culled = 0
+
+    def as_dict(self):
+        return {
+            "drawn": self.last_drawn, "culled": self.last_culled,
+            "total_drawn": self.total_drawn, "total_culled": self.total_culled,
+        }
+
+
+cull_stats = CullStats()
+
+# draws static layers into their cache surface (the active canvas is swapped for it while compositing)
+COMPOSITOR = SurfaceBackend()
+
+
+# for rendering & collision
+class Group(pg.sprite.Group):
+    """
+    Can act both as rendering and collision layer. Add entities in here.
+    Static = members are Sprites that rarely change. Drawn once into a cached canvas sized surface, then that surface
+    is the only blit, until a member position / frame / alpha / image or the camera changes. Only opaque / alpha 0
+    members are cached (from the first translucent one on, members draw directly), so the result is the same pixels.
+    Hidden (is_visible False) or fully transparent (every member alpha 0) layers draw nothing.
+    """
+    def __init__(self, *sprites, is_static: bool = False):
+        super().__init__(*sprites)
+        self.is_static = is_static
+        self.is_visible = True
+        self.cache = None  # composited members, static only
+        self.signature = None  # what the cache was made from
+
+    ###########
+    # METHODS #
+    ###########
+    def add(self, *sprites):
+        """
+        Members are Nodes, not pg.sprite.Sprite, so add them directly (pygame would probe them as iterables first).
+        """
+        for sprite in sprites:
+            if not self.has_internal(sprite):
+                self.add_internal(sprite)
+        self.signature = None
+
+    def remove(self, *sprites):
+        super().remove(*sprites)
+        self.signature = None
+
+    def invalidate(self):
+        """
+        Rebuild the cache on next draw (a member image pixels changed in place, that is not detected).
+        """
+        self.signature = None
+
+    def draw(self):
+        """
+        Override the default draw method to instead call the actor draw method, 
+        actor draw method needs the frame index data to draw certain section of their spritesheet.
+        Also for camera = offset where to draw things based on player position
+        """
+        if not self.is_visible:
+            if self.is_static:
+                layer_stats.count("skipped")
+            return
+
+        if self.is_static:
+            self.draw_static()
+            return
+
+        for spr in self.sprites():
+            # get player offset
+            spr.draw()
+
+    def draw_static(self):
+        """
+        Draw through the cache, composite again only when something it was made from changed.
+        """
+        sprites = self.sprites()
+        if not any(spr.alpha for spr in sprites):
+            layer_stats.count("skipped")
+            return
+
+        # the cache holds the leading members that land in it exactly: opaque or fully transparent ones (a translucent
+        # member blended into a transparent surface, then blended again onto the canvas, is not what direct drawing
+        # gives). The first translucent member and everything after it draw directly, on top, order is kept
+        cached_count = 0
+        for spr in sprites:
+            if spr.alpha != 0 and spr.alpha != 255:
+                break
+            cached_count += 1
+        cached = sprites[:cached_count]
+
+        # 1 visible member is 1 blit already, debug outlines must not be baked in
+        if sum(1 for spr in cached if spr.alpha) < 2 or autoload.is_debug or autoload.is_debug_in_game:
+            layer_stats.count("direct")
+            for spr in sprites:
+                spr.draw()
+            return
+
+        # members draw in respect to the camera
+        signature = tuple((spr.image, spr.rect.x, spr.rect.y, spr.frame, spr.alpha) for spr in cached)
+        signature += (autoload.Cam.global_position.x, autoload.Cam.global_position.y)
+        if signature != self.signature:
+            self.composite(cached)
+            self.signature = signature
+            layer_stats.count("rebuilds")
+        else:
+            layer_stats.count("hits")
+        autoload.Backend.blit(self.cache, self.cache.get_rect(), self.cache.get_rect())
+        for spr in sprites[cached_count:]:
+            spr.draw()
+
+    def composite(self, sprites):
+        """
+        Draw sprites (opaque / fully transparent members) into the cache surface (transparent where no member is).
+        """
+        if self.cache is None:
+            self.cache = pg.Surface(NATIVE_RESOLUTION, pg.SRCALPHA)
+        self.cache.fill((0, 0, 0, 0))
+
+        canvas, backend = autoload.NATIVE_SURFACE, autoload.Backend
+        autoload.NATIVE_SURFACE, autoload.Backend = self.cache, COMPOSITOR
+        try:
+            for spr in sprites:
+                spr.draw()
+        finally:
+            autoload.NATIVE_SURFACE, autoload.Backend = canvas, backend
+        # pixels changed, a texture made from the old ones is stale
+        backend.forget(self.cache)
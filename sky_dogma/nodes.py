@@ -0,0 +1,271 @@
+import pygame as pg  # https://pyga.me/docs/
+import struct
+
+from sky_dogma import autoload
+from sky_dogma.constants import NATIVE_RESOLUTION
+from sky_dogma.events import AnimationFinished
+from sky_dogma.helpers import lerp
+from sky_dogma.misc import Node, cull_stats
+
+
+#########
+# NODES #
+#########
+# shared read only data, so 10k entities with the same animation / spritesheet hold 1 copy
+KEYFRAMES = {}  # key = val = keyframes tuple (interned)
+VIEW_WIDTH, VIEW_HEIGHT = NATIVE_RESOLUTION  # camera view, what draws outside it is culled
+FRAME_TABLES = {}  # key = (sheet width, sheet height, h_frame, v_frame) | val = tuple of (x, y, width, height) per frame index
+
+
+def get_frame_table(surface, h_frame: int, v_frame: int):
+    """
+    Frame rects of a spritesheet cut in h_frame x v_frame, shared by every sheet of that size and cut.
+    """
+    key = (surface.get_width(), surface.get_height(), h_frame, v_frame)
+    frame_table = FRAME_TABLES.get(key)
+    if frame_table is None:
+        frame_width = surface.get_width() // h_frame
+        frame_height = surface.get_height() // v_frame
+        frame_table = tuple(
+            (col * frame_width, row * frame_height, frame_width, frame_height)
+            for col in range(h_frame)
+            for row in range(v_frame)
+        )
+        FRAME_TABLES[key] = frame_table
+    return frame_table
+
+
+class Animation:
+    """
+    1 animation of an Animator.
+    """
+    __slots__ = ("target", "keyframes", "property_name", "is_looping", "is_interpolate")
+
+    def __init__(self, target, keyframes, property_name, is_looping, is_interpolate):
+        self.target = target
+        self.keyframes = keyframes
+        self.property_name = property_name
+        self.is_looping = is_looping
+        self.is_interpolate = is_interpolate
+
+
+class Animator:
+    """
+    Able to change given target properties, following given keyframes data = list of tuples.
+    """
+    __slots__ = ("animations", "current_animation", "keyframe_index", "elapsed_frame", "is_stopped")
+
+    # snapshot: current animation (order it was added, -1 = none), keyframe index, elapsed frame, is stopped
+    STATE = struct.Struct("<hhi?")
+
+    def __init__(self):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.animations = {}
+        self.current_animation = None
+        self.keyframe_index = 0
+        self.elapsed_frame = 0
+        self.is_stopped = False
+
+    ###########
+    # METHODS #
+    ###########
+    def add_animation(
+            self, 
+            name: str, 
+            target: any, 
+            keyframes: list[tuple[int, any]], 
+            property_name: str, 
+            is_looping: bool = False,
+            is_interpolate: bool = False
+            ):
+        """
+        Expects keyframes = [(frame, value)]. Value of given property.
+        """
+        # equal keyframes are stored once
+        keyframes = tuple(keyframes)
+        keyframes = KEYFRAMES.setdefault(keyframes, keyframes)
+
+        self.animations[name] = Animation(target, keyframes, property_name, is_looping, is_interpolate)
+    
+    def play(self, name: str):
+        """
+        Updates current_animation.
+        """
+        self.is_stopped = False
+        if name in self.animations:
+            self.current_animation = name
+    
+    def stop(self, is_reset=False):
+        """
+        stop current_animation.
+        """
+        self.is_stopped = not self.is_stopped
+        if is_reset:
+            self.keyframe_index = -1
+            self.elapsed_frame = -1
+
+
+    def update(self):
+        """
+        Needs to be called, updates the elapsed_frame. Which is used to set attribute and make events happen.
+        """
+
+        # no current animation? return
+        if not self.current_animation:
+            return
+        
+        # stopped? paused?
+        if self.is_stopped:
+            return
+        
+        # get data of current animation
+        anim = self.animations[self.current_animation]
+        target = anim.target
+        keyframes = anim.keyframes
+        property_name = anim.property_name
+        is_looping = anim.is_looping
+        is_interpolate = anim.is_interpolate
+    
+        # udapte elapsed frame
+        self.elapsed_frame += 1
+
+        # keyframe index now is still not last?
+        if self.keyframe_index < len(keyframes) - 1:
+            # elapsed_frame now is == next keyframe frame item?
+            if self.elapsed_frame == keyframes[self.keyframe_index + 1][0]:
+                self.keyframe_index += 1
+                # TODO: this is setting attribute track, create a call function attribute track (to play sound)
+                setattr(target, property_name, keyframes[self.keyframe_index][1])
+
+            # elapsed_frame now is HAVE NOT REACH next keyframe frame item?
+            else:
+                if is_interpolate:
+                    start_frame_index, start_value = keyframes[self.keyframe_index]
+                    end_frame_index, end_value = keyframes[self.keyframe_index + 1]
+                    weight = (self.elapsed_frame - start_frame_index) / (end_frame_index - start_frame_index)
+                    interpolated_value = lerp(start_value, end_value, weight)
+                    setattr(target, property_name, interpolated_value)
+
+        # keyframe at last index?
+        else:
+            # looping? reset to 1st frame, reset elapsed frame counter too
+            if is_looping:
+                self.keyframe_index = -1
+                self.elapsed_frame = -1
+            # not looping? animation_finished event happens now
+            else:
+                self.animation_finished()  # fire event
+                self.current_animation = None
+                self.keyframe_index = -1
+                self.elapsed_frame = -1
+
+    def save_state(self, buffer, offset: int):
+        """
+        Pack playback state into buffer at offset, return the offset after it.
+        """
+        animation_index = -1 if self.current_animation is None else list(self.animations).index(self.current_animation)
+        self.STATE.pack_into(buffer, offset, animation_index, self.keyframe_index, self.elapsed_frame, self.is_stopped)
+        return offset + self.STATE.size
+
+    def load_state(self, buffer, offset: int):
+        """
+        Inverse of save_state. Animations themselves are not state, they must be the same ones.
+        """
+        animation_index, self.keyframe_index, self.elapsed_frame, self.is_stopped = self.STATE.unpack_from(buffer, offset)
+        self.current_animation = None if animation_index == -1 else list(self.animations)[animation_index]
+        return offset + self.STATE.size
+
+    ##########
+    # EVENTS #
+    ##########
+    def animation_finished(self):
+        """
+        Happens when any animation is finished (not looping ones only). Posts AnimationFinished (with the animation name) to the event bus,
+        listeners get it after every update is done.
+        """
+        autoload.EventBus.post(AnimationFinished(self, self.current_animation))
+
+
+class Sprite(Node):
+    """
+    Takes a spritesheet and uses it to create a frame data.
+    Change the frame property to change which sprite is drawn.
+    """
+    __slots__ = ("image", "rect", "frame", "frame_data", "frame_width", "frame_height", "_alpha")
+
+    # snapshot: rect x, y, frame, alpha (interpolated alpha is a float)
+    STATE = struct.Struct("<iihd")
+
+    def __init__(self, surface, h_frame: int, v_frame: int):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.image = surface
+        self.rect = surface.get_rect()
+        self.frame = 0
+        self.alpha = 255  # has setget
+
+        # set frame data (shared table, index = frame)
+        self.frame_data = get_frame_table(surface, h_frame, v_frame)
+        self.frame_width = self.frame_data[0][2]
+        self.frame_height = self.frame_data[0][3]
+    
+    ###########
+    # METHODS #
+    ###########
+    def draw(self):
+        """
+        Frame property uses the frame data to determine what part of the sprite should it blit (through the active render backend).
+        """
+        # get the sprite from spritesheet
+        frame_x, frame_y, frame_width, frame_height = self.frame_data[self.frame]
+
+        # global position -> position in respect to camera, frame out of the view = nothing to draw
+        camera = autoload.Cam.global_position
+        x = self.rect.x - camera.x
+        y = self.rect.y - camera.y
+        if x >= VIEW_WIDTH or y >= VIEW_HEIGHT or x + frame_width <= 0 or y + frame_height <= 0:
+            cull_stats.culled += 1
+            return
+        cull_stats.drawn += 1
+
+        frame_rect = pg.Rect(frame_x, frame_y, frame_width, frame_height)
+        on_camera_rect = pg.Rect(x, y, self.rect.width, self.rect.height)
+
+        # alpha 0 draws nothing, skip the blit
+        if self._alpha:
+            autoload.Backend.blit(self.image, on_camera_rect, frame_rect)
+        # DEBUG DRAW RECT
+        if autoload.is_debug or autoload.is_debug_in_game:
+            autoload.Backend.draw_rect((0, 255, 0), pg.Rect(x, y, frame_width, frame_height), 1)
+    
+    def save_state(self, buffer, offset: int):
+        """
+        Pack position, frame and alpha into buffer at offset, return the offset after it.
+        """
+        self.STATE.pack_into(buffer, offset, self.rect.x, self.rect.y, self.frame, self._alpha)
+        return offset + self.STATE.size
+
+    def load_state(self, buffer, offset: int):
+        """
+        Inverse of save_state, in place (rect stays the same object).
+        """
+        x, y, self.frame, alpha = self.STATE.unpack_from(buffer, offset)
+        self.rect.topleft = (x, y)
+        if alpha != self._alpha:
+            self.alpha = alpha
+        return offset + self.STATE.size
+
+    ###################
+    # SETTER / GETTER #
+    ###################
+    @property
+    def alpha(self):
+        return self._alpha
+
+    @alpha.setter
+    def alpha(self, value):
+        self._alpha = value
+        self.image.set_alpha(value)
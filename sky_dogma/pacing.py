@@ -0,0 +1,182 @@
+import time
+from collections import deque
+
+from sky_dogma.constants import FPS
+
+"""
+Frame pacing. Replaces Clock.tick, which only sleeps and so jitters by the OS sleep granularity.
+SLEEP = OS sleep only (cheapest, least precise, what Clock.tick did)
+HYBRID = coarse OS sleep, then spin the last bit to the deadline. The spin margin adapts to how much this OS oversleeps
+BUSY = spin the whole wait (most precise, burns a core)
+VSYNC = no waiting here, presenting blocks on vsync, only measures
+"""
+
+SLEEP = "sleep"
+HYBRID = "hybrid"
+BUSY = "busy"
+VSYNC = "vsync"
+STRATEGIES = (SLEEP, HYBRID, BUSY, VSYNC)
+
+MISS_TOLERANCE = 0.001  # s, a frame later than its deadline by more than this is a missed deadline
+MIN_SPIN_MARGIN = 0.0002  # s
+MAX_SPIN_MARGIN = 0.004  # s
+
+
+class FramePacer:
+    """
+    Call tick once per frame, it waits for the frame deadline and returns delta in seconds.
+    Keeps the last frame times for percentiles, counts missed deadlines and the time spent waiting.
+    """
+    def __init__(self, fps: int = FPS, strategy: str = HYBRID, history: int = 600):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.period = 1.0 / fps
+        self.strategy = strategy
+        self.spin_margin = 0.001  # s, hybrid wakes up this early, then spins
+        self.oversleep = 0.0  # s, moving average of how late OS sleep wakes up
+
+        self.last_time = None  # end of the last tick
+        self.deadline = None  # when the next frame should start
+
+        # stats
+        self.frame_times = deque(maxlen=history)  # s, last frames only
+        self.frame_count = 0
+        self.missed_count = 0
+        self.wait_seconds = 0.0  # wall time spent waiting
+        self.wait_cpu_seconds = 0.0  # cpu time this thread burned while waiting (spinning)
+
+    ###########
+    # METHODS #
+    ###########
+    def reset(self):
+        """
+        Start counting frames from now. Called by the first tick.
+        """
+        self.last_time = time.perf_counter()
+        self.deadline = self.last_time + self.period
+
+    def tick(self):
+        """
+        Wait for the frame deadline, return delta (s). On time frames return exactly the period, so jitter does not leak into updates.
+        """
+        if self.last_time is None:
+            self.reset()
+            return self.period
+
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        self.wait()
+        now = time.perf_counter()
+        self.wait_seconds += now - wall_start
+        self.wait_cpu_seconds += time.thread_time() - cpu_start
+
+        frame_time = now - self.last_time
+        self.last_time = now
+        self.frame_times.append(frame_time)
+        self.frame_count += 1
+
+        # vsync has no deadline of its own, judge by the frame time
+        if self.strategy == VSYNC:
+            lateness = frame_time - self.period
+        else:
+            lateness = now - self.deadline
+        is_missed = lateness > MISS_TOLERANCE
+        if is_missed:
+            self.missed_count += 1
+
+        # next deadline, do not try to catch up when more than 1 frame behind
+        self.deadline += self.period
+        if self.deadline < now:
+            self.deadline = now + self.period
+
+        if is_missed:
+            return frame_time
+        return self.period
+
+    def wait(self):
+        """
+        Block until the deadline with the current strategy.
+        """
+        if self.strategy == VSYNC:
+            return
+
+        if self.strategy == SLEEP:
+            remaining = self.deadline - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            return
+
+        if self.strategy == HYBRID:
+            remaining = self.deadline - time.perf_counter() - self.spin_margin
+            if remaining > 0:
+                sleep_start = time.perf_counter()
+                time.sleep(remaining)
+                self.adapt_spin_margin(time.perf_counter() - sleep_start - remaining)
+
+        # spin the rest (busy = all of it)
+        while time.perf_counter() < self.deadline:
+            pass
+
+    def time_left(self):
+        """
+        Seconds until the next frame deadline (0 when late or not started), what idle work may use.
+        """
+        if self.deadline is None or self.strategy == VSYNC:
+            return 0.0
+        return max(0.0, self.deadline - time.perf_counter())
+
+    def adapt_spin_margin(self, oversleep: float):
+        """
+        Follow how late sleep wakes up on this OS, wake up twice that early.
+        """
+        self.oversleep += (max(0.0, oversleep) - self.oversleep) * 0.1
+        self.spin_margin = max(MIN_SPIN_MARGIN, min(self.oversleep * 2.0, MAX_SPIN_MARGIN))
+
+    ###########
+    # GETTERS #
+    ###########
+    def percentile(self, percent: float):
+        """
+        Frame time (s) at given percentile (0 - 100) of the kept history, nearest rank.
+        """
+        if not self.frame_times:
+            return 0.0
+        frame_times = sorted(self.frame_times)
+        index = min(len(frame_times) - 1, int(round(percent / 100.0 * (len(frame_times) - 1))))
+        return frame_times[index]
+
+    def stats(self):
+        """
+        Pacing stats so far, as a dict. Times in ms.
+        """
+        count = len(self.frame_times)
+        mean = sum(self.frame_times) / count if count else 0.0
+        jitter = (sum((frame_time - mean) ** 2 for frame_time in self.frame_times) / count) ** 0.5 if count else 0.0
+        return {
+            "strategy": self.strategy,
+            "frames": self.frame_count,
+            "missed": self.missed_count,
+            "mean_ms": mean * 1000.0,
+            "jitter_ms": jitter * 1000.0,
+            "p50_ms": self.percentile(50) * 1000.0,
+            "p95_ms": self.percentile(95) * 1000.0,
+            "p99_ms": self.percentile(99) * 1000.0,
+            "max_ms": max(self.frame_times, default=0.0) * 1000.0,
+            "wait_ms": self.wait_seconds * 1000.0,
+            "wait_cpu_ms": self.wait_cpu_seconds * 1000.0,
+            "spin_margin_ms": self.spin_margin * 1000.0,
+        }
+
+    def report(self):
+        """
+        Stats as a printable block.
+        """
+        stats = self.stats()
+        return (
+            f"PACING {stats['strategy']}\n"
+            f"  frames {stats['frames']} | missed {stats['missed']}\n"
+            f"  mean {stats['mean_ms']:.2f} ms | jitter {stats['jitter_ms']:.3f} ms\n"
+            f"  p50 {stats['p50_ms']:.2f} ms | p95 {stats['p95_ms']:.2f} ms | p99 {stats['p99_ms']:.2f} ms | max {stats['max_ms']:.2f} ms\n"
+            f"  waited {stats['wait_ms']:.1f} ms, {stats['wait_cpu_ms']:.1f} ms of it on cpu | spin margin {stats['spin_margin_ms']:.3f} ms"
+        )
@@ -0,0 +1,128 @@
+import pygame as pg  # https://pyga.me/docs/
+
+"""
+Indexed color (8 bit paletted) sheets. The pixel art sheets have a handful of colors, so a sheet is stored once as
+1 byte per pixel palette indices, and every variant (hit flash, silhouette, team colors) is a surface made on the same
+index buffer with its own palette: a variant costs a 256 entry palette instead of a full RGBA copy, and making one is
+O(256) (set_palette) instead of O(pixels) (helpers.apply_flash_shader).
+Index 0 is transparent (colorkey). Sheets whose visible pixels all share 1 alpha below 255 keep it as surface alpha.
+SURFACES_DICT["player@flash"] = the player sheet with the "flash" palette, --indexed makes INDEXED_NAMES paletted too.
+"""
+
+TRANSPARENT = 0  # palette index, colorkey
+MAX_COLORS = 255  # + transparent
+VARIANT_SEPARATOR = "@"
+INDEXED_NAMES = ("player", "player_exhaust", "field")  # sheets paletted in indexed mode
+
+
+#################
+# PALETTE SWAPS #
+#################
+def flash_palette(palette):
+    """
+    Every color white (hit flash).
+    """
+    return [palette[TRANSPARENT]] + [(255, 255, 255)] * (len(palette) - 1)
+
+
+def silhouette_palette(palette):
+    """
+    Every color black.
+    """
+    return [palette[TRANSPARENT]] + [(0, 0, 0)] * (len(palette) - 1)
+
+
+def team_b_palette(palette):
+    """
+    Channels rotated, r g b -> g b r.
+    """
+    return [(g, b, r) for r, g, b in palette]
+
+
+def team_c_palette(palette):
+    """
+    Channels rotated, r g b -> b r g.
+    """
+    return [(b, r, g) for r, g, b in palette]
+
+
+# key = variant name | val = function(base palette) -> palette
+PALETTE_VARIANTS = {
+    "flash": flash_palette,
+    "silhouette": silhouette_palette,
+    "team_b": team_b_palette,
+    "team_c": team_c_palette,
+}
+
+
+#########
+# SHEET #
+#########
+class IndexedSheet:
+    """
+    1 sheet as palette indices + its base palette. Surfaces made from it share the indices.
+    """
+    def __init__(self, indices: bytearray, size, palette, alpha: int = 255):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.indices = indices  # width * height bytes, row major (pitch = width)
+        self.size = size
+        self.palette = palette  # list of rgb, index 0 = transparent
+        self.alpha = alpha
+
+    ###########
+    # METHODS #
+    ###########
+    def surface(self, variant: str = ""):
+        """
+        8 bit surface on the shared indices, base palette or the named PALETTE_VARIANTS one.
+        """
+        palette = PALETTE_VARIANTS[variant](self.palette) if variant else self.palette
+        return self.make_surface(palette)
+
+    def make_surface(self, palette):
+        """
+        8 bit surface on the shared indices with palette (list of rgb).
+        """
+        surface = pg.image.frombuffer(self.indices, self.size, "P")
+        surface.set_palette(palette + [(0, 0, 0)] * (256 - len(palette)))
+        surface.set_colorkey(TRANSPARENT)
+        if self.alpha != 255:
+            surface.set_alpha(self.alpha)
+        return surface
+
+    ###########
+    # GETTERS #
+    ###########
+    def nbytes(self, variants: int = 1):
+        """
+        Bytes the pixels of this sheet + variants palettes take (surface headers aside).
+        """
+        return len(self.indices) + variants * 256 * 4
+
+
+def index_surface(surface):
+    """
+    IndexedSheet of an RGBA / RGB surface. ValueError when it has more than MAX_COLORS colors or mixed partial alpha.
+    """
+    # optional, only indexing needs it
+    import numpy as np  # https://numpy.org/
+
+    width, height = surface.get_size()
+    pixels = np.frombuffer(pg.image.tobytes(surface, "RGBA"), dtype=np.uint8).reshape(-1, 4)
+    alpha = pixels[:, 3]
+    is_visible = alpha > 0
+    alphas = np.unique(alpha[is_visible])
+    if len(alphas) > 1:
+        raise ValueError("sheet mixes alpha values, it cannot be paletted")
+
+    # rgb packed into 1 int, unique colors -> palette, inverse -> indices (+1, 0 is transparent)
+    packed = (pixels[:, 0].astype(np.uint32) << 16) | (pixels[:, 1].astype(np.uint32) << 8) | pixels[:, 2]
+    colors, inverse = np.unique(packed[is_visible], return_inverse=True)
+    if len(colors) > MAX_COLORS:
+        raise ValueError(f"sheet has {len(colors)} colors, at most {MAX_COLORS} fit a palette")
+    indices = np.zeros(width * height, dtype=np.uint8)
+    indices[is_visible] = inverse + 1
+    palette = [(0, 0, 0)] + [((color >> 16) & 255, (color >> 8) & 255, color & 255) for color in colors.tolist()]
+    return IndexedSheet(bytearray(indices.tobytes()), (width, height), palette, int(alphas[0]) if len(alphas) else 255)
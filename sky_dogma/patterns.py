@@ -0,0 +1,257 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np  # optional, only bullet patterns need it
+
+from sky_dogma import autoload
+from sky_dogma.constants import FPS
+
+"""
+Bullet patterns. A Pattern is a description (ring, spiral, aimed fan, delayed curve...), compiled once into NumPy tables:
+per bullet = spawn tick, spawn offset, direction (cos, sin) | per tick = 1 path shared by every bullet, in the bullet
+own frame (along, across its direction). Every bullet of a pattern moves the same way, just rotated.
+Firing = rotate + stamp a few arrays, moving = index the path with each bullet age. No per bullet python objects.
+Positions are px, ticks are frames (FPS).
+"""
+
+# kinds
+RING = "ring"  # count bullets evenly around 360 deg
+FAN = "fan"  # count bullets over spread deg, centered on the aim (spread >= 360 = spaced like a ring)
+SPIRAL = "spiral"  # like ring, every wave turned by spin deg
+
+
+@dataclass(frozen=True, slots=True)
+class Pattern:
+    """
+    What to fire. Frozen = hashable, compiled patterns are cached by it.
+    """
+    kind: str = RING
+    count: int = 8  # bullets per wave
+    waves: int = 1
+    wave_interval: int = 0  # ticks between waves
+    spread: float = 60.0  # deg, fan only
+    spin: float = 0.0  # deg added every wave (spiral)
+    radius: float = 0.0  # px, spawn offset from the emitter along the direction
+    speed: float = 60.0  # px / s at spawn
+    acceleration: float = 0.0  # px / s per s, after delay
+    delay: int = 0  # ticks standing still before moving
+    curve: float = 0.0  # deg / s, turning after delay
+    lifetime: int = 240  # ticks
+
+
+class CompiledPattern:
+    """
+    Tables of 1 pattern. Per bullet arrays have length size, path arrays have length lifetime.
+    """
+    __slots__ = ("pattern", "size", "lifetime", "spawn_tick", "cos", "sin", "radius", "path_along", "path_across")
+
+    def __init__(self, pattern: Pattern):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.pattern = pattern
+        self.size = pattern.count * pattern.waves
+        self.lifetime = pattern.lifetime
+
+        # per bullet
+        wave = np.repeat(np.arange(pattern.waves), pattern.count)
+        index = np.tile(np.arange(pattern.count), pattern.waves)
+        if pattern.kind == FAN:
+            # 1 bullet = straight at the aim, full circle = no gap at the ends (first and last would overlap)
+            gaps = pattern.count if pattern.spread >= 360.0 else pattern.count - 1
+            step = pattern.spread / gaps if pattern.count > 1 else 0.0
+            angle = -pattern.spread / 2.0 + index * step if pattern.count > 1 else np.zeros(self.size)
+        elif pattern.kind in (RING, SPIRAL):
+            angle = index * (360.0 / pattern.count)
+        else:
+            raise ValueError(f"unknown pattern kind {pattern.kind}")
+        angle = np.radians(angle + wave * pattern.spin)
+        self.spawn_tick = (wave * pattern.wave_interval).astype(np.int32)
+        self.cos = np.cos(angle).astype(np.float32)
+        self.sin = np.sin(angle).astype(np.float32)
+        self.radius = np.float32(pattern.radius)
+
+        # per tick path, age 0 = spawn position
+        tick = np.arange(pattern.lifetime, dtype=np.float64)
+        moving = np.maximum(tick - pattern.delay, 0.0) / FPS  # s moving so far
+        is_moving = tick >= pattern.delay
+        speed = np.where(is_moving, pattern.speed + pattern.acceleration * moving, 0.0)
+        heading = np.radians(pattern.curve * moving)
+        # displacement of each tick, summed = position at the end of that tick (age 0 has not moved)
+        step_along = speed * np.cos(heading) / FPS
+        step_across = speed * np.sin(heading) / FPS
+        self.path_along = (np.concatenate(([0.0], np.cumsum(step_along)[:-1])) + pattern.radius).astype(np.float32)
+        self.path_across = np.concatenate(([0.0], np.cumsum(step_across)[:-1])).astype(np.float32)
+
+    @property
+    def duration(self):
+        """
+        Ticks from firing to the last bullet expiring.
+        """
+        return int(self.spawn_tick.max()) + self.lifetime
+
+
+# key = Pattern | val = CompiledPattern
+COMPILED = {}
+
+
+def compile_pattern(pattern: Pattern):
+    """
+    Compiled tables of pattern, made once per distinct parameters.
+    """
+    compiled = COMPILED.get(pattern)
+    if compiled is None:
+        compiled = CompiledPattern(pattern)
+        COMPILED[pattern] = compiled
+    return compiled
+
+
+#########
+# FIELD #
+#########
+class BulletField:
+    """
+    Every live bullet, in flat arrays. fire adds a pattern instance, update moves all of them, draw blits them.
+    Capacity is fixed (arrays are preallocated), firing past it drops the extra bullets.
+    """
+    def __init__(self, capacity: int = 8192):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.capacity = capacity
+        self.count = 0  # bullets in use, [0, count) of every array
+
+        # per bullet
+        self.origin_x = np.zeros(capacity, np.float32)
+        self.origin_y = np.zeros(capacity, np.float32)
+        self.cos = np.zeros(capacity, np.float32)
+        self.sin = np.zeros(capacity, np.float32)
+        self.birth_tick = np.zeros(capacity, np.int32)
+        self.lifetime = np.zeros(capacity, np.int32)
+        self.path_id = np.zeros(capacity, np.int32)
+        # positions after the last update
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.is_alive = np.zeros(capacity, bool)
+
+        # all paths in 1 table, row = path id (so 1 fancy index moves bullets of every pattern)
+        self.path_ids = {}  # key = CompiledPattern | val = row
+        self.paths_along = np.zeros((0, 1), np.float32)
+        self.paths_across = np.zeros((0, 1), np.float32)
+
+        self.tick = 0
+        self.dropped_count = 0
+
+    ###########
+    # METHODS #
+    ###########
+    def get_path_id(self, compiled: CompiledPattern):
+        """
+        Row of the compiled path in the shared path table, added on first use (paths padded to the longest).
+        """
+        path_id = self.path_ids.get(compiled)
+        if path_id is None:
+            path_id = len(self.path_ids)
+            width = max(self.paths_along.shape[1], compiled.lifetime)
+            along = np.zeros((path_id + 1, width), np.float32)
+            across = np.zeros((path_id + 1, width), np.float32)
+            along[:path_id, :self.paths_along.shape[1]] = self.paths_along
+            across[:path_id, :self.paths_across.shape[1]] = self.paths_across
+            along[path_id, :compiled.lifetime] = compiled.path_along
+            across[path_id, :compiled.lifetime] = compiled.path_across
+            self.paths_along, self.paths_across = along, across
+            self.path_ids[compiled] = path_id
+        return path_id
+
+    def fire(self, pattern: Pattern, x: float, y: float, aim: float = 90.0):
+        """
+        Add 1 instance of pattern at (x, y), turned to aim (deg, 90 = down the screen). Returns bullets added.
+        """
+        compiled = compile_pattern(pattern)
+        start = self.count
+        size = min(compiled.size, self.capacity - start)
+        self.dropped_count += compiled.size - size
+        if size <= 0:
+            return 0
+        end = start + size
+
+        aim_cos = math.cos(math.radians(aim))
+        aim_sin = math.sin(math.radians(aim))
+        self.origin_x[start:end] = x
+        self.origin_y[start:end] = y
+        self.cos[start:end] = compiled.cos[:size] * aim_cos - compiled.sin[:size] * aim_sin
+        self.sin[start:end] = compiled.sin[:size] * aim_cos + compiled.cos[:size] * aim_sin
+        self.birth_tick[start:end] = self.tick + compiled.spawn_tick[:size]
+        self.lifetime[start:end] = compiled.lifetime
+        self.path_id[start:end] = self.get_path_id(compiled)
+        # shown right away, at the spawn position (age 0 of the path), until the next update
+        self.x[start:end] = x + compiled.radius * self.cos[start:end]
+        self.y[start:end] = y + compiled.radius * self.sin[start:end]
+        self.is_alive[start:end] = compiled.spawn_tick[:size] == 0
+        self.count = end
+        return size
+
+    def fire_aimed(self, pattern: Pattern, x: float, y: float, target_x: float, target_y: float):
+        """
+        Fire with the pattern center pointing at a target (aimed fans).
+        """
+        return self.fire(pattern, x, y, math.degrees(math.atan2(target_y - y, target_x - x)))
+
+    def update(self, delta=None):
+        """
+        Advance 1 tick: every bullet position = origin + its path at its age, rotated. Expired bullets are compacted away.
+        Ages are taken before the tick moves on, a bullet fired this tick is at age 0 (its spawn position).
+        """
+        count = self.count
+        tick = self.tick
+        self.tick += 1
+        if not count:
+            return
+
+        age = tick - self.birth_tick[:count]
+        lifetime = self.lifetime[:count]
+
+        # compact, expired ones out (order kept, waves still waiting stay)
+        is_kept = age < lifetime
+        if not is_kept.all():
+            kept = np.flatnonzero(is_kept)
+            count = len(kept)
+            for array in (self.origin_x, self.origin_y, self.cos, self.sin, self.birth_tick, self.lifetime, self.path_id):
+                array[:count] = array[kept]
+            age = age[kept]
+            self.count = count
+
+        is_alive = age >= 0  # later waves are not out yet
+        safe_age = np.maximum(age, 0)
+        path_id = self.path_id[:count]
+        along = self.paths_along[path_id, safe_age]
+        across = self.paths_across[path_id, safe_age]
+        cos = self.cos[:count]
+        sin = self.sin[:count]
+        self.x[:count] = self.origin_x[:count] + along * cos - across * sin
+        self.y[:count] = self.origin_y[:count] + along * sin + across * cos
+        self.is_alive[:count] = is_alive
+
+    def positions(self):
+        """
+        (x, y) arrays of the bullets that are out, views of the last update.
+        """
+        is_alive = self.is_alive[:self.count]
+        return self.x[:self.count][is_alive], self.y[:self.count][is_alive]
+
+    def draw(self, image):
+        """
+        Blit image centered on every bullet that is out (through the active render backend, camera applied).
+        """
+        width, height = image.get_size()
+        frame_rect = (0, 0, width, height)
+        xs, ys = self.positions()
+        offset_x = autoload.Cam.global_position.x + width / 2
+        offset_y = autoload.Cam.global_position.y + height / 2
+        blit = autoload.Backend.blit
+        # floor, not truncation toward 0: bullets partly off the left / top edge stay on the right pixel
+        for x, y in zip(np.floor(xs - offset_x).astype(np.int32).tolist(), np.floor(ys - offset_y).astype(np.int32).tolist()):
+            blit(image, (x, y, width, height), frame_rect)
+
+    def clear(self):
+        self.count = 0
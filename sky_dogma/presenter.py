@@ -0,0 +1,122 @@
+import pygame as pg  # https://pyga.me/docs/
+import time
+import queue
+import threading
+
+from sky_dogma.constants import NATIVE_RESOLUTION
+
+"""
+Optional 2 stage render pipeline.
+The game thread draws frame N+1 into one native surface while the presenter thread scales + flips frame N.
+Scale and flip release the GIL, so on many core but slow per core machines they stop blocking the next update.
+The window must already be open. Flipping off the main thread is fine on Windows / Linux, not on macOS.
+"""
+
+DROP_OLDEST = "drop_oldest"  # game never waits, a frame still waiting to be presented is thrown away (lowest latency)
+BLOCK = "block"  # game waits for the presenter, every frame is shown (highest throughput of shown frames)
+
+
+class Presenter:
+    """
+    Presenter thread + the pool of native surfaces it shares with the game.
+    Game side: acquire a surface, draw into it, submit it. Presenter side: scale it to the window, flip, free it.
+    """
+    def __init__(self, display_surface, drop_policy: str = DROP_OLDEST, buffer_count: int = 2):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.display_surface = display_surface
+        self.display_size = display_surface.get_size()
+        self.drop_policy = drop_policy
+
+        # same format as the window, so scale can write straight into it (no temp surface, no extra blit)
+        self.buffers = [pg.Surface(NATIVE_RESOLUTION, 0, display_surface) for _ in range(buffer_count)]
+        self.free_buffers = queue.Queue()
+        for buffer in self.buffers:
+            self.free_buffers.put(buffer)
+        # bounded, 1 buffer is always out for drawing so this never fills past its size
+        self.ready_buffers = queue.Queue(maxsize=buffer_count - 1)
+
+        self.thread = None
+
+        # stats
+        self.presented_count = 0
+        self.dropped_count = 0
+        self.wait_seconds = 0.0  # game thread time spent waiting for a free buffer
+        self.present_seconds = 0.0  # presenter thread time spent scaling + flipping
+
+    ###########
+    # METHODS #
+    ###########
+    def start(self):
+        """
+        Start the presenter thread.
+        """
+        self.thread = threading.Thread(target=self.loop, name="Presenter", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Present what is still queued, then end the presenter thread.
+        """
+        if self.thread is None:
+            return
+        self.ready_buffers.put(None)
+        self.thread.join()
+        self.thread = None
+
+    def acquire(self):
+        """
+        Game thread. Get a native surface to draw the next frame into.
+        """
+        try:
+            return self.free_buffers.get_nowait()
+        except queue.Empty:
+            pass
+
+        # presenter is behind, take back the frame it has not started yet
+        if self.drop_policy == DROP_OLDEST:
+            try:
+                buffer = self.ready_buffers.get_nowait()
+                self.dropped_count += 1
+                return buffer
+            except queue.Empty:
+                pass
+
+        # nothing to take back (or policy says wait), wait for the presenter to free one
+        start = time.perf_counter()
+        buffer = self.free_buffers.get()
+        self.wait_seconds += time.perf_counter() - start
+        return buffer
+
+    def submit(self, buffer):
+        """
+        Game thread. Hand a finished frame to the presenter.
+        """
+        self.ready_buffers.put(buffer)
+
+    def loop(self):
+        """
+        Presenter thread. Scale + flip ready frames until stop.
+        """
+        while True:
+            buffer = self.ready_buffers.get()
+            if buffer is None:
+                return
+            start = time.perf_counter()
+            pg.transform.scale(buffer, self.display_size, self.display_surface)
+            pg.display.flip()
+            self.present_seconds += time.perf_counter() - start
+            self.presented_count += 1
+            self.free_buffers.put(buffer)
+
+    def stats(self):
+        """
+        Counters so far, as a dict.
+        """
+        return {
+            "presented": self.presented_count,
+            "dropped": self.dropped_count,
+            "wait_ms": self.wait_seconds * 1000.0,
+            "present_ms": self.present_seconds * 1000.0,
+        }
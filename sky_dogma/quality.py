@@ -0,0 +1,121 @@
+from collections import deque
+
+from sky_dogma.constants import FPS
+
+"""
+Adaptive quality governor. Watches rolling percentiles of the frame work time (update + draw + present, no pacing wait)
+against the 1 / FPS budget and steps the quality tier down when heavy moments blow it, back up when there is room.
+Hysteresis: stepping down needs p95 over DEGRADE_AT of the budget, stepping up needs it under UPGRADE_AT, and up waits
+much longer after a change than down does. The window restarts after every change (old frames were another tier).
+Subsystems register knobs: name + 1 value per tier + a function that applies a value. Registering a name again replaces
+it (a new scene registers its own), the current tier value is applied right away. Every change is logged with the
+metrics that triggered it.
+"""
+
+HIGH = 0
+MEDIUM = 1
+LOW = 2
+MINIMAL = 3
+TIER_NAMES = ("high", "medium", "low", "minimal")
+
+WINDOW = 120  # frames the percentiles are taken over
+EVALUATE_EVERY = 30  # frames between decisions
+DEGRADE_AT = 0.9  # p95 over this share of the budget = step down
+UPGRADE_AT = 0.6  # p95 under this share of the budget = step up
+DEGRADE_COOLDOWN = 60  # frames after a change before stepping down again
+UPGRADE_COOLDOWN = 300  # frames after a change before stepping up again
+
+
+def percentile(ordered, share: float):
+    """
+    Nearest rank percentile of an ascending list.
+    """
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))]
+
+
+class QualityGovernor:
+    """
+    1 per process, Game.run reports every frame work time. Adaptive = False pins the tier.
+    """
+    def __init__(self, tier: int = HIGH, is_adaptive: bool = True, budget: float = 1.0 / FPS, history: int = 256):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.tier = tier
+        self.is_adaptive = is_adaptive
+        self.budget = budget  # s
+        self.knobs = {}  # key = name | val = (values per tier, apply)
+
+        self.work_times = deque(maxlen=WINDOW)  # s
+        self.frames_since_change = 0
+        # log, (frame, old tier, new tier, p50 ms, p95 ms, p99 ms)
+        self.changes = deque(maxlen=history)
+
+    ###########
+    # METHODS #
+    ###########
+    def register(self, name: str, values, apply):
+        """
+        Knob name, values = 1 per tier (HIGH first), apply(value) sets it. Applied now with the current tier.
+        """
+        self.knobs[name] = (tuple(values), apply)
+        apply(values[self.tier])
+
+    def set_tier(self, tier: int, frame: int = 0, metrics=(0.0, 0.0, 0.0)):
+        """
+        Apply every knob for tier, log the change.
+        """
+        tier = max(HIGH, min(MINIMAL, tier))
+        if tier == self.tier:
+            return
+        self.changes.append((frame, self.tier, tier) + tuple(metrics))
+        self.tier = tier
+        for values, apply in self.knobs.values():
+            apply(values[tier])
+        self.work_times.clear()
+        self.frames_since_change = 0
+
+    def frame_done(self, frame: int, work_seconds: float):
+        """
+        Called once per frame with the time it took (waiting excluded). Decides every EVALUATE_EVERY frames.
+        """
+        self.work_times.append(work_seconds)
+        self.frames_since_change += 1
+        if not self.is_adaptive or self.frames_since_change % EVALUATE_EVERY or len(self.work_times) < WINDOW // 2:
+            return
+
+        ordered = sorted(self.work_times)
+        metrics = tuple(percentile(ordered, share) * 1000.0 for share in (0.5, 0.95, 0.99))
+        p95 = metrics[1] / 1000.0
+        if p95 > self.budget * DEGRADE_AT and self.tier < MINIMAL and self.frames_since_change >= DEGRADE_COOLDOWN:
+            self.set_tier(self.tier + 1, frame, metrics)
+        elif p95 < self.budget * UPGRADE_AT and self.tier > HIGH and self.frames_since_change >= UPGRADE_COOLDOWN:
+            self.set_tier(self.tier - 1, frame, metrics)
+
+    ###########
+    # GETTERS #
+    ###########
+    def stats(self):
+        """
+        Current tier, knob values and how many times it stepped down / up.
+        """
+        return {
+            "tier": TIER_NAMES[self.tier],
+            "knobs": {name: values[self.tier] for name, (values, _) in self.knobs.items()},
+            "down": sum(1 for change in self.changes if change[2] > change[1]),
+            "up": sum(1 for change in self.changes if change[2] < change[1]),
+        }
+
+    def report(self):
+        """
+        Stats + the change log as a printable block.
+        """
+        stats = self.stats()
+        lines = [f"QUALITY {stats['tier']} | stepped down {stats['down']} up {stats['up']} | budget {self.budget * 1000.0:.2f} ms"]
+        lines.append("  " + " | ".join(f"{name} {value}" for name, value in stats["knobs"].items()))
+        for frame, old, new, p50, p95, p99 in self.changes:
+            lines.append(
+                f"  frame {frame:6d} {TIER_NAMES[old]:>7} -> {TIER_NAMES[new]:<7} "
+                f"(p50 {p50:6.2f} ms | p95 {p95:6.2f} ms | p99 {p99:6.2f} ms)"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,227 @@
+import pygame as pg  # https://pyga.me/docs/
+import os
+import time
+import zlib
+import queue
+import struct
+import threading
+
+from sky_dogma.constants import FPS, NATIVE_RESOLUTION
+from sky_dogma.presenter import DROP_OLDEST, BLOCK
+
+"""
+Gameplay recorder. The game thread only copies the native frame into a free buffer of a preallocated ring (1 same format
+blit), an encoder thread writes it out. zlib, png encoding and the NumPy xor release the GIL, so encoding overlaps the
+next frames.
+RAW = 1 file of RGB frames, play / convert it with:
+    ffmpeg -f rawvideo -pixel_format rgb24 -video_size 320x180 -framerate 60 -i recording.raw recording.mp4
+PNG = 1 png per frame in a directory (slowest)
+DELTA = 1 file, every frame XOR the previous one then zlib (static screens cost almost nothing), see read_delta
+When the encoder falls behind: BLOCK = the game waits (backpressure, nothing lost), DROP_OLDEST = the oldest frame not
+encoded yet is thrown away (game never waits). Every frame has its index, dropped ones are counted and listed.
+"""
+
+RAW = "raw"
+PNG = "png"
+DELTA = "delta"
+FORMATS = (RAW, PNG, DELTA)
+
+DELTA_MAGIC = b"SKYDELTA"
+DELTA_HEADER = struct.Struct("<8sHHH")  # magic, width, height, fps
+DELTA_FRAME = struct.Struct("<II")  # frame index, compressed size
+
+
+class Recorder:
+    """
+    Game side: capture(native_surface) once per frame. Encoder side: everything else.
+    """
+    def __init__(self, path: str, encoding: str = DELTA, drop_policy: str = BLOCK, buffer_count: int = 8, level: int = 1):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.path = path
+        self.encoding = encoding
+        self.drop_policy = drop_policy
+        self.level = level  # zlib level (delta)
+
+        # ring, same size + format as the native canvas so capture is a plain copy
+        self.buffers = [pg.Surface(NATIVE_RESOLUTION) for _ in range(buffer_count)]
+        self.free_buffers = queue.Queue()
+        for buffer in self.buffers:
+            self.free_buffers.put(buffer)
+        self.ready_buffers = queue.Queue()  # (frame index, buffer), None = stop
+
+        self.thread = None
+        self.file = None
+        self.previous = None  # delta, last frame pixels (uint8 array, starts black: frame 0 xor 0 = frame 0)
+        self.delta = None  # delta, xor output, preallocated
+        self.frame_index = 0
+
+        # stats
+        self.captured_count = 0
+        self.encoded_count = 0
+        self.dropped_count = 0
+        self.dropped_frames = []  # indices of the dropped ones
+        self.bytes_written = 0
+        self.capture_seconds = 0.0  # game thread, copying + queueing
+        self.wait_seconds = 0.0  # game thread, waiting for a free buffer (backpressure)
+        self.encode_seconds = 0.0  # encoder thread
+
+    ###########
+    # METHODS #
+    ###########
+    def start(self):
+        """
+        Open the output, start the encoder thread.
+        """
+        if self.encoding == PNG:
+            os.makedirs(self.path, exist_ok=True)
+        else:
+            self.file = open(self.path, "wb")
+            if self.encoding == DELTA:
+                # optional, only delta recording needs it
+                import numpy as np  # https://numpy.org/
+
+                self.previous = np.zeros(NATIVE_RESOLUTION[0] * NATIVE_RESOLUTION[1] * 3, np.uint8)
+                self.delta = np.empty_like(self.previous)
+                self.file.write(DELTA_HEADER.pack(DELTA_MAGIC, NATIVE_RESOLUTION[0], NATIVE_RESOLUTION[1], FPS))
+        self.thread = threading.Thread(target=self.loop, name="Recorder", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Encode what is still queued, then end the encoder thread and close the output.
+        """
+        if self.thread is None:
+            return
+        self.ready_buffers.put(None)
+        self.thread.join()
+        self.thread = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def capture(self, native_surface):
+        """
+        Game thread. Copy this frame into the ring (call after drawing, before presenting).
+        """
+        start = time.perf_counter()
+        frame_index = self.frame_index
+        self.frame_index += 1
+
+        try:
+            buffer = self.free_buffers.get_nowait()
+        except queue.Empty:
+            buffer = None
+            if self.drop_policy == DROP_OLDEST:
+                # encoder is behind, reuse the oldest frame it has not started yet
+                try:
+                    dropped_index, buffer = self.ready_buffers.get_nowait()
+                    self.dropped_count += 1
+                    self.dropped_frames.append(dropped_index)
+                except queue.Empty:
+                    pass
+            if buffer is None:
+                wait_start = time.perf_counter()
+                buffer = self.free_buffers.get()
+                self.wait_seconds += time.perf_counter() - wait_start
+
+        buffer.blit(native_surface, (0, 0))
+        self.ready_buffers.put((frame_index, buffer))
+        self.captured_count += 1
+        self.capture_seconds += time.perf_counter() - start
+
+    def loop(self):
+        """
+        Encoder thread. Encode ready frames until stop.
+        """
+        while True:
+            item = self.ready_buffers.get()
+            if item is None:
+                return
+            frame_index, buffer = item
+            start = time.perf_counter()
+            self.encode(frame_index, buffer)
+            self.encode_seconds += time.perf_counter() - start
+            self.encoded_count += 1
+            self.free_buffers.put(buffer)
+
+    def encode(self, frame_index: int, buffer):
+        """
+        Encoder thread. Write 1 frame in the chosen format.
+        """
+        if self.encoding == PNG:
+            path = os.path.join(self.path, f"frame_{frame_index:06d}.png")
+            pg.image.save(buffer, path)
+            self.bytes_written += os.path.getsize(path)
+            return
+
+        pixels = pg.image.tobytes(buffer, "RGB")
+        if self.encoding == RAW:
+            self.file.write(pixels)
+            self.bytes_written += len(pixels)
+            return
+
+        # delta, xor with the previous frame into the preallocated buffer, unchanged pixels become 0 runs
+        import numpy as np  # https://numpy.org/
+
+        pixels = np.frombuffer(pixels, np.uint8)
+        np.bitwise_xor(pixels, self.previous, out=self.delta)
+        self.previous = pixels
+        compressed = zlib.compress(self.delta, self.level)
+        self.file.write(DELTA_FRAME.pack(frame_index, len(compressed)))
+        self.file.write(compressed)
+        self.bytes_written += DELTA_FRAME.size + len(compressed)
+
+    ###########
+    # GETTERS #
+    ###########
+    def stats(self):
+        """
+        Counters so far, as a dict. Overhead = game thread ms per captured frame (waits included).
+        """
+        captured = max(1, self.captured_count)
+        return {
+            "encoding": self.encoding,
+            "captured": self.captured_count,
+            "encoded": self.encoded_count,
+            "dropped": self.dropped_count,
+            "overhead_ms": self.capture_seconds * 1000.0 / captured,
+            "wait_ms": self.wait_seconds * 1000.0,
+            "encode_ms": self.encode_seconds * 1000.0 / max(1, self.encoded_count),
+            "bytes": self.bytes_written,
+        }
+
+    def report(self):
+        """
+        Stats as a printable block.
+        """
+        stats = self.stats()
+        return (
+            f"RECORDER {stats['encoding']} -> {self.path}\n"
+            f"  captured {stats['captured']} | encoded {stats['encoded']} | dropped {stats['dropped']}\n"
+            f"  overhead {stats['overhead_ms']:.3f} ms/frame (waited {stats['wait_ms']:.1f} ms) | encode {stats['encode_ms']:.3f} ms/frame\n"
+            f"  {stats['bytes'] / 1024:.0f} KiB written"
+        )
+
+
+def read_delta(path: str):
+    """
+    Yield (frame index, RGB bytes) of a DELTA recording.
+    """
+    # optional, only delta recording needs it
+    import numpy as np  # https://numpy.org/
+
+    with open(path, "rb") as file:
+        magic, width, height, _ = DELTA_HEADER.unpack(file.read(DELTA_HEADER.size))
+        if magic != DELTA_MAGIC:
+            raise ValueError(f"{path} is not a delta recording")
+        pixels = np.zeros(width * height * 3, np.uint8)  # xored in place, frame after frame
+        while True:
+            header = file.read(DELTA_FRAME.size)
+            if not header:
+                return
+            frame_index, compressed_size = DELTA_FRAME.unpack(header)
+            delta = np.frombuffer(zlib.decompress(file.read(compressed_size)), np.uint8)
+            np.bitwise_xor(pixels, delta, out=pixels)
+            yield frame_index, pixels.tobytes()
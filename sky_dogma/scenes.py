@@ -0,0 +1,575 @@
+import pygame as pg  # https://pyga.me/docs/
+
+from sky_dogma import autoload
+from sky_dogma.constants import (
+    BACKGROUND_WIDTH,
+    HALF_BACKGROUND_WIDTH,
+    NATIVE_RESOLUTION,
+    HALF_NATIVE_RESOLUTION,
+    ONE_TILE
+)
+from sky_dogma.events import SceneChangeRequested, StageRecordReached
+from sky_dogma.misc import Group
+from sky_dogma.nodes import Sprite
+from sky_dogma.actors import BackgroundScroller, Player
+from sky_dogma.layers import RenderLayers, Z_BACKGROUND, Z_SHIPS
+from sky_dogma.scheduler import UpdateScheduler, EVERY_TICK
+from sky_dogma.script import ScriptRunner, WaitUntil, tween
+from sky_dogma.snapshot import pack
+from sky_dogma.stage import load_stage, TILE
+from sky_dogma.tilemap import get_tilemap
+
+try:
+    from sky_dogma.flowfield import FlowField  # optional, needs numpy
+except ImportError:
+    FlowField = None  # no numpy, Test runs without the flow field
+
+
+#############
+# KEYFRAMES #
+#############
+# [(frame, value)] like Animator ones, played by script tweens
+SPLASH_FADE_IN_OUT = ((0, 0), (60, 0), (120, 255), (180, 255), (240, 0), (300, 0))
+CURTAIN_FADE_IN = ((0, 0), (60, 255))
+TITLE_CURTAIN_FADE_IN = ((0, 0), (60, 255), (120, 255))
+TITLE_CURTAIN_FADE_OUT = ((0, 255), (60, 255), (120, 0))
+PROMPT_BLINK = ((0, 0), (60, 122), (120, 0))  # 0 - half alpha loop
+PROMPT_FADE_OUT = ((0, 255), (60, 0), (120, 0))
+
+
+def is_any_key_pressed():
+    """
+    Splash skip condition (WaitUntil).
+    """
+    return any(autoload.Input.key_states.values())
+
+
+##########
+# SCENES #
+##########
+class SceneManager:
+    def __init__(self):
+        self.current_scene = None
+
+    def change_scene_to(self, new_scene):
+        # old scene stops listening, so its queued events cannot reach it after it is gone
+        # and lets go of what it holds open (scenes with exit, like the stage stream of Test)
+        if self.current_scene is not None:
+            autoload.EventBus.unsubscribe_owner(self.current_scene)
+            if hasattr(self.current_scene, "exit"):
+                self.current_scene.exit()
+        self.current_scene = new_scene
+        # collect + freeze what the old scene left, gc mode of the new one
+        if autoload.GC_POLICY is not None:
+            autoload.GC_POLICY.scene_changed(new_scene)
+
+    def on_scene_change_requested(self, event):
+        self.change_scene_to(event.scene_type())
+
+
+class PauseMenu:
+    """
+    THIS SCENE IS ALWAYS PRESENT.
+    It visually appears when the game is paused, this class listens for the paused button
+    This class flips the is_paused flag on and off
+    """
+    def __init__(self):
+
+        ############
+        # CHILDREN #
+        ############
+        # SETUP BACKGROUND
+        background_surface = pg.Surface((BACKGROUND_WIDTH, NATIVE_RESOLUTION[1]))  # create surf
+        background_surface.fill((0, 0, 0))  # black color
+        self.Background = Sprite(background_surface, 1, 1)  # create it as sprite
+        self.Background.alpha = 0  # alpha 0 at start (to fade in)
+
+        # layers (can do quadtree collision AABB!)
+        self.DrawnLayer = Group(is_static=True)  # for things that needs to be drawn (static, skipped while transparent)
+        self.UpdateLayer = Group()  # for things that needs to be updated
+
+        # fill draw layers (order matters, top = drawn most bottom)
+        self.DrawnLayer.add(self.Background)
+
+        ##############
+        # PROPERTIES #
+        ##############
+        self.is_paused = False  # gameplay scenes update method if guard
+        self.is_in_gameplay = False  # pause scene update method if guard
+    
+    ###########
+    # METHODS #
+    ###########
+    def update(self, delta):
+        """
+        Flip the pause flag.
+        """
+
+        # ONLY DURING GAMEPLAY SCENES CAN PAUSE HAPPEN
+        # TOOD: make a flag for is_in_game
+        # WHEN PAUSED, THIS AUTOLOAD PAUSE SCENE IS ACTIVATED
+        if autoload.Input.is_action_just_pressed(pg.K_ESCAPE) and self.is_in_gameplay:
+            self.is_paused = not self.is_paused
+    
+    def draw(self):
+        """
+        DrawnLayers call its members update func. Order matters
+        """
+        self.DrawnLayer.draw()
+    
+    ###################
+    # SETTER / GETTER #
+    ###################
+    @property
+    def is_paused(self):
+        return self._is_paused
+    # called when the prop is changed
+    @is_paused.setter
+    def is_paused(self, value):
+        self._is_paused = value
+        # paused?
+        if self.is_paused:
+            # TODO: animate this from 0 to 50% opacity
+            self.Background.alpha = 122
+        # not paused?
+        else:
+            # TODO: animate this from 50% to 0% opacity
+            self.Background.alpha = 0
+
+
+
+class Test:
+    """
+    Testing scene only.
+    Add actors and whatever here
+    """
+    is_gameplay = True  # gc policy runs gameplay mode here
+    def __init__(self):
+        # update pause is gameplay if guard
+        autoload.PauseMenu.is_in_gameplay = True
+
+        ############
+        # CHILDREN #
+        ############
+        # SETUP PLAYER
+        self.Player = Player()
+        # in this game the player always start like this, bg is wider but has same height as window
+        # update player position to middle
+        self.Player.rect.topleft = pg.Vector2(HALF_BACKGROUND_WIDTH, HALF_NATIVE_RESOLUTION[1])
+        self.Player.rect.top -= self.Player.Sprite.frame_height / 2
+        # shift downward by 3 tiles - 1 tile is 16px
+        self.Player.rect.top += ONE_TILE * 3
+
+        # background scroller
+        self.BackgroundScroller = BackgroundScroller()
+
+        # stage timeline, streamed by the scroller position
+        self.Stage = load_stage("test")
+        autoload.EventBus.subscribe(StageRecordReached, self.on_Stage_record_reached, source=self.Stage)
+
+        # flow field toward the player, homing things sample it (recomputed when the player changes cell)
+        self.FlowField = None
+        if FlowField is not None:
+            self.FlowField = FlowField()
+            self.FlowField.set_target(self.Player)
+
+        # SETUP CAMERA
+        # camera initial target in player
+        autoload.Cam.set_target(self.Player)
+        # no need to update camera limit, this game camera limit is fixed
+
+        # layers (can do quadtree collision AABB!)
+        self.DrawnLayer = RenderLayers()  # for things that needs to be drawn, by z (ships by y too)
+        self.UpdateLayer = UpdateScheduler()  # for things that needs to be updated, by tier
+
+        # fill draw layers (lower z = drawn most bottom)
+        self.DrawnLayer.add_layer(Z_SHIPS, is_y_sorted=True)
+        self.DrawnLayer.add(self.BackgroundScroller, z=Z_BACKGROUND)
+        self.DrawnLayer.add(self.Player, z=Z_SHIPS)
+
+        # fill update layers, anything that needs updating goes here
+        # scroller drives the stage, player reads input, field + camera follow: all every tick
+        self.UpdateLayer.add(self.BackgroundScroller, self.Player, tier=EVERY_TICK)
+        if self.FlowField is not None:
+            self.UpdateLayer.add(self.FlowField, tier=EVERY_TICK)
+        self.UpdateLayer.add(autoload.Cam, tier=EVERY_TICK)
+
+        # retry point, retry restores it in place instead of building the scene again
+        self.retry_state = pack(self)
+    
+    ############
+    # CALLBACK #
+    ############
+    def on_Stage_record_reached(self, event):
+        # tile record = background layer arg switches to name, streams in from the top
+        record = event.record
+        if record.kind == TILE:
+            self.BackgroundScroller.switch(record.name, record.arg, record.scroll)
+
+    ###########
+    # METHODS #
+    ###########
+    def update(self, delta):
+        """
+        UpdateLayer call its members update func.
+        """
+
+        # ONLY GAMEPLAY SCENES CAN BE PAUSED
+        # WHEN PAUSED, THE AUTOLOAD PAUSE SCENE IS ACTIVATED
+        if autoload.PauseMenu.is_paused:
+            return
+        
+        self.UpdateLayer.update(delta)
+
+        # stage records the scroller reached go out as events
+        for record in self.Stage.advance(self.BackgroundScroller.scroll):
+            autoload.EventBus.post(StageRecordReached(self.Stage, record))
+        # backgrounds coming up are cut before they are due
+        for record in self.Stage.entered:
+            if record.kind == TILE:
+                get_tilemap(record.name)
+    
+    def draw(self):
+        """
+        DrawnLayer draws its members in z order.
+        """
+        self.DrawnLayer.draw()
+
+    def save_state(self, buffer, offset: int):
+        """
+        Pack player, scroller and camera into buffer at offset, return the offset after it. See snapshot.py.
+        """
+        offset = self.Player.save_state(buffer, offset)
+        offset = self.BackgroundScroller.save_state(buffer, offset)
+        return autoload.Cam.save_state(buffer, offset)
+
+    def load_state(self, buffer, offset: int):
+        """
+        Inverse of save_state, in place. The stage stream jumps to the restored scroll.
+        """
+        offset = self.Player.load_state(buffer, offset)
+        offset = self.BackgroundScroller.load_state(buffer, offset)
+        offset = autoload.Cam.load_state(buffer, offset)
+        # records up to the restored scroll were already reached
+        self.Stage.seek(self.BackgroundScroller.scroll + 1)
+        return offset
+
+    def retry(self):
+        """
+        Back to how the scene started.
+        """
+        self.load_state(self.retry_state, 0)
+        autoload.EventBus.clear()
+
+    def exit(self):
+        """
+        Called by the SceneManager when this scene is replaced. Closes the stage file.
+        """
+        self.Stage.close()
+
+
+class MadeBySplash:
+    """
+    First Scene. Shows my name
+    """
+    def __init__(self):
+        # update pause is gameplay if guard
+        autoload.PauseMenu.is_in_gameplay = False
+        
+        ##############
+        # PROPERTIES #
+        ##############
+        self.is_skipped = False
+
+        ############
+        # CHILDREN #
+        ############
+        # SETUP BACKGROUND
+        background_surface = pg.Surface(NATIVE_RESOLUTION)  # create surf
+        background_surface.fill((0, 0, 0))  # black color
+        self.Background = Sprite(background_surface, 1, 1)  # create it as sprite
+
+        # SETUP CURTAIN (FOR WHEN PLAYER SKIPS THIS SCENE)
+        curtain_surface = pg.Surface(NATIVE_RESOLUTION)  # create surf
+        curtain_surface.fill((0, 0, 0))  # black color
+        self.Curtain = Sprite(curtain_surface, 1, 1)  # create it as sprite
+        self.Curtain.alpha = 0  # alpha 0 at start (to fade in)
+
+        # SETUP LABEL - Made by Clifford
+        made_by_text_surface = autoload.get_label("made by clifford")  # pre rendered surf
+        self.MadeByText = Sprite(made_by_text_surface, 1, 1)  # create it as sprite
+        self.MadeByText.rect.center = pg.Vector2(HALF_NATIVE_RESOLUTION[0], HALF_NATIVE_RESOLUTION[1])  # position it
+        self.MadeByText.alpha = 0  # alpha 0 at start (to fade in)
+
+        # SETUP LABEL - Press Any Key to Skip
+        press_any_text_surface = autoload.get_label("press any key to skip")  # pre rendered surf
+        self.PressAnyText = Sprite(press_any_text_surface, 1, 1)  # create it as sprite
+        self.PressAnyText.rect.bottomright = pg.Vector2(NATIVE_RESOLUTION[0] - ONE_TILE, NATIVE_RESOLUTION[1] - ONE_TILE)  # position it
+        self.PressAnyText.alpha = 0  # alpha 0 at start (to fade in)
+
+        # SCRIPTS (fade the labels in and out, skip on any key)
+        self.Scripts = ScriptRunner(self)
+        self.intro_scripts = [
+            self.Scripts.start(self.intro()),
+            self.Scripts.start(tween(self.PressAnyText, "alpha", SPLASH_FADE_IN_OUT)),
+        ]
+        self.Scripts.start(self.skip())
+
+        # layers (can do quadtree collision AABB!)
+        # static: while the labels hold (alpha 255 / 0) and the curtain is not showing, the whole layer is 1 cached blit
+        self.DrawnLayer = Group(is_static=True)  # for things that needs to be drawn
+        self.UpdateLayer = Group()  # for things that needs to be updated
+
+        # fill draw layers (order matters, top = drawn most bottom)
+        self.DrawnLayer.add(self.Background)
+        self.DrawnLayer.add(self.MadeByText)
+        self.DrawnLayer.add(self.PressAnyText)
+        self.DrawnLayer.add(self.Curtain)
+
+        # fill update layers, anything that needs updating goes here
+        self.UpdateLayer.add()
+    
+    ###########
+    # SCRIPTS #
+    ###########
+    def intro(self):
+        """
+        Label fades in and out, next scene.
+        """
+        yield from tween(self.MadeByText, "alpha", SPLASH_FADE_IN_OUT)
+        autoload.EventBus.post(SceneChangeRequested(self, LanguageSplash))
+
+    def skip(self):
+        """
+        User pressed a key? labels stop where they are, curtain fades in, next scene.
+        """
+        yield WaitUntil(is_any_key_pressed)
+        self.is_skipped = True
+        for script in self.intro_scripts:
+            self.Scripts.cancel(script)
+        yield 1
+        yield from tween(self.Curtain, "alpha", CURTAIN_FADE_IN)
+        autoload.EventBus.post(SceneChangeRequested(self, LanguageSplash))
+    
+    ###########
+    # METHODS #
+    ###########
+    def update(self, delta):
+        """
+        UpdateLayer call its members update func. Run scripts
+        """
+        # update UpdateLayer
+        self.UpdateLayer.update(delta)
+        
+        # run scripts
+        self.Scripts.update()
+    
+    def draw(self):
+        """
+        DrawnLayers call its members update func. Order matters
+        """
+        self.DrawnLayer.draw()
+
+
+class LanguageSplash:
+    """
+    First Scene. Shows my name
+    """
+    def __init__(self):
+        # update pause is gameplay if guard
+        autoload.PauseMenu.is_in_gameplay = False
+        
+        ##############
+        # PROPERTIES #
+        ##############
+        self.is_skipped = False
+
+        ############
+        # CHILDREN #
+        ############
+        # SETUP BACKGROUND
+        background_surface = pg.Surface(NATIVE_RESOLUTION)  # create surf
+        background_surface.fill((0, 0, 0))  # black color
+        self.Background = Sprite(background_surface, 1, 1)  # create it as sprite
+
+        # SETUP CURTAIN (FOR WHEN PLAYER SKIPS THIS SCENE)
+        curtain_surface = pg.Surface(NATIVE_RESOLUTION)  # create surf
+        curtain_surface.fill((0, 0, 0))  # black color
+        self.Curtain = Sprite(curtain_surface, 1, 1)  # create it as sprite
+        self.Curtain.alpha = 0  # alpha 0 at start (to fade in)
+
+        # SETUP LABEL - Made by Clifford
+        made_by_text_surface = autoload.get_label("powered by python")  # pre rendered surf
+        self.MadeByText = Sprite(made_by_text_surface, 1, 1)  # create it as sprite
+        self.MadeByText.rect.center = pg.Vector2(HALF_NATIVE_RESOLUTION[0], HALF_NATIVE_RESOLUTION[1])  # position it
+        self.MadeByText.alpha = 0  # alpha 0 at start (to fade in)
+
+        # SETUP LABEL - Press Any Key to Skip
+        press_any_text_surface = autoload.get_label("press any key to skip")  # pre rendered surf
+        self.PressAnyText = Sprite(press_any_text_surface, 1, 1)  # create it as sprite
+        self.PressAnyText.rect.bottomright = pg.Vector2(NATIVE_RESOLUTION[0] - ONE_TILE, NATIVE_RESOLUTION[1] - ONE_TILE)  # position it
+        self.PressAnyText.alpha = 0  # alpha 0 at start (to fade in)
+
+        # SCRIPTS (fade the labels in and out, skip on any key)
+        self.Scripts = ScriptRunner(self)
+        self.intro_scripts = [
+            self.Scripts.start(self.intro()),
+            self.Scripts.start(tween(self.PressAnyText, "alpha", SPLASH_FADE_IN_OUT)),
+        ]
+        self.Scripts.start(self.skip())
+
+        # layers (can do quadtree collision AABB!)
+        # static: while the labels hold (alpha 255 / 0) and the curtain is not showing, the whole layer is 1 cached blit
+        self.DrawnLayer = Group(is_static=True)  # for things that needs to be drawn
+        self.UpdateLayer = Group()  # for things that needs to be updated
+
+        # fill draw layers (order matters, top = drawn most bottom)
+        self.DrawnLayer.add(self.Background)
+        self.DrawnLayer.add(self.MadeByText)
+        self.DrawnLayer.add(self.PressAnyText)
+        self.DrawnLayer.add(self.Curtain)
+
+        # fill update layers, anything that needs updating goes here
+        self.UpdateLayer.add()
+    
+    ###########
+    # SCRIPTS #
+    ###########
+    def intro(self):
+        """
+        Label fades in and out, next scene.
+        """
+        yield from tween(self.MadeByText, "alpha", SPLASH_FADE_IN_OUT)
+        autoload.EventBus.post(SceneChangeRequested(self, TitleScreen))
+
+    def skip(self):
+        """
+        User pressed a key? labels stop where they are, curtain fades in, next scene.
+        """
+        yield WaitUntil(is_any_key_pressed)
+        self.is_skipped = True
+        for script in self.intro_scripts:
+            self.Scripts.cancel(script)
+        yield 1
+        yield from tween(self.Curtain, "alpha", CURTAIN_FADE_IN)
+        autoload.EventBus.post(SceneChangeRequested(self, TitleScreen))
+    
+    ###########
+    # METHODS #
+    ###########
+    def update(self, delta):
+        """
+        UpdateLayer call its members update func. Run scripts
+        """
+        # update UpdateLayer
+        self.UpdateLayer.update(delta)
+        
+        # run scripts
+        self.Scripts.update()
+    
+    def draw(self):
+        """
+        DrawnLayers call its members update func. Order matters
+        """
+        self.DrawnLayer.draw()
+
+
+class TitleScreen:
+    """
+    Press any button screen
+    """
+    def __init__(self):
+        # update pause is gameplay if guard
+        autoload.PauseMenu.is_in_gameplay = False
+        
+        ##############
+        # PROPERTIES #
+        ##############
+        self.is_skipped = False
+
+        ############
+        # CHILDREN #
+        ############
+        # SETUP BACKGROUND
+        self.Background = Sprite(autoload.SURFACES_DICT["title_screen_background"], 1, 1)  # create it as sprite
+
+        # SETUP CURTAIN (FOR WHEN PLAYER SKIPS THIS SCENE)
+        curtain_surface = pg.Surface(NATIVE_RESOLUTION)  # create surf
+        curtain_surface.fill((0, 0, 0))  # black color
+        self.Curtain = Sprite(curtain_surface, 1, 1)  # create it as sprite
+        self.Curtain.alpha = 255  # alpha 0 at start (to fade out)
+
+        # SETUP LABEL - Prompt
+        prompt_text_surface = autoload.get_label("press any key")  # pre rendered surf
+        self.PromptText = Sprite(prompt_text_surface, 1, 1)  # create it as sprite
+        self.PromptText.rect.center = pg.Vector2(HALF_NATIVE_RESOLUTION[0], HALF_NATIVE_RESOLUTION[1] + 4 * ONE_TILE)  # position it
+        self.PromptText.alpha = 0  # alpha 0 at start (to fade in)
+
+        # SCRIPTS (curtain fades out, prompt blinks, skip on any key)
+        self.Scripts = ScriptRunner(self)
+        self.prompt_script = None  # blink, then fade out
+        self.intro_script = self.Scripts.start(self.intro())
+        self.Scripts.start(self.skip())
+
+        # layers (can do quadtree collision AABB!)
+        self.BackgroundLayer = Group(is_static=True)  # never changes, drawn from cache
+        self.DrawnLayer = Group()  # for things that needs to be drawn
+        self.UpdateLayer = Group()  # for things that needs to be updated
+
+        # fill draw layers (order matters, top = drawn most bottom)
+        self.BackgroundLayer.add(self.Background)
+        self.DrawnLayer.add(self.PromptText)
+        self.DrawnLayer.add(self.Curtain)
+
+        # fill update layers, anything that needs updating goes here
+        self.UpdateLayer.add()
+    
+    ###########
+    # SCRIPTS #
+    ###########
+    def intro(self):
+        """
+        Curtain fades out, then the prompt blinks.
+        """
+        yield from tween(self.Curtain, "alpha", TITLE_CURTAIN_FADE_OUT)
+        # same tick the curtain is done, like the blink Animator played from the curtain finished listener
+        self.prompt_script = self.Scripts.start(
+            tween(self.PromptText, "alpha", PROMPT_BLINK, is_looping=True), is_immediate=True
+        )
+
+    def skip(self):
+        """
+        User pressed a key? fade out the prompt, fade the curtain to black and go to menu.
+        """
+        yield WaitUntil(is_any_key_pressed)
+        self.is_skipped = True
+        # curtain turns around on the fade out timeline, or fades in from the start once that is done
+        elapsed = -1 if self.intro_script.is_done else self.Scripts.tick
+        self.Scripts.cancel(self.intro_script)
+        if self.prompt_script is not None:
+            self.Scripts.cancel(self.prompt_script)
+        self.prompt_script = self.Scripts.start(tween(self.PromptText, "alpha", PROMPT_FADE_OUT, elapsed=-1))
+        yield 1
+        yield from tween(self.Curtain, "alpha", TITLE_CURTAIN_FADE_IN, elapsed=elapsed)
+        # TODO: Go to menu instead of TEST scene
+        autoload.EventBus.post(SceneChangeRequested(self, Test))
+    
+    ###########
+    # METHODS #
+    ###########
+    def update(self, delta):
+        """
+        UpdateLayer call its members update func. Run scripts
+        """
+        # update UpdateLayer
+        self.UpdateLayer.update(delta)
+        
+        # run scripts
+        self.Scripts.update()
+    
+    def draw(self):
+        """
+        DrawnLayers call its members update func. Order matters
+        """
+        self.BackgroundLayer.draw()
+        self.DrawnLayer.draw()
@@ -0,0 +1,251 @@
+import time
+from collections import deque
+
+from sky_dogma import autoload
+from sky_dogma.constants import NATIVE_RESOLUTION
+
+"""
+Tiered update scheduler, a drop in for an UpdateLayer Group (add + update(delta)).
+Tier = every how many ticks a node updates: EVERY_TICK, EVERY_2ND, EVERY_4TH, or ON_EVENT (only when woken).
+Slower tiers are split in buckets (node i of a tier updates on ticks where tick % rate == i % rate), so a tier never
+fires all at once. Nodes get the time elapsed since their own last update (entries keep when that was), so changing
+tier, or sleeping on event for a while, never skips or repeats time.
+LOD: nodes added with lod=True are re-tiered every LOD_INTERVAL ticks: on screen = their tier, off screen = OFFSCREEN_TIER,
+is_dormant = ON_EVENT. Optional work (AI replanning, pathing) goes through request, runs after the updates within
+budget_ms per frame, what does not fit waits for the next frame.
+"""
+
+EVERY_TICK = 1
+EVERY_2ND = 2
+EVERY_4TH = 4
+ON_EVENT = 0
+TIERS = (EVERY_TICK, EVERY_2ND, EVERY_4TH)
+
+OFFSCREEN_TIER = EVERY_4TH
+LOD_INTERVAL = 15  # ticks between re-tiering
+LOD_MARGIN = 32  # px around the viewport that still counts as on screen
+# quality governor knob, high -> minimal: (slowest tier on screen lod nodes may run at, share of the work budget)
+LOD_TIERS = ((EVERY_TICK, 1.0), (EVERY_TICK, 0.5), (EVERY_2ND, 0.5), (EVERY_2ND, 0.25))
+
+
+class Entry:
+    """
+    1 scheduled node.
+    """
+    __slots__ = ("node", "tier", "current_tier", "is_lod", "bucket", "slot", "updated_at")
+
+    def __init__(self, node, tier: int, is_lod: bool):
+        self.node = node
+        self.tier = tier  # asked for
+        self.current_tier = tier  # after lod
+        self.is_lod = is_lod
+        self.bucket = None  # dict it is in (None = on event)
+        self.slot = 0  # spread counter, picks the bucket
+        self.updated_at = 0.0  # scheduler time of the last update (every tick nodes: only kept when they leave the tier)
+
+
+class UpdateScheduler:
+    """
+    Update nodes by tier, spread over ticks, within a budget for optional work.
+    """
+    def __init__(self, budget_ms: float = 2.0):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.entries = {}  # key = node | val = Entry, add order
+        # key = tier | val = list of buckets, bucket = dict, key = node | val = Entry (add order, O(1) removal)
+        self.buckets = {tier: [{} for _ in range(tier)] for tier in TIERS}
+        self.bucket_sizes = {tier: 0 for tier in TIERS}  # nodes added to a tier so far, spreads the next one
+        self.woken = {}  # key = on event node to update this tick | val = its Entry
+        self.owed = {}  # key = node back to every tick | val = seconds it missed before, added to its next delta
+        self.tick = 0
+        self.time = 0.0  # sum of the deltas, up to the last tick
+
+        # optional work
+        self.budget = budget_ms / 1000.0
+        self.budget_share = 1.0
+        self.onscreen_tier = EVERY_TICK  # lod nodes on screen run at least this slow
+        self.requests = deque()  # (key, function, args)
+        self.requested_keys = set()  # dedupes, 1 pending request per key
+
+        # stats, last tick
+        self.updated_count = 0
+        self.requests_run = 0
+        self.requests_deferred = 0
+        self.request_seconds = 0.0
+
+        if autoload.GOVERNOR is not None:
+            autoload.GOVERNOR.register("update_lod", LOD_TIERS, self.set_lod)
+
+    ###########
+    # METHODS #
+    ###########
+    def set_lod(self, lod):
+        """
+        lod = (slowest on screen tier, budget share), see LOD_TIERS. Nodes move at the next lod pass.
+        """
+        self.onscreen_tier, self.budget_share = lod
+
+    def add(self, *nodes, tier: int = EVERY_TICK, lod: bool = False):
+        """
+        Schedule nodes at tier. Lod = may drop to a cheaper tier off screen / dormant (needs a rect).
+        """
+        for node in nodes:
+            if node in self.entries:
+                continue
+            entry = Entry(node, tier, lod)
+            entry.updated_at = self.time
+            self.entries[node] = entry
+            self.place(entry, tier)
+
+    def remove(self, *nodes):
+        for node in nodes:
+            entry = self.entries.pop(node, None)
+            if entry is not None and entry.bucket is not None:
+                del entry.bucket[node]
+            self.woken.pop(node, None)
+            self.owed.pop(node, None)
+
+    def place(self, entry: Entry, tier: int):
+        """
+        Move entry to the next bucket of tier (round robin, keeps buckets even).
+        Runs between ticks or before the updates of a tick: every tick nodes last updated at self.time.
+        """
+        node = entry.node
+        if entry.bucket is not None:
+            del entry.bucket[node]
+        if entry.current_tier == EVERY_TICK:
+            # what it still owed was not updated yet
+            entry.updated_at = self.time - self.owed.pop(node, 0.0)
+        elif entry.current_tier == ON_EVENT:
+            self.woken.pop(node, None)  # on a tier now, that update comes anyway
+        entry.current_tier = tier
+        if tier == ON_EVENT:
+            entry.bucket = None
+            return
+        if tier == EVERY_TICK and entry.updated_at < self.time:
+            self.owed[node] = self.time - entry.updated_at
+        entry.slot = self.bucket_sizes[tier]
+        self.bucket_sizes[tier] += 1
+        entry.bucket = self.buckets[tier][entry.slot % tier]
+        entry.bucket[node] = entry
+
+    def wake(self, node):
+        """
+        Update an on event node on the next tick (once), with the time it slept. Nodes on a tier are left alone.
+        """
+        entry = self.entries.get(node)
+        if entry is not None and entry.current_tier == ON_EVENT:
+            self.woken[node] = entry
+
+    def request(self, key, function, *args):
+        """
+        Optional work, function(*args) runs when the frame budget allows. Requesting a pending key again is ignored.
+        """
+        if key in self.requested_keys:
+            return
+        self.requested_keys.add(key)
+        self.requests.append((key, function, args))
+
+    def update(self, delta):
+        """
+        Called once per frame, like Group.update. Nodes added / removed by an update count from the next tick.
+        """
+        self.tick += 1
+        # before the time moves on, place() relies on it
+        if self.tick % LOD_INTERVAL == 0:
+            self.update_lod()
+        self.time += delta
+        now = self.time
+
+        # every tick first (add order), the ones back from a slower tier get what they missed too
+        updated_count = 0
+        every_tick = self.buckets[EVERY_TICK][0]
+        if self.owed:
+            owed, self.owed = self.owed, {}
+            for node in tuple(every_tick):
+                node.update(delta + owed.get(node, 0.0))
+        else:
+            for node in tuple(every_tick):
+                node.update(delta)
+        updated_count += len(every_tick)
+
+        # then 1 bucket of each slower tier
+        for tier in TIERS[1:]:
+            bucket = self.buckets[tier][self.tick % tier]
+            if bucket:
+                for node, entry in tuple(bucket.items()):
+                    node.update(now - entry.updated_at)
+                    entry.updated_at = now
+                updated_count += len(bucket)
+
+        # woken on event nodes
+        if self.woken:
+            woken, self.woken = self.woken, {}
+            for node, entry in woken.items():
+                node.update(now - entry.updated_at)
+                entry.updated_at = now
+            updated_count += len(woken)
+        self.updated_count = updated_count
+
+        self.run_requests()
+
+    def update_lod(self):
+        """
+        Re-tier lod nodes by where they are relative to the camera viewport.
+        """
+        camera_x = autoload.Cam.global_position.x if autoload.Cam is not None else 0.0
+        camera_y = autoload.Cam.global_position.y if autoload.Cam is not None else 0.0
+        left = camera_x - LOD_MARGIN
+        top = camera_y - LOD_MARGIN
+        right = camera_x + NATIVE_RESOLUTION[0] + LOD_MARGIN
+        bottom = camera_y + NATIVE_RESOLUTION[1] + LOD_MARGIN
+        for entry in self.entries.values():
+            if not entry.is_lod:
+                continue
+            node = entry.node
+            if getattr(node, "is_dormant", False):
+                tier = ON_EVENT
+            else:
+                rect = node.rect
+                is_on_screen = rect.right > left and rect.x < right and rect.bottom > top and rect.y < bottom
+                tier = max(entry.tier, self.onscreen_tier if is_on_screen else OFFSCREEN_TIER)
+            if tier != entry.current_tier:
+                self.place(entry, tier)
+
+    def run_requests(self):
+        """
+        Optional work in request order until the budget is spent.
+        """
+        start = time.perf_counter()
+        deadline = start + self.budget * self.budget_share
+        run_count = 0
+        requests = self.requests
+        while requests:
+            key, function, args = requests.popleft()
+            self.requested_keys.discard(key)
+            function(*args)
+            run_count += 1
+            if time.perf_counter() >= deadline:
+                break
+        self.requests_run = run_count
+        self.requests_deferred = len(requests)
+        self.request_seconds = time.perf_counter() - start
+
+    ###########
+    # GETTERS #
+    ###########
+    def stats(self):
+        """
+        Last tick: nodes updated, optional work run / still waiting / ms spent. Nodes per current tier.
+        """
+        tiers = {tier: 0 for tier in TIERS + (ON_EVENT,)}
+        for entry in self.entries.values():
+            tiers[entry.current_tier] += 1
+        return {
+            "updated": self.updated_count,
+            "requests_run": self.requests_run,
+            "requests_deferred": self.requests_deferred,
+            "request_ms": self.request_seconds * 1000.0,
+            "tiers": tiers,
+        }
@@ -0,0 +1,301 @@
+from dataclasses import dataclass
+from collections import defaultdict
+
+from sky_dogma import autoload
+from sky_dogma.constants import FPS
+from sky_dogma.helpers import lerp
+
+"""
+Scene scripts as generator coroutines. A script yields what it waits for:
+    yield 30  /  yield WaitFrames(30)         30 frames
+    yield WaitSeconds(0.5)                    rounded to frames
+    yield WaitEvent(AnimationFinished, animator)  next matching event from the bus (the yield returns it)
+    yield WaitUntil(lambda: ...)              polled every frame, the only wait that costs while waiting
+    yield from tween(sprite, "alpha", keyframes)  play Animator style keyframes, holds are 1 wait not 1 update per frame
+Scripts run in update, scene changes go through the bus (SceneChangeRequested) so they still happen at dispatch.
+Sleeping scripts are parked in a hierarchical timer wheel (LEVELS wheels of SLOTS slots, each slot of a level spans
+a whole turn of the level below). A tick only looks at 1 slot, slots of upper levels are cascaded down once per turn,
+so parked scripts cost nothing until they are due, thousands of them included.
+A script runs frame t work when resumed at tick t. Started scripts first run on the next tick (like an Animator played
+in a constructor, its first update is the next frame), or right away with is_immediate (chained from a running script).
+"""
+
+BITS = 6
+SLOTS = 1 << BITS  # 64
+MASK = SLOTS - 1
+LEVELS = 4  # 64 ** 4 frames = ~77 h at 60 FPS, longer waits are clamped
+
+
+#########
+# WAITS #
+#########
+@dataclass(frozen=True, slots=True)
+class WaitFrames:
+    frames: int = 1
+
+
+@dataclass(frozen=True, slots=True)
+class WaitSeconds:
+    seconds: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class WaitEvent:
+    """
+    Next event of event_type (from source only, if given) dispatched by the event bus.
+    """
+    event_type: type = None
+    source: object = None
+
+
+@dataclass(frozen=True, slots=True)
+class WaitUntil:
+    """
+    Until predicate() is true, checked once per tick.
+    """
+    predicate: object = None
+
+
+def tween(target, property_name: str, keyframes, is_interpolate: bool = True, is_looping: bool = False, elapsed: int = 0):
+    """
+    Sets target property like Animator does with the same keyframes ([(frame, value)]) at the same frames,
+    but waits out holds (equal values, or no interpolation) in 1 yield. Use with yield from.
+    Elapsed = frames already played, like Animator.elapsed_frame (-1 = played after a reset, -1 frame before 0).
+    Returns on the frame an Animator would post AnimationFinished.
+    """
+    first_frame, first_value = keyframes[0]
+    frame = first_frame + elapsed + 1  # frame this resume plays
+    while True:
+        # played from a reset or looping, the first keyframe is set on a frame of its own
+        if frame == first_frame:
+            setattr(target, property_name, first_value)
+            yield 1
+            frame += 1
+
+        for (start_frame, start_value), (end_frame, end_value) in zip(keyframes, keyframes[1:]):
+            if end_frame < frame:
+                continue
+            if is_interpolate and start_value != end_value:
+                while frame < end_frame:
+                    weight = (frame - start_frame) / (end_frame - start_frame)
+                    setattr(target, property_name, lerp(start_value, end_value, weight))
+                    yield 1
+                    frame += 1
+            elif frame < end_frame:
+                # started in the middle of a hold, Animator would have set it by now
+                if is_interpolate and getattr(target, property_name) != start_value:
+                    setattr(target, property_name, start_value)
+                yield end_frame - frame
+                frame = end_frame
+            setattr(target, property_name, end_value)
+            yield 1
+            frame += 1
+
+        if not is_looping:
+            return
+        # Animator idles 1 frame after the last keyframe, then starts over
+        yield 1
+        frame = first_frame
+
+
+##########
+# SCRIPT #
+##########
+class Script:
+    """
+    1 running coroutine.
+    """
+    __slots__ = ("generator", "is_done", "due")
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.is_done = False
+        self.due = 0  # tick it is parked until (wheel only)
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel of scripts. insert is O(1), advance looks at 1 slot (+ cascades once per turn).
+    """
+    def __init__(self):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.tick = 0
+        self.wheels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self.count = 0
+
+    ###########
+    # METHODS #
+    ###########
+    def insert(self, script: Script, due: int):
+        """
+        Park script until tick due (> current tick).
+        """
+        delta = due - self.tick
+        for level in range(LEVELS):
+            if delta < 1 << (BITS * (level + 1)):
+                break
+        else:
+            due = self.tick + (1 << (BITS * LEVELS)) - 1
+        script.due = due
+        self.wheels[level][(due >> (BITS * level)) & MASK].append(script)
+        self.count += 1
+
+    def advance(self):
+        """
+        Next tick. Returns the scripts due now.
+        """
+        self.tick += 1
+        tick = self.tick
+        # cascade upper levels whose turn starts now, top down so entries fall all the way
+        for level in range(LEVELS - 1, 0, -1):
+            if tick & ((1 << (BITS * level)) - 1) == 0:
+                slot = self.wheels[level][(tick >> (BITS * level)) & MASK]
+                if slot:
+                    self.wheels[level][(tick >> (BITS * level)) & MASK] = []
+                    self.count -= len(slot)
+                    for script in slot:
+                        if not script.is_done:
+                            self.insert(script, script.due)
+        due = self.wheels[0][tick & MASK]
+        if not due:
+            return due
+        self.wheels[0][tick & MASK] = []
+        self.count -= len(due)
+        return due
+
+
+class ScriptRunner:
+    """
+    Runs the scripts of 1 owner (a scene). Owner leaving (SceneManager unsubscribes it) drops the event waits too.
+    update once per frame.
+    """
+    def __init__(self, owner=None):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.owner = owner
+        self.wheel = TimerWheel()
+        self.polled = []  # (script, predicate)
+        self.event_waits = defaultdict(list)  # key = (event type, source) | val = scripts
+        self.subscribed = set()  # keys the bus already calls on_event for
+        self.alive_count = 0
+
+        # stats, last tick
+        self.resumed_count = 0
+
+    ###########
+    # METHODS #
+    ###########
+    def start(self, generator, is_immediate: bool = False):
+        """
+        Run generator as a script from the next tick. Returns its Script (for cancel).
+        Is_immediate = run it now, from a script chaining the next one in the same tick (like an Animator played
+        from a finished listener, it was updated that frame).
+        """
+        script = Script(generator)
+        self.alive_count += 1
+        if is_immediate:
+            self.resume(script)
+        else:
+            self.wheel.insert(script, self.wheel.tick + 1)
+        return script
+
+    def cancel(self, script: Script):
+        """
+        Stop a script where it waits (wherever it is parked, it is skipped from now on). Not for the running one,
+        a script ends itself with return.
+        """
+        if not script.is_done:
+            script.is_done = True
+            self.alive_count -= 1
+            script.generator.close()
+
+    def update(self):
+        """
+        1 tick: resume the scripts that are due, then poll the WaitUntil ones.
+        """
+        resumed_count = 0
+        for script in self.wheel.advance():
+            if not script.is_done:
+                self.resume(script)
+                resumed_count += 1
+
+        if self.polled:
+            polled, self.polled = self.polled, []
+            for script, predicate in polled:
+                if script.is_done:
+                    continue
+                if predicate():
+                    self.resume(script)
+                    resumed_count += 1
+                else:
+                    self.polled.append((script, predicate))
+        self.resumed_count = resumed_count
+
+    def resume(self, script: Script, value=None):
+        """
+        Run script until its next wait, park it there.
+        """
+        try:
+            wait = script.generator.send(value)
+        except StopIteration:
+            script.is_done = True
+            self.alive_count -= 1
+            return
+
+        wait_type = type(wait)
+        if wait_type is int or wait_type is WaitFrames:
+            frames = wait if wait_type is int else wait.frames
+            self.wheel.insert(script, self.wheel.tick + max(1, frames))
+        elif wait_type is WaitSeconds:
+            self.wheel.insert(script, self.wheel.tick + max(1, round(wait.seconds * FPS)))
+        elif wait_type is WaitEvent:
+            key = (wait.event_type, wait.source)
+            self.event_waits[key].append(script)
+            if key not in self.subscribed:
+                self.subscribed.add(key)
+                autoload.EventBus.subscribe(wait.event_type, self.on_event, source=wait.source, owner=self.owner)
+        elif wait_type is WaitUntil:
+            self.polled.append((script, wait.predicate))
+        else:
+            raise TypeError(f"script yielded {wait!r}, not a wait")
+
+    ##########
+    # EVENTS #
+    ##########
+    def on_event(self, event):
+        """
+        Event bus callback, resumes whoever waits for it (the yield returns the event).
+        """
+        event_type = type(event)
+        for key in ((event_type, event.source), (event_type, None)):
+            scripts = self.event_waits.pop(key, None)
+            if not scripts:
+                continue
+            for script in scripts:
+                if not script.is_done:
+                    self.resume(script, event)
+
+    ###########
+    # GETTERS #
+    ###########
+    @property
+    def tick(self):
+        """
+        Ticks (updates) so far.
+        """
+        return self.wheel.tick
+
+    def stats(self):
+        """
+        Scripts alive, parked in the wheel, polled, waiting for events, resumed last tick.
+        """
+        return {
+            "alive": self.alive_count,
+            "parked": self.wheel.count,
+            "polled": len(self.polled),
+            "event_waits": sum(len(scripts) for scripts in self.event_waits.values()),
+            "resumed": self.resumed_count,
+        }
@@ -0,0 +1,136 @@
+import hashlib
+from array import array
+
+from sky_dogma.constants import FPS
+
+"""
+Simulation state snapshots. Every stateful node packs itself with a class level STATE struct (save_state / load_state
+take a buffer + offset and return the next offset), Game.save_state walks them: frame count, pause, rng, scene.
+No pickling, no allocation, restore writes into the live objects (instant retry, rewind, desync checks).
+What is not state: surfaces, frame tables, animations (built by the constructors, never change).
+"""
+
+SCRATCH_SIZE = 64 * 1024  # bytes, more than any scene snapshot
+
+
+def pack(node):
+    """
+    State of anything with save_state, as bytes of the exact size (scene retry points, tests).
+    """
+    buffer = bytearray(SCRATCH_SIZE)
+    return bytes(buffer[:node.save_state(buffer, 0)])
+
+
+def snapshot_size(game):
+    """
+    Bytes a snapshot of the game current scene takes.
+    """
+    return game.save_state(bytearray(SCRATCH_SIZE), 0)
+
+
+def state_digest(buffer):
+    """
+    Hash of a packed state. Cheap (no pixels), equal simulations give equal digests.
+    """
+    return hashlib.blake2b(buffer, digest_size=16).hexdigest()
+
+
+class SnapshotRing:
+    """
+    The last seconds of snapshots of 1 game + scene, in 1 preallocated buffer of capacity fixed size slots.
+    capture after Game.step, restore any frame still in the ring.
+    """
+    def __init__(self, game, seconds: float = 5.0, every: int = 1):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.game = game
+        self.scene = game.SceneManager.current_scene  # snapshots only fit the scene they came from
+        self.every = every  # capture every n frames
+
+        self.slot_size = snapshot_size(game)
+        self.capacity = max(1, int(seconds * FPS / every))
+        self.buffer = bytearray(self.slot_size * self.capacity)
+        self.view = memoryview(self.buffer)
+        self.frames = array("q", [-1] * self.capacity)  # frame count held by each slot, -1 = empty
+        self.head = 0  # next slot to write
+        self.count = 0
+
+    ###########
+    # METHODS #
+    ###########
+    def capture(self, force: bool = False):
+        """
+        Snapshot the game now (only every n frames unless forced). Returns the frame count captured, or None.
+        """
+        if self.game.SceneManager.current_scene is not self.scene:
+            raise ValueError("scene changed, make a new SnapshotRing")
+        frame_count = self.game.frame_count
+        if not force and frame_count % self.every:
+            return None
+        self.game.save_state(self.buffer, self.head * self.slot_size)
+        self.frames[self.head] = frame_count
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        return frame_count
+
+    def slot_of(self, frame_count: int):
+        """
+        Slot holding given frame, or None when it left the ring (or was never captured).
+        """
+        for age in range(self.count):
+            slot = (self.head - 1 - age) % self.capacity
+            if self.frames[slot] == frame_count:
+                return slot
+        return None
+
+    def restore(self, frame_count: int = None, is_truncating: bool = True):
+        """
+        Put the game back to a captured frame (latest if None). Truncating forgets the newer snapshots (rewind),
+        keeping them allows jumping forward again (debugging).
+        """
+        if self.game.SceneManager.current_scene is not self.scene:
+            raise ValueError("scene changed, snapshots do not fit it")
+        if not self.count:
+            raise LookupError("no snapshot captured yet")
+        slot = (self.head - 1) % self.capacity if frame_count is None else self.slot_of(frame_count)
+        if slot is None:
+            raise LookupError(f"frame {frame_count} is not in the ring")
+        self.game.load_state(self.view[slot * self.slot_size:(slot + 1) * self.slot_size])
+
+        if is_truncating:
+            while self.head != (slot + 1) % self.capacity:
+                self.head = (self.head - 1) % self.capacity
+                self.frames[self.head] = -1
+                self.count -= 1
+        return self.frames[slot]
+
+    def rewind(self, seconds: float):
+        """
+        Restore the oldest snapshot not older than seconds ago. Returns the frame count restored to.
+        """
+        target = self.game.frame_count - int(seconds * FPS)
+        best = None
+        for age in range(self.count):
+            slot = (self.head - 1 - age) % self.capacity
+            if self.frames[slot] < target:
+                break
+            best = self.frames[slot]
+        return self.restore(best)
+
+    def digest(self, frame_count: int = None):
+        """
+        state_digest of a captured frame (latest if None).
+        """
+        slot = (self.head - 1) % self.capacity if frame_count is None else self.slot_of(frame_count)
+        if slot is None:
+            raise LookupError(f"frame {frame_count} is not in the ring")
+        return state_digest(self.view[slot * self.slot_size:(slot + 1) * self.slot_size])
+
+    def oldest(self):
+        """
+        Oldest frame count still in the ring, or None.
+        """
+        if not self.count:
+            return None
+        return self.frames[(self.head - self.count) % self.capacity]
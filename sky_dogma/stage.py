@@ -0,0 +1,291 @@
+import os
+import sys
+import json
+import mmap
+import struct
+import argparse
+from collections import deque, namedtuple
+
+from sky_dogma.constants import NATIVE_RESOLUTION, ROOT_DIR
+
+"""
+Stage data: a timeline of spawns, background tiles and triggers keyed by scroll position (px scrolled so far).
+Source = json (human editable), built offline into a compact binary read through mmap:
+
+HEADER   magic, version, record count, chunk size, chunk count, string count, offsets of the 3 parts below
+STRINGS  u16 length + utf8 bytes, names (enemy / tile / trigger) are stored once, records hold the index
+INDEX    u32 per chunk of chunk_size scroll px = first record at or after that chunk (+1 end entry), seek is O(1)
+RECORDS  16 bytes each, sorted by scroll: u32 scroll, u8 kind, u8 pad, u16 name, i16 x, i16 y, i32 arg
+
+At runtime only the records between the camera and the lookahead are unpacked, passed ones are dropped,
+so opening is instant and memory stays constant however long the stage is.
+python -m sky_dogma.stage build assets/stages/test.json assets/stages/test.stage
+python -m sky_dogma.stage dump assets/stages/test.stage
+"""
+
+STAGE_DIR = os.path.join(ROOT_DIR, "assets/stages")
+
+MAGIC = b"SKYSTAGE"
+VERSION = 1
+HEADER = struct.Struct("<8sHIIIIIII")  # magic, version, records, chunk size, chunks, strings, strings at, index at, records at
+RECORD = struct.Struct("<IBBHhhi")
+INDEX_ENTRY = struct.Struct("<I")
+STRING_LENGTH = struct.Struct("<H")
+
+# kinds
+SPAWN = 1
+TILE = 2
+TRIGGER = 3
+KIND_NAMES = {SPAWN: "spawn", TILE: "tile", TRIGGER: "trigger"}
+KINDS = {name: kind for kind, name in KIND_NAMES.items()}
+
+# index = position in the file, so 2 equal records are still 2 different records
+StageRecord = namedtuple("StageRecord", ("index", "scroll", "kind", "name", "x", "y", "arg"))
+
+
+#########
+# BUILD #
+#########
+def build_stage(source: dict):
+    """
+    Source dict (see test.json) -> stage file bytes.
+    """
+    chunk_size = source.get("chunk_size", 64)
+    events = sorted(source["events"], key=lambda event: event["scroll"])  # stable, same scroll keeps file order
+
+    # string table
+    strings = []
+    string_ids = {}
+    records = bytearray()
+    for event in events:
+        name = event.get("name", "")
+        if name not in string_ids:
+            string_ids[name] = len(strings)
+            strings.append(name)
+        records += RECORD.pack(
+            event["scroll"], KINDS[event["kind"]], 0, string_ids[name],
+            event.get("x", 0), event.get("y", 0), event.get("arg", 0)
+        )
+
+    string_bytes = bytearray()
+    for name in strings:
+        encoded = name.encode("utf-8")
+        string_bytes += STRING_LENGTH.pack(len(encoded)) + encoded
+
+    # index, first record of every chunk (+ end)
+    last_scroll = events[-1]["scroll"] if events else 0
+    chunk_count = last_scroll // chunk_size + 1
+    index = bytearray()
+    record_index = 0
+    for chunk in range(chunk_count + 1):
+        while record_index < len(events) and events[record_index]["scroll"] < chunk * chunk_size:
+            record_index += 1
+        index += INDEX_ENTRY.pack(record_index)
+
+    strings_at = HEADER.size
+    index_at = strings_at + len(string_bytes)
+    records_at = index_at + len(index)
+    header = HEADER.pack(MAGIC, VERSION, len(events), chunk_size, chunk_count, len(strings), strings_at, index_at, records_at)
+    return bytes(header + string_bytes + index + records)
+
+
+def dump_stage(path: str):
+    """
+    Stage file -> source dict (the inverse of build_stage).
+    """
+    with StageStream(path) as stage:
+        events = []
+        for record_index in range(stage.record_count):
+            record = stage.read_record(record_index)
+            events.append({
+                "scroll": record.scroll, "kind": KIND_NAMES[record.kind], "name": record.name,
+                "x": record.x, "y": record.y, "arg": record.arg
+            })
+        return {"chunk_size": stage.chunk_size, "events": events}
+
+
+# key = stage file path | val = times load_stage rebuilt it in this process, streams open on it reload when it moves
+GENERATIONS = {}
+
+
+def load_stage(name: str, lookahead: int = NATIVE_RESOLUTION[1]):
+    """
+    Open assets/stages/<name>.stage, rebuilding it first when its json source is newer (streams other owners have
+    open on the old file stay valid, they switch to the new one at their next advance).
+    """
+    source_path = os.path.join(STAGE_DIR, name + ".json")
+    stage_path = os.path.join(STAGE_DIR, name + ".stage")
+    if os.path.exists(source_path) and (
+        not os.path.exists(stage_path) or os.path.getmtime(source_path) > os.path.getmtime(stage_path)
+    ):
+        with open(source_path) as file:
+            data = build_stage(json.load(file))
+        # write then rename, so a game reading it (other farm worker) never sees half a file
+        temp_path = f"{stage_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, stage_path)
+        GENERATIONS[stage_path] = GENERATIONS.get(stage_path, 0) + 1
+    return StageStream(stage_path, lookahead)
+
+
+##########
+# STREAM #
+##########
+class StageStream:
+    """
+    Reads a stage file through mmap. Call advance with the current scroll every tick, it returns the records that are due.
+    Keeps only the records between scroll and scroll + lookahead unpacked (the window).
+    When load_stage rebuilds the file, the stream maps the new one at its next advance and goes on from where it was.
+    """
+    def __init__(self, path: str, lookahead: int = NATIVE_RESOLUTION[1]):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.path = path
+        self.lookahead = lookahead
+        self.map_file()
+
+        self.window = deque()  # unpacked records ahead of the camera, sorted by scroll
+        self.next_record = 0  # first record not unpacked yet
+        self.reached_scroll = None  # records up to here were returned (None = none yet)
+        self.entered = []  # records the last advance unpacked (preload what they need)
+        self.max_window = 0  # stats, most records held at once
+
+    ###########
+    # METHODS #
+    ###########
+    def map_file(self):
+        """
+        Map the file at path, read its header + names.
+        """
+        self.generation = GENERATIONS.get(self.path, 0)
+        self.file = open(self.path, "rb")
+        self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic, version, self.record_count, self.chunk_size, self.chunk_count,
+            string_count, strings_at, self.index_at, self.records_at
+        ) = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a version {VERSION} stage file")
+
+        # names are few (not proportional to stage length), read them once
+        self.strings = []
+        offset = strings_at
+        for _ in range(string_count):
+            (length,) = STRING_LENGTH.unpack_from(self.buffer, offset)
+            self.strings.append(self.buffer[offset + STRING_LENGTH.size:offset + STRING_LENGTH.size + length].decode("utf-8"))
+            offset += STRING_LENGTH.size + length
+
+    def reload(self):
+        """
+        Switch to the rebuilt file, records already returned are not returned again.
+        """
+        self.buffer.close()
+        self.file.close()
+        self.map_file()
+        if self.reached_scroll is None:
+            self.window.clear()
+            self.next_record = 0
+        else:
+            self.seek(self.reached_scroll + 1)
+
+    def read_record(self, record_index: int):
+        """
+        Unpack 1 record straight from the mapped file.
+        """
+        scroll, kind, _, name_id, x, y, arg = RECORD.unpack_from(self.buffer, self.records_at + record_index * RECORD.size)
+        return StageRecord(record_index, scroll, kind, self.strings[name_id], x, y, arg)
+
+    def first_record_at(self, scroll: int):
+        """
+        Index of the first record with record.scroll >= scroll. Index lookup, then a scan inside 1 chunk.
+        """
+        chunk = min(max(0, scroll) // self.chunk_size, self.chunk_count)
+        (record_index,) = INDEX_ENTRY.unpack_from(self.buffer, self.index_at + chunk * INDEX_ENTRY.size)
+        while record_index < self.record_count and self.read_record(record_index).scroll < scroll:
+            record_index += 1
+        return record_index
+
+    def seek(self, scroll: int):
+        """
+        Jump to scroll (restart, rewind), records before it will not be returned.
+        """
+        self.window.clear()
+        self.entered = []
+        self.next_record = self.first_record_at(scroll)
+        self.reached_scroll = scroll - 1
+
+    def advance(self, scroll: int):
+        """
+        Unpack what entered the lookahead, return (and forget) the records that are due (record.scroll <= scroll).
+        """
+        if GENERATIONS.get(self.path, 0) != self.generation:
+            self.reload()
+        self.reached_scroll = scroll
+
+        # stream in
+        limit = scroll + self.lookahead
+        self.entered = []
+        while self.next_record < self.record_count:
+            record = self.read_record(self.next_record)
+            if record.scroll > limit:
+                break
+            self.window.append(record)
+            self.entered.append(record)
+            self.next_record += 1
+        self.max_window = max(self.max_window, len(self.window))
+
+        # evict what scrolled past
+        due = []
+        while self.window and self.window[0].scroll <= scroll:
+            due.append(self.window.popleft())
+        return due
+
+    def upcoming(self):
+        """
+        Records in the window, not due yet (for preloading spawns / tiles).
+        """
+        return tuple(self.window)
+
+    def close(self):
+        """
+        Unmap + close the file. Closing twice is fine.
+        """
+        if self.buffer.closed:
+            return
+        self.window.clear()
+        self.buffer.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stage converter.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="json source -> stage file")
+    build.add_argument("source")
+    build.add_argument("out")
+    dump = commands.add_parser("dump", help="stage file -> json source (stdout)")
+    dump.add_argument("stage")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        with open(args.source) as file:
+            data = build_stage(json.load(file))
+        with open(args.out, "wb") as file:
+            file.write(data)
+        print(f"{args.out}: {len(data)} bytes")
+    else:
+        json.dump(dump_stage(args.stage), sys.stdout, indent=1)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+import pygame as pg  # https://pyga.me/docs/
+import struct
+from collections import OrderedDict
+
+from sky_dogma import autoload
+from sky_dogma.constants import NATIVE_RESOLUTION, ONE_TILE
+
+"""
+Tilemap backgrounds. A TileMap is ONE_TILE px tiles (equal tiles stored once) + rows of tile indices, a background is
+described by indices instead of a screen sized image. Rows are pre rendered into strip surfaces on first use (LRU,
+STRIP_CACHE rows per map), a frame blits only the strips crossing the viewport: draw cost is bounded by the screen
+size, not by how big the background is.
+A TileLayer scrolls maps at a parallax factor. Maps stack upward: switch puts a new map above the rows already shown,
+it streams in from the top edge as the layer scrolls (seamless, nothing on screen changes), the old one is dropped
+once it scrolled out (advance, from the scroll in update: segments are snapshot state, drawn or not they are the
+same). Row k covers layer y [k * ONE_TILE, (k + 1) * ONE_TILE) before the layer scroll is added.
+"""
+
+STRIP_CACHE = 32  # rows kept rendered per map
+MAX_SEGMENTS = 3  # maps 1 layer holds at once (the shown one + pending switches)
+NAME_SIZE = 16  # snapshot bytes per map name
+VIEW_HEIGHT = NATIVE_RESOLUTION[1]
+
+# process wide, key = name | val = TileMap (made from the surface of the same name)
+TILEMAPS = {}
+
+
+###########
+# TILEMAP #
+###########
+class TileMap:
+    """
+    Tiles + row major tile indices, columns wide.
+    """
+    def __init__(self, name: str, tiles, columns: int, indices):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.name = name
+        self.tiles = tiles  # list of ONE_TILE x ONE_TILE surfaces
+        self.columns = columns
+        self.indices = indices  # len = columns * rows
+        self.rows = len(indices) // columns
+        self.width = columns * ONE_TILE
+        self.strips = OrderedDict()  # key = row | val = strip surface, least recently used first
+
+    ###########
+    # METHODS #
+    ###########
+    def strip(self, row: int):
+        """
+        Row as 1 surface (width x ONE_TILE), rendered on first use.
+        """
+        strip = self.strips.get(row)
+        if strip is not None:
+            self.strips.move_to_end(row)
+            return strip
+
+        tile = self.tiles[0]
+        strip = pg.Surface((self.width, ONE_TILE), tile.get_flags(), tile)
+        # paletted tiles: same palette + transparent index, indices are copied as is
+        if tile.get_bitsize() == 8:
+            strip.set_palette(tile.get_palette())
+            strip.fill(tile.get_colorkey())
+            strip.set_colorkey(tile.get_colorkey())
+            strip.set_alpha(tile.get_alpha())
+        # per pixel alpha: add onto transparent = exact copy (a blend would mix the alpha in)
+        flags = pg.BLEND_RGBA_ADD if tile.get_flags() & pg.SRCALPHA else 0
+        start = row * self.columns
+        for column, index in enumerate(self.indices[start:start + self.columns]):
+            strip.blit(self.tiles[index], (column * ONE_TILE, 0), special_flags=flags)
+
+        self.strips[row] = strip
+        if len(self.strips) > STRIP_CACHE:
+            _, old_strip = self.strips.popitem(last=False)
+            if autoload.Backend is not None:
+                autoload.Backend.forget(old_strip)
+        return strip
+
+    ###########
+    # GETTERS #
+    ###########
+    def nbytes(self):
+        """
+        Bytes of the tiles + indices (what a flat image would be: width * rows * ONE_TILE * 4).
+        """
+        return sum(tile.get_width() * tile.get_height() * tile.get_bytesize() for tile in self.tiles) + len(self.indices) * 2
+
+
+def tilemap_from_surface(name: str, surface):
+    """
+    Cut surface into ONE_TILE tiles, equal ones stored once. Size must be whole tiles.
+    """
+    width, height = surface.get_size()
+    if width % ONE_TILE or height % ONE_TILE:
+        raise ValueError(f"{name} is {width}x{height}, not whole {ONE_TILE} px tiles")
+    tiles = []
+    tile_ids = {}  # key = tile pixels | val = index
+    indices = []
+    for y in range(0, height, ONE_TILE):
+        for x in range(0, width, ONE_TILE):
+            tile = surface.subsurface((x, y, ONE_TILE, ONE_TILE)).copy()
+            pixels = pg.image.tobytes(tile, "RGBA")
+            index = tile_ids.get(pixels)
+            if index is None:
+                index = tile_ids[pixels] = len(tiles)
+                tiles.append(tile)
+            indices.append(index)
+    return TileMap(name, tiles, width // ONE_TILE, indices)
+
+
+def get_tilemap(name: str):
+    """
+    Map of the surface name (SURFACES_DICT), cut on first call.
+    """
+    tilemap = TILEMAPS.get(name)
+    if tilemap is None:
+        with autoload.timed_phase(f"tilemap {name}"):
+            tilemap = tilemap_from_surface(name, autoload.SURFACES_DICT[name])
+        TILEMAPS[name] = tilemap
+    return tilemap
+
+
+#########
+# LAYER #
+#########
+class TileLayer:
+    """
+    1 parallax layer. Segments = [origin row, TileMap], oldest first: the first one covers every row from the second
+    origin down, the others the rows above their origin (their bottom row right above it).
+    """
+    # snapshot: segment count, then (map name, origin row) per segment, names are the same in every process
+    STATE = struct.Struct("<B" + f"{NAME_SIZE}si" * MAX_SEGMENTS)
+
+    def __init__(self, name: str, factor: float = 1.0):
+        ##############
+        # PROPERTIES #
+        ##############
+        self.factor = factor  # layer px per scroll px
+        self.segments = [[0, get_tilemap(name)]]
+        self.drawn_rows = 0  # stats, last frame
+
+    ###########
+    # METHODS #
+    ###########
+    def offset(self, scroll: int):
+        """
+        Layer px scrolled at scroll.
+        """
+        return int(scroll * self.factor)
+
+    def last_row(self, scroll: int):
+        """
+        Bottom row crossing the viewport at scroll.
+        """
+        return (VIEW_HEIGHT - 1 - self.offset(scroll)) // ONE_TILE
+
+    def advance(self, scroll: int):
+        """
+        Drop the maps scrolled out below the screen for good at scroll. Called every tick, drawn or not.
+        """
+        last_row = self.last_row(scroll)
+        while len(self.segments) > 1 and last_row < self.segments[1][0]:
+            self.segments.pop(0)
+
+    def switch(self, name: str, scroll: int):
+        """
+        From scroll on, rows entering from the top are name. Same map as the last switch = nothing.
+        """
+        if len(name.encode()) > NAME_SIZE:
+            raise ValueError(f"tilemap name {name} is longer than {NAME_SIZE} bytes")
+        tilemap = get_tilemap(name)
+        if self.segments[-1][1] is tilemap:
+            return
+        origin = -self.offset(scroll) // ONE_TILE  # first row fully above the top edge, down from here it is old
+        if len(self.segments) == MAX_SEGMENTS:
+            self.segments.pop()  # switches faster than a screen, the latest one wins
+        self.segments.append([origin, tilemap])
+
+    def row_strip(self, row: int):
+        """
+        Strip shown at row.
+        """
+        for origin, tilemap in reversed(self.segments[1:]):
+            if row < origin:
+                return tilemap.strip((row - origin) % tilemap.rows)
+        origin, tilemap = self.segments[0]
+        return tilemap.strip((row - origin) % tilemap.rows)
+
+    def draw(self, scroll: int):
+        """
+        Blit the strips crossing the viewport.
+        """
+        offset = self.offset(scroll)
+        first_row = -offset // ONE_TILE
+        last_row = self.last_row(scroll)
+
+        camera_x = autoload.Cam.global_position.x * self.factor
+        for row in range(first_row, last_row + 1):
+            strip = self.row_strip(row)
+            autoload.Backend.blit(strip, pg.Rect(-camera_x, row * ONE_TILE + offset, strip.get_width(), ONE_TILE), strip.get_rect())
+        self.drawn_rows = last_row - first_row + 1
+
+    def save_state(self, buffer, offset: int):
+        values = []
+        for origin, tilemap in self.segments:
+            values += [tilemap.name.encode(), origin]
+        values += [b"", 0] * (MAX_SEGMENTS - len(self.segments))
+        self.STATE.pack_into(buffer, offset, len(self.segments), *values)
+        return offset + self.STATE.size
+
+    def load_state(self, buffer, offset: int):
+        count, *values = self.STATE.unpack_from(buffer, offset)
+        self.segments = [
+            [values[index * 2 + 1], get_tilemap(values[index * 2].rstrip(b"\0").decode())] for index in range(count)
+        ]
+        return offset + self.STATE.size